@@ -26,6 +26,15 @@ name: sonic
 short_description: HttpApi Plugin for devices supporting Restconf SONIC API
 description:
   - This HttpApi plugin provides methods to connect to Restconf SONIC API endpoints.
+  - The C(bulk_*) options fetch the facts of some resources with a single
+    GET request instead of one request per VRF, port, interface or subtree.
+    They are disabled by default. If the device rejects a bulk request, the
+    facts are requested separately.
+  - Most bulk requests select only the needed subtrees with the RESTCONF
+    C(fields) query parameter. Its support varies between SONiC releases,
+    and a release which ignores it returns the whole tree in full, so these
+    options should only be enabled after they are checked on the release of
+    the device.
 version_added: 1.0.0
 options:
   root_path:
@@ -35,35 +44,772 @@ options:
     default: '/restconf'
     vars:
       - name: ansible_httpapi_restconf_root
+  session_pool_size:
+    type: int
+    description:
+      - Specifies the number of persistent keep-alive HTTP(S) sessions to keep
+        open to the device and reuse for subsequent requests.
+      - The sessions live in the persistent connection process, so they are
+        shared by all tasks that run over the same connection.
+      - When set to 0, a new connection is opened for every request.
+      - The sessions are not used when the device is reached through a
+        proxy, see the I(use_proxy) option of the httpapi connection.
+    default: 0
+    vars:
+      - name: ansible_httpapi_sonic_session_pool_size
+    version_added: 3.1.0
+  session_idle_timeout:
+    type: int
+    description:
+      - Specifies the number of seconds an unused keep-alive session is kept
+        in the session pool before it is closed.
+    default: 60
+    vars:
+      - name: ansible_httpapi_sonic_session_idle_timeout
+    version_added: 3.1.0
+  get_workers:
+    type: int
+    description:
+      - Specifies the maximum number of consecutive GET requests, within a
+        single list of requests, that are sent to the device concurrently.
+      - Non-GET requests are always sent one at a time in the given order.
+      - Concurrent requests should be combined with I(session_pool_size) so
+        that each worker can reuse its own keep-alive session.
+      - The default of 1 sends the requests one at a time, as in previous
+        releases. Concurrent requests add load on the REST server of the
+        device, which also serves other clients, so the number of workers
+        it can take should be chosen for each platform.
+    default: 1
+    vars:
+      - name: ansible_httpapi_sonic_get_workers
+    version_added: 3.1.0
+  get_cache_ttl:
+    type: int
+    description:
+      - Specifies the number of seconds a GET response is cached in the
+        persistent connection process and returned for subsequent GET
+        requests of the same path, also by other tasks and modules.
+      - A PATCH, PUT, POST or DELETE request invalidates all cached responses
+        whose path shares a prefix with the path of the request. A request
+        outside of the RESTCONF data tree (e.g. an RPC) invalidates all cached
+        responses.
+      - When set to 0, GET responses are not cached.
+    default: 0
+    vars:
+      - name: ansible_httpapi_sonic_get_cache_ttl
+    version_added: 3.1.0
+  metadata_cache:
+    type: bool
+    description:
+      - Specifies whether the device metadata requested by the resource
+        modules (e.g. the list of VRFs or the interface naming mode) is
+        cached in the persistent connection process for the lifetime of the
+        connection.
+      - A cached response is invalidated by a PATCH, PUT, POST or DELETE
+        request to the configuration it depends on. Changes made outside of
+        the connection (e.g. with the CLI, the M(dellemc.enterprise_sonic.sonic_config)
+        or M(dellemc.enterprise_sonic.sonic_command) modules, or another
+        connection) are not detected, so the cache is disabled by default. It
+        should only be enabled when the VRFs and the interface naming mode
+        are changed through the resource modules of this connection.
+    default: false
+    vars:
+      - name: ansible_httpapi_sonic_metadata_cache
+    version_added: 3.1.0
+  coalesce_requests:
+    type: bool
+    description:
+      - Specifies whether the requests generated by a resource module are
+        optimized before they are sent to the device.
+      - Consecutive PATCH requests which target the same YANG list or
+        container, or a descendant of it, are merged into a single request,
+        and DELETE requests which are shadowed by a later DELETE request of
+        a parent path are dropped.
+    default: false
+    vars:
+      - name: ansible_httpapi_sonic_coalesce_requests
+    version_added: 3.1.0
+  commit_mode:
+    type: str
+    description:
+      - Specifies how the configuration requests of a module run are committed
+        on the device.
+      - When set to C(request), each request is sent to the device as an
+        independent REST request.
+      - When set to C(yang_patch), consecutive PATCH, PUT and DELETE requests
+        of the RESTCONF data tree are sent as a single YANG-Patch (RFC 8072)
+        request, which the device applies as one transaction. An error of an
+        edit is reported with the request from which the edit was created.
+    choices: ['request', 'yang_patch']
+    default: request
+    vars:
+      - name: ansible_httpapi_sonic_commit_mode
+    version_added: 3.1.0
+  reboot_timeout:
+    type: int
+    description:
+      - Specifies the maximum number of seconds to wait for the device to
+        become ready again after a request which causes the device to reboot.
+      - Readiness is probed with a lightweight RESTCONF GET request, retried
+        with an exponential backoff.
+    default: 600
+    vars:
+      - name: ansible_httpapi_sonic_reboot_timeout
+    version_added: 3.1.0
+  reboot_settle_time:
+    type: int
+    description:
+      - Specifies the minimum number of seconds to wait after a request which
+        causes the device to reboot, before the device is probed for
+        readiness. This prevents the device from being reported ready before
+        it has started to reboot.
+    default: 60
+    vars:
+      - name: ansible_httpapi_sonic_reboot_settle_time
+    version_added: 3.1.0
+  timings:
+    type: bool
+    description:
+      - Specifies whether the resource modules return the timings of their
+        run under the C(timings) key of the module result.
+      - The timings include the time spent in each phase of the module run
+        and, for each request sent to the device, the method, path, status,
+        latency, response decode time, request bytes and response bytes.
+    default: false
+    vars:
+      - name: ansible_httpapi_sonic_timings
+    version_added: 3.1.0
+  timings_file:
+    type: path
+    description:
+      - Specifies a file to which the timings of each module run are
+        appended as a JSON line, when I(timings) is enabled.
+    vars:
+      - name: ansible_httpapi_sonic_timings_file
+    version_added: 3.1.0
+  json_codec:
+    type: str
+    description:
+      - Specifies the JSON library used to encode the request payloads and
+        decode the response bodies.
+      - When set to C(auto), C(orjson) or C(ujson) is used if it is installed
+        on the controller, and the Python C(json) module otherwise.
+    choices: ['auto', 'orjson', 'ujson', 'json']
+    default: auto
+    vars:
+      - name: ansible_httpapi_sonic_json_codec
+    version_added: 3.1.0
+  stream_page_size:
+    type: int
+    description:
+      - Specifies the number of list entries which are returned at a time
+        to the facts collectors that support streaming of large GET responses
+        (e.g. the interfaces and l3_acls facts).
+      - The entries are decoded incrementally when the C(ijson) library is
+        installed on the controller, so that the whole response is never
+        held in memory as decoded objects.
+      - When set to 0, the whole response is returned at once.
+    default: 0
+    vars:
+      - name: ansible_httpapi_sonic_stream_page_size
+    version_added: 3.1.0
+  facts_workers:
+    type: int
+    description:
+      - Specifies the number of network resource facts classes which gather
+        their facts concurrently when a module gathers the facts of several
+        network resources (e.g. C(sonic_facts) with
+        C(gather_network_resources=all)).
+      - The GET requests of the concurrently running facts classes are sent
+        to the device as a single list of requests, which should be combined
+        with I(get_workers) so that they are sent concurrently.
+    default: 1
+    vars:
+      - name: ansible_httpapi_sonic_facts_workers
+    version_added: 3.1.0
+  facts_validation:
+    type: str
+    description:
+      - Specifies how the facts rendered from the device configuration are
+        validated against the argument spec of their module.
+      - C(trusted) applies only the type conversions and the default values
+        of the options, with validators compiled once per argument spec.
+        Data which these validators can not handle is validated like with
+        C(full).
+      - C(full) validates the facts with the generic argument spec validator
+        of Ansible, which also checks the relations between the options.
+    choices: ['trusted', 'full']
+    default: trusted
+    vars:
+      - name: ansible_httpapi_sonic_facts_validation
+    version_added: 3.1.0
+  bulk_network_instances:
+    type: bool
+    description:
+      - Specifies whether the facts of the VRF-scoped resources (e.g. BGP,
+        OSPFv2, static routes or MAC) are fetched for all the VRFs with a
+        single GET request of the network instances, which selects only the
+        needed subtrees with the RESTCONF C(fields) query parameter.
+      - The subtrees whose list keys are not returned in the response are
+        requested for their VRF.
+    default: false
+    vars:
+      - name: ansible_httpapi_sonic_bulk_network_instances
+    version_added: 3.1.0
+  bulk_port_breakout:
+    type: bool
+    description:
+      - Specifies whether the breakout modes of the ports are fetched with a
+        single GET request of the platform components, which selects only the
+        breakout mode of the ports with the RESTCONF C(fields) query parameter.
+      - If the response does not return the names of the components, the
+        component of each port is requested.
+    default: false
+    vars:
+      - name: ansible_httpapi_sonic_bulk_port_breakout
+    version_added: 3.1.0
+  bulk_vlan_mapping:
+    type: bool
+    description:
+      - Specifies whether the VLAN mappings of all the interfaces are fetched
+        with a single GET request of the interfaces, which selects only the
+        mapped VLANs with the RESTCONF C(fields) query parameter.
+      - If the response does not return the names of the interfaces, the
+        mapped VLANs of each interface are requested.
+    default: false
+    vars:
+      - name: ansible_httpapi_sonic_bulk_vlan_mapping
+    version_added: 3.1.0
+  bulk_qos:
+    type: bool
+    description:
+      - Specifies whether the facts of the QoS resources are taken from the
+        configuration of the whole openconfig-qos tree, which is requested
+        once for each facts gathering instead of once for each QoS subtree.
+      - Combined with I(get_cache_ttl), the configuration is requested once
+        for consecutive runs of the QoS modules.
+      - The whole QoS configuration is usually larger than the subtrees of a
+        single QoS module. The option pays off when several QoS modules are
+        run, or their facts are gathered together.
+    default: false
+    vars:
+      - name: ansible_httpapi_sonic_bulk_qos
+    version_added: 3.1.0
+  structured_diff:
+    type: list
+    elements: str
+    description:
+      - Specifies the resource modules (e.g. C(vlans) or C(sonic_l3_acls))
+        whose configuration changes are reported in diff mode as one line
+        per added, removed or changed configuration path, instead of a
+        context diff of the whole configurations serialized as JSON.
+      - The configurations are walked once and the list items are matched by
+        their keys, so the order of the list items is ignored.
+      - With a verbosity of 3 or more, the changes are also returned as a
+        list under the C(changes) key of the diff.
+      - C(all) selects all the resource modules.
+    default: []
+    vars:
+      - name: ansible_httpapi_sonic_structured_diff
+    version_added: 3.1.0
 """
 
+import base64
 import json
+import ssl
+import threading
 import time
 import re
 
-from ansible.module_utils._text import to_text
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatchcase
+from io import BytesIO
+from itertools import groupby, islice
+
+from ansible.module_utils._text import to_bytes, to_native, to_text
 from ansible.module_utils.connection import ConnectionError
+from ansible.module_utils.six.moves import http_client
 from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible.module_utils.six.moves.urllib.parse import quote, urlparse
+from ansible.module_utils.six.moves.urllib.request import getproxies, proxy_bypass
 from ansible.plugins.httpapi import HttpApiBase
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import to_list
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import ujson
+    HAS_UJSON = True
+except ImportError:
+    HAS_UJSON = False
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
 CONTENT_TYPE = 'application/yang-data+json'
+YANG_PATCH_CONTENT_TYPE = 'application/yang-patch+json'
+
+# YANG-Patch edit operations of the request methods which can be sent as a
+# YANG-Patch edit
+YANG_PATCH_OPERATIONS = {
+    'patch': 'merge',
+    'put': 'replace',
+    'delete': 'delete',
+}
+
+# Lightweight RESTCONF resource which is polled to detect that the device is
+# ready again after a reboot
+READINESS_PATH = 'data/sonic-device-metadata:sonic-device-metadata/DEVICE_METADATA/DEVICE_METADATA_LIST=localhost'
+# Initial and maximum interval in seconds between two readiness probes
+READINESS_PROBE_INTERVAL = 2
+READINESS_PROBE_MAX_INTERVAL = 30
+
+# Maximum number of streamed responses kept open in the connection process.
+# The oldest stream is dropped when a new one is opened.
+MAX_OPEN_STREAMS = 16
+
+# Errors raised by a keep-alive session which has been closed by the device
+# while sitting idle in the session pool. Except for CannotSendRequest, they
+# may be raised after the request has reached the device.
+STALE_SESSION_ERRORS = (http_client.BadStatusLine, http_client.CannotSendRequest,
+                        ConnectionResetError, BrokenPipeError)
+
+
+class JsonCodec(object):
+    """JSON encoder and decoder of the REST API payloads, using the Python
+    json module
+    """
+    name = 'json'
+
+    def dumps(self, data):
+        return json.dumps(data)
+
+    def loads(self, data):
+        # The body is decoded straight from bytes, the encoding is detected
+        # by the decoder.
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec using the orjson library"""
+    name = 'orjson'
+
+    def dumps(self, data):
+        try:
+            return orjson.dumps(data)
+        except TypeError:
+            # e.g. non-string keys or integers out of the 64 bit range
+            return super(OrjsonCodec, self).dumps(data)
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+
+class UjsonCodec(JsonCodec):
+    """JSON codec using the ujson library"""
+    name = 'ujson'
+
+    def dumps(self, data):
+        try:
+            return ujson.dumps(data, escape_forward_slashes=False)
+        except (TypeError, OverflowError):
+            return super(UjsonCodec, self).dumps(data)
+
+    def loads(self, data):
+        return ujson.loads(data)
+
+
+def get_json_codec(name='auto'):
+    """Return the JSON codec of the given name. With 'auto', the fastest
+    installed codec is returned.
+    """
+    if name in ('auto', 'orjson') and HAS_ORJSON:
+        return OrjsonCodec()
+    if name in ('auto', 'ujson') and HAS_UJSON:
+        return UjsonCodec()
+    if name not in ('auto', 'json'):
+        raise ConnectionError('The %s library, selected with the json_codec option, is not installed' % name)
+    return JsonCodec()
+
+
+class SessionPool(object):
+    """Pool of persistent keep-alive HTTP(S) sessions to a single device
+    """
+
+    def __init__(self, url, size, idle_timeout, timeout=None, ssl_context=None):
+        parsed_url = urlparse(url)
+        self.scheme = parsed_url.scheme
+        self.host = parsed_url.hostname
+        self.port = parsed_url.port
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.ssl_context = ssl_context
+        self._idle_sessions = []
+        self._lock = threading.Lock()
+
+    def _new_session(self):
+        if self.scheme == 'https':
+            return http_client.HTTPSConnection(self.host, self.port, timeout=self.timeout, context=self.ssl_context)
+        return http_client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def acquire(self):
+        """Return an idle session from the pool or open a new one"""
+        now = time.time()
+        with self._lock:
+            while self._idle_sessions:
+                session, last_used = self._idle_sessions.pop()
+                if now - last_used <= self.idle_timeout:
+                    return session, True
+                session.close()
+        return self._new_session(), False
+
+    def release(self, session):
+        """Return a session to the pool, closing it if the pool is full"""
+        with self._lock:
+            if len(self._idle_sessions) < self.size:
+                self._idle_sessions.append((session, time.time()))
+                return
+        session.close()
+
+    def evict_idle(self):
+        """Close all sessions which have been idle longer than the idle timeout"""
+        now = time.time()
+        with self._lock:
+            active_sessions = []
+            for session, last_used in self._idle_sessions:
+                if now - last_used > self.idle_timeout:
+                    session.close()
+                else:
+                    active_sessions.append((session, last_used))
+            self._idle_sessions = active_sessions
+
+    def close(self):
+        with self._lock:
+            for session, last_used in self._idle_sessions:
+                session.close()
+            self._idle_sessions = []
+
+    def send(self, path, data, headers, method):
+        """Send a request over a pooled session and return the response
+        and its body, in the same form as the httpapi connection send()
+        """
+        method = (method or 'GET').upper()
+        self.evict_idle()
+        session, reused = self.acquire()
+        try:
+            try:
+                response, response_data = self._send(session, path, data, headers, method)
+            except STALE_SESSION_ERRORS as exc:
+                # Only a request which is known not to have been applied is
+                # retried: a GET, or any request the session could not send.
+                if not reused or not (method == 'GET' or isinstance(exc, http_client.CannotSendRequest)):
+                    raise
+                # The device closed the idle session, retry once on a new one.
+                session.close()
+                session = self._new_session()
+                response, response_data = self._send(session, path, data, headers, method)
+        except Exception:
+            session.close()
+            raise
+
+        if response.will_close:
+            session.close()
+        else:
+            self.release(session)
+
+        if response.status >= 400:
+            url = '%s://%s:%s%s' % (self.scheme, self.host, self.port, path)
+            response = HTTPError(url, response.status, response.reason, response.msg, BytesIO(response_data))
+        return response, BytesIO(response_data)
+
+    @staticmethod
+    def _send(session, path, data, headers, method):
+        session.request(method, path, body=data, headers=headers)
+        response = session.getresponse()
+        # The whole body must be read before the session can be reused.
+        response_data = response.read()
+        return response, response_data
+
+
+class ResponseCache(object):
+    """Cache of GET responses keyed by normalized request path
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize_path(path):
+        """Return the cache key and the path segments of a request path"""
+        path, sep, query = path.partition('?')
+        segments = tuple(segment for segment in path.replace('%2F', '%2f').split('/') if segment)
+        key = '/'.join(segments)
+        if query:
+            key = '%s?%s' % (key, query)
+        return key, segments
+
+    def get(self, path, ttl):
+        """Return the cached response of a path, or None if it is not
+        cached or has expired
+        """
+        key, segments = self.normalize_path(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if ttl is not None and time.time() - entry[0] > ttl:
+                del self._entries[key]
+                return None
+            return entry[2]
+
+    def set(self, path, response):
+        key, segments = self.normalize_path(path)
+        with self._lock:
+            self._entries[key] = (time.time(), segments, response)
+
+    def invalidate(self, path, data_root=None):
+        """Remove the cached responses whose path shares a prefix with
+        the given path. All cached responses are removed if the path is not
+        under the data root.
+        """
+        key, segments = self.normalize_path(path)
+        with self._lock:
+            if data_root and segments[:len(data_root)] != data_root:
+                self._entries.clear()
+                return
+            for cached_key, entry in list(self._entries.items()):
+                common_len = min(len(segments), len(entry[1]))
+                if segments[:common_len] == entry[1][:common_len]:
+                    del self._entries[cached_key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class MetadataCache(ResponseCache):
+    """Cache of the GET responses of device metadata requests. A response
+    is kept until a write request to one of its invalidation paths, or to a
+    parent of them. The segments of an invalidation path are shell-style
+    wildcards, e.g. 'VRF_LIST=*'.
+    """
+
+    def get(self, path, ttl=None):
+        return super(MetadataCache, self).get(path, ttl)
+
+    def set(self, path, response, invalidation_paths=()):
+        key, segments = self.normalize_path(path)
+        patterns = tuple(self.normalize_path(invalidation_path)[1] for invalidation_path in invalidation_paths)
+        with self._lock:
+            self._entries[key] = (time.time(), patterns, response)
+
+    def invalidate(self, path, data_root=None):
+        key, segments = self.normalize_path(path)
+        with self._lock:
+            if data_root and segments[:len(data_root)] != data_root:
+                self._entries.clear()
+                return
+            for cached_key, entry in list(self._entries.items()):
+                if any(is_parent_path(segments, pattern) for pattern in entry[1]):
+                    del self._entries[cached_key]
 
 
 class HttpApi(HttpApiBase):
+    def __init__(self, connection):
+        super(HttpApi, self).__init__(connection)
+        self._session_pool = None
+        self._response_cache = ResponseCache()
+        self._metadata_cache = MetadataCache()
+        self._patch_count = 0
+        self._request_timings = []
+        self._json_codec = None
+        self._streams = {}
+        self._stream_count = 0
+
+    def get_session_pool(self):
+        """Return the keep-alive session pool, or None if it is disabled or
+        the device must be reached through a proxy
+        """
+        pool_size = self.get_option('session_pool_size')
+        if not pool_size or pool_size <= 0:
+            return None
+        if self.connection.get_option('use_proxy') and self.get_proxy() is not None:
+            return None
+
+        if self._session_pool is None:
+            ssl_context = None
+            if self.connection.get_option('use_ssl'):
+                ssl_context = ssl.create_default_context(cafile=self.connection.get_option('ca_path'))
+                if not self.connection.get_option('validate_certs'):
+                    ssl_context.check_hostname = False
+                    ssl_context.verify_mode = ssl.CERT_NONE
+                client_cert = self.connection.get_option('client_cert')
+                if client_cert:
+                    ssl_context.load_cert_chain(client_cert, self.connection.get_option('client_key'))
+                ciphers = self.get_ciphers()
+                if ciphers:
+                    ssl_context.set_ciphers(':'.join(ciphers))
+            self._session_pool = SessionPool(self.connection._url, pool_size,
+                                             self.get_option('session_idle_timeout'),
+                                             timeout=self.connection.get_option('persistent_command_timeout'),
+                                             ssl_context=ssl_context)
+        self._session_pool.size = pool_size
+        self._session_pool.idle_timeout = self.get_option('session_idle_timeout')
+        return self._session_pool
+
+    def get_proxy(self):
+        """Return the proxy the device URL is reached through, or None"""
+        parsed_url = urlparse(self.connection._url)
+        if proxy_bypass(parsed_url.hostname):
+            return None
+        return getproxies().get(parsed_url.scheme)
+
+    def get_ciphers(self):
+        try:
+            return self.connection.get_option('ciphers')
+        except KeyError:
+            # The option is not defined by older ansible.netcommon releases.
+            return None
+
+    def send(self, path, data, headers, method):
+        """Send a request to the device, reusing a keep-alive session
+        when the session pool is enabled. A pooled request is sent, logged
+        and authenticated like a request of the httpapi connection, and its
+        HTTP errors are handled by handle_httperror().
+        """
+        session_pool = self.get_session_pool()
+        if session_pool is None:
+            return self.connection.send(path, data, headers=headers, method=method)
+
+        request_headers = dict(headers)
+        http_agent = self.connection.get_option('http_agent')
+        if http_agent:
+            request_headers['User-Agent'] = http_agent
+        if self.connection._auth:
+            request_headers.update(self.connection._auth)
+        else:
+            # Same as the forced basic authentication of open_url()
+            credentials = '%s:%s' % (self.connection.get_option('remote_user'), self.connection.get_option('password'))
+            request_headers['Authorization'] = 'Basic %s' % to_native(base64.b64encode(to_bytes(credentials)))
+
+        url = self.connection._url + path
+        self.connection._log_messages("send url '%s' with data '%s' over a pooled session" % (url, data))
+        try:
+            response, response_buffer = session_pool.send(path, to_bytes(data) if data else None, request_headers, method)
+        except (http_client.HTTPException, OSError) as exc:
+            raise ConnectionError('Could not connect to %s: %s' % (url, to_text(exc)))
+        self.connection._log_messages("received response: '%s'" % response_buffer.getvalue())
+
+        if isinstance(response, HTTPError):
+            is_handled = self.handle_httperror(response)
+            if is_handled is True:
+                return self.send(path, data, headers, method)
+            if is_handled is False:
+                raise response
+            return is_handled, response_buffer
+
+        self.connection._auth = self.update_auth(response, response_buffer) or self.connection._auth
+        return response, response_buffer
+
+    def get_json_codec(self):
+        name = self.get_option('json_codec') or 'auto'
+        if self._json_codec is None or (name != 'auto' and self._json_codec.name != name):
+            self._json_codec = get_json_codec(name)
+        return self._json_codec
+
+    def logout(self):
+        self._streams.clear()
+        self._response_cache.clear()
+        self._metadata_cache.clear()
+        if self._session_pool is not None:
+            self._session_pool.close()
+            self._session_pool = None
+
+    def get_request_path(self, message_kwargs):
+        """Return the URL path of a request, including the query string"""
+        path = '/'.join([self.get_option('root_path').rstrip('/'), message_kwargs.get('path', '').lstrip('/')])
+        query = get_query_string(message_kwargs)
+        if query:
+            path = '%s%s%s' % (path, '&' if '?' in path else '?', query)
+        return path
+
     def send_request(self, data, **message_kwargs):
+        json_codec = self.get_json_codec()
         if data:
-            data = json.dumps(data)
+            data = json_codec.dumps(data)
 
-        path = '/'.join([self.get_option('root_path').rstrip('/'), message_kwargs.get('path', '').lstrip('/')])
+        path = self.get_request_path(message_kwargs)
+        method = (message_kwargs.get('method') or '').lower()
+        timing = None
+        if self.get_option('timings'):
+            timing = {'method': method, 'path': path, 'status': None, 'latency': 0.0, 'decode': 0.0,
+                      'request_bytes': len(to_bytes(data)) if data else 0, 'response_bytes': 0}
+            self._request_timings.append(timing)
+
+        cache_ttl = self.get_option('get_cache_ttl')
+        # The 'cache' of a metadata request is True or the list of the paths
+        # of the configuration its response depends on, besides its own path.
+        invalidation_paths = None
+        cache = message_kwargs.get('cache')
+        if method == 'get' and cache and self.get_option('metadata_cache'):
+            cache_paths = cache if isinstance(cache, list) else []
+            invalidation_paths = [self.get_request_path({'path': cache_path}) for cache_path in cache_paths]
+            invalidation_paths.append(path.partition('?')[0])
+        response = None
+        if invalidation_paths:
+            response = self._metadata_cache.get(path)
+        elif cache_ttl and method == 'get':
+            response = self._response_cache.get(path, cache_ttl)
+        if response is not None:
+            if timing:
+                timing.update({'status': response[0], 'cached': True})
+            return response
 
         headers = {
             'Content-Type': message_kwargs.get('content_type') or CONTENT_TYPE,
             'Accept': message_kwargs.get('accept') or CONTENT_TYPE,
         }
-        response, response_data = self.connection.send(path, data, headers=headers, method=message_kwargs.get('method'))
+        try:
+            start = time.time()
+            response, response_data = self.send(path, data, headers, method)
+            if timing:
+                decode_start = time.time()
+                timing.update({'status': response.getcode(), 'latency': round(decode_start - start, 4),
+                               'response_bytes': len(response_data.getvalue())})
+            try:
+                response = handle_response(response, response_data, message_kwargs, json_codec)
+            finally:
+                if timing:
+                    timing['decode'] = round(time.time() - decode_start, 4)
+        finally:
+            if method != 'get':
+                # Invalidate even if the request failed, it may have been
+                # partially applied.
+                data_root = self._response_cache.normalize_path(self.get_option('root_path'))[1] + ('data',)
+                self._response_cache.invalidate(path, data_root)
+                self._metadata_cache.invalidate(path, data_root)
 
-        return handle_response(response, response_data, message_kwargs)
+        if invalidation_paths:
+            self._metadata_cache.set(path, response, invalidation_paths)
+        elif cache_ttl and method == 'get':
+            self._response_cache.set(path, response)
+        return response
+
+    def get_request_timings(self):
+        """Return the timings of the requests sent since the last call and
+        clear them
+        """
+        request_timings, self._request_timings = self._request_timings, []
+        return request_timings
 
     def get(self, command):
         return self.send_request(path=command, data=None, method='get')
@@ -74,25 +820,110 @@ class HttpApi(HttpApiBase):
         if requests is None:
             raise ValueError("'requests' value is required")
 
+        get_workers = self.get_option('get_workers') or 1
+        yang_patch = self.get_option('commit_mode') == 'yang_patch'
         responses = list()
-        for req in to_list(requests):
+        for dispatch, reqs in groupby(to_list(requests), lambda req: get_dispatch(req, yang_patch)):
+            reqs = list(reqs)
+            if dispatch == 'get' and get_workers > 1 and len(reqs) > 1:
+                # Independent GET requests are dispatched concurrently, the
+                # responses are returned in the order of the requests.
+                with ThreadPoolExecutor(max_workers=min(get_workers, len(reqs))) as executor:
+                    responses.extend(executor.map(lambda req: self.send_edit_request(req, suppr_ntf_excp), reqs))
+            elif dispatch == 'yang_patch' and len(reqs) > 1:
+                responses.extend(self.send_yang_patch(reqs))
+            else:
+                for req in reqs:
+                    responses.append(self.send_edit_request(req, suppr_ntf_excp))
+        return responses
+
+    def send_yang_patch(self, reqs):
+        """Send a list of requests as the edits of a single YANG-Patch
+        request and return a response for each of the requests
+        """
+        self._patch_count += 1
+        edits = []
+        for index, req in enumerate(reqs):
+            edit = {
+                'edit-id': str(index + 1),
+                'operation': YANG_PATCH_OPERATIONS[req['method'].lower()],
+                'target': '/' + req['path'].lstrip('/').split('/', 1)[1]
+            }
+            if req.get('data') is not None:
+                edit['value'] = req['data']
+            edits.append(edit)
+        patch = {
+            'ietf-yang-patch:yang-patch': {
+                'patch-id': 'ansible-edit-config-%d' % self._patch_count,
+                'edit': edits
+            }
+        }
+
+        try:
+            code, response = self.send_request(data=patch, path='data', method='patch',
+                                               content_type=YANG_PATCH_CONTENT_TYPE)
+        except ConnectionError as exc:
+            raise get_yang_patch_error(exc, reqs)
+        return [(code, {}) for req in reqs]
+
+    def send_edit_request(self, req, suppr_ntf_excp=True):
+        """Send a single request of an edit_config request list"""
+        try:
+            response = self.send_request(**req)
+        except ConnectionError as exc:
+            if suppr_ntf_excp and (req.get('method') or '').lower() == 'get' and is_not_found_error(exc):
+                # 'code': 404, 'error-message': 'Resource not found'
+                response = [{}, {}]
+            else:
+                raise ConnectionError(to_text(exc, errors='surrogate_then_replace'))
+        return response
+
+    def open_stream(self, request, page_size, suppr_ntf_excp=True):
+        """Send a GET request and return the status code of the response
+        and a handle to read the entries of the list at the 'stream' path of
+        the response with read_stream(), or None if the list is empty
+        """
+        json_codec = self.get_json_codec()
+        headers = {'Content-Type': CONTENT_TYPE, 'Accept': CONTENT_TYPE}
+        response, response_data = self.send(self.get_request_path(request), None, headers, 'get')
+        if isinstance(response, HTTPError):
             try:
-                response = self.send_request(**req)
+                handle_response(response, response_data, request, json_codec)
             except ConnectionError as exc:
-                if suppr_ntf_excp and req.get('method') == 'get' and re.search("[nN]ot [fF]ound.*code': 404", str(exc)):
-                    # 'code': 404, 'error-message': 'Resource not found'
-                    response = [{}, {}]
-                else:
-                    raise ConnectionError(to_text(exc, errors='surrogate_then_replace'))
-            responses.append(response)
-        return responses
+                if suppr_ntf_excp and is_not_found_error(exc):
+                    return {}, None
+                raise ConnectionError(to_text(exc, errors='surrogate_then_replace'))
+
+        if len(self._streams) >= MAX_OPEN_STREAMS:
+            del self._streams[min(self._streams)]
+        self._stream_count += 1
+        self._streams[self._stream_count] = (iter_list_entries(response_data, request['stream'], json_codec),
+                                             max(page_size, 1))
+        return response.getcode(), self._stream_count
+
+    def read_stream(self, handle):
+        """Return the next page of list entries of a stream opened with
+        open_stream(). The stream is closed once a page is shorter than the
+        page size.
+        """
+        if handle not in self._streams:
+            raise ConnectionError('Stream %s is not open' % handle)
+        entries, page_size = self._streams[handle]
+        page = list(islice(entries, page_size))
+        if len(page) < page_size:
+            del self._streams[handle]
+        return page
 
     def edit_config_reboot(self, requests):
-        """Send a list of http requests to remote device and allow time for reboot
+        """Send a list of http requests to remote device and wait for the
+        device to become ready again when a request causes it to reboot.
+        Return the measured downtime in seconds, or None if the device did
+        not reboot.
         """
         if requests is None:
             raise ValueError("'requests' value is required")
 
+        downtime = None
         for req in to_list(requests):
             try:
                 response = self.send_request(**req)
@@ -100,23 +931,166 @@ class HttpApi(HttpApiBase):
                 if 'command timeout triggered' not in str(exc):
                     raise Exception(to_text(exc, errors='surrogate_then_replace'))
                 else:
-                    time.sleep(300)
+                    downtime = (downtime or 0) + self.wait_for_ready()
+        return downtime
+
+    def wait_for_ready(self):
+        """Wait until the device answers a readiness probe after a reboot and
+        return the number of seconds waited
+        """
+        start = time.time()
+        deadline = start + self.get_option('reboot_timeout')
+        # The sessions to the device and the cached responses do not
+        # survive the reboot.
+        self._response_cache.clear()
+        self._metadata_cache.clear()
+        if self._session_pool is not None:
+            self._session_pool.close()
+
+        time.sleep(max(self.get_option('reboot_settle_time'), 0))
+        path = '/'.join([self.get_option('root_path').rstrip('/'), READINESS_PATH])
+        headers = {'Content-Type': CONTENT_TYPE, 'Accept': CONTENT_TYPE}
+        interval = READINESS_PROBE_INTERVAL
+        while True:
+            try:
+                response, response_data = self.send(path, None, headers, 'get')
+                handle_response(response, response_data, {'path': READINESS_PATH, 'method': 'get'}, self.get_json_codec())
+                return round(time.time() - start, 1)
+            except Exception as exc:
+                error = to_text(exc, errors='surrogate_then_replace')
+
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise ConnectionError('Device is not ready %d seconds after reboot: %s'
+                                      % (self.get_option('reboot_timeout'), error))
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, READINESS_PROBE_MAX_INTERVAL)
 
     def get_capabilities(self):
         result = {}
         result['rpc'] = []
         result['network_api'] = 'sonic_rest'
+        # Plugin options which are applied on the module side
+        result['options'] = {
+            'coalesce_requests': self.get_option('coalesce_requests'),
+            'timings': self.get_option('timings'),
+            'timings_file': self.get_option('timings_file'),
+            'stream_page_size': self.get_option('stream_page_size'),
+            'facts_workers': self.get_option('facts_workers'),
+            'facts_validation': self.get_option('facts_validation'),
+            'bulk_network_instances': self.get_option('bulk_network_instances'),
+            'bulk_port_breakout': self.get_option('bulk_port_breakout'),
+            'bulk_vlan_mapping': self.get_option('bulk_vlan_mapping'),
+            'bulk_qos': self.get_option('bulk_qos'),
+            'structured_diff': self.get_option('structured_diff'),
+        }
 
         return json.dumps(result)
 
 
-def handle_response(response, response_data, request_data):
+def get_dispatch(request, yang_patch=False):
+    """Return how a request of an edit_config request list is sent: 'get'
+    for a GET request, 'yang_patch' for a request which can be sent as a
+    YANG-Patch edit, and None for any other request
+    """
+    method = (request.get('method') or '').lower()
+    if method == 'get':
+        return 'get'
+    if yang_patch and method in YANG_PATCH_OPERATIONS:
+        path = (request.get('path') or '').lstrip('/')
+        if path.startswith('data/') and '?' not in path and not get_query_string(request):
+            return 'yang_patch'
+    return None
+
+
+def get_yang_patch_error(exc, reqs):
+    """Return the error of a failed YANG-Patch request, with the errors of
+    the failed edits mapped to the requests from which they were created
+    """
+    error = exc.args[0] if exc.args else None
+    patch_status = error.get('ietf-yang-patch:yang-patch-status') if isinstance(error, dict) else None
+    if not isinstance(patch_status, dict):
+        error_text = {u'code': getattr(exc, 'code', None), u'error': to_text(exc, errors='surrogate_then_replace'),
+                      u'request_data': reqs}
+        return ConnectionError(error_text, code=getattr(exc, 'code', None))
+
+    errors = []
+    failed_reqs = []
+    if patch_status.get('errors'):
+        errors.extend(patch_status['errors'].get('error', []))
+    for edit in patch_status.get('edit-status', {}).get('edit', []):
+        if not edit.get('errors'):
+            continue
+        try:
+            req = reqs[int(edit.get('edit-id')) - 1]
+        except (TypeError, ValueError, IndexError):
+            req = None
+        for edit_error in edit['errors'].get('error', []):
+            edit_error = dict(edit_error)
+            edit_error[u'request_data'] = req
+            errors.append(edit_error)
+        if req is not None:
+            failed_reqs.append(req)
+
+    error_text = {u'ietf-restconf:errors': {u'error': errors}}
+    error_text.update({u'code': exc.code})
+    error_text.update({u'request_data': failed_reqs[0] if len(failed_reqs) == 1 else (failed_reqs or reqs)})
+    return ConnectionError(error_text, code=exc.code)
+
+
+def is_parent_path(segments, pattern):
+    """Return whether the segments of a path are those of a pattern of path
+    segments, or of a parent of it
+    """
+    return len(segments) <= len(pattern) and all(fnmatchcase(segment, segment_pattern)
+                                                 for segment, segment_pattern in zip(segments, pattern))
+
+
+def is_not_found_error(exc):
+    return bool(re.search("[nN]ot [fF]ound.*code': 404", str(exc)))
+
+
+def iter_list_entries(response_data, stream_path, json_codec):
+    """Return an iterator of the entries of the list at the given path of
+    keys in a response body
+    """
+    if HAS_IJSON:
+        # Decode the list entries one at a time
+        return ijson.items(response_data, '.'.join(stream_path) + '.item', use_float=True)
+
+    response_data = response_data.read()
+    data = json_codec.loads(response_data) if response_data else {}
+    for key in stream_path:
+        data = data.get(key) if isinstance(data, dict) else None
+    return iter(data if isinstance(data, list) else [])
+
+
+def get_query_string(request_data):
+    """Build the RESTCONF query string for the 'depth', 'fields' and
+    'content' query parameters of a request
+    """
+    query = []
+    depth = request_data.get('depth')
+    if depth:
+        query.append('depth=%s' % depth)
+    fields = request_data.get('fields')
+    if fields:
+        if isinstance(fields, (list, tuple)):
+            fields = ';'.join(fields)
+        query.append('fields=%s' % quote(fields, safe='/:;()'))
+    content = request_data.get('content')
+    if content:
+        query.append('content=%s' % content)
+    return '&'.join(query)
+
+
+def handle_response(response, response_data, request_data, json_codec=None):
     response_data = response_data.read()
     try:
         if not response_data:
             response_data = ""
         else:
-            response_data = json.loads(response_data.decode('utf-8'))
+            response_data = (json_codec or JsonCodec()).loads(response_data)
     except ValueError:
         pass
 
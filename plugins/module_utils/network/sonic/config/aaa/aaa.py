@@ -111,7 +111,8 @@ class Aaa(ConfigBase):
         if self._module._diff:
             result['diff'] = get_formatted_config_diff(old_config,
                                                        new_config,
-                                                       self._module._verbosity)
+                                                       self._module._verbosity,
+                                                       module=self._module)
         result['warnings'] = warnings
         return result
 
@@ -286,7 +286,9 @@ class Bgp_neighbors(ConfigBase):
             new_config = sort_config(new_config, TEST_KEYS_sort_config)
             result['diff'] = get_formatted_config_diff(old_config,
                                                        new_config,
-                                                       self._module._verbosity)
+                                                       self._module._verbosity,
+                                                       module=self._module,
+                                                       test_keys=TEST_KEYS_generate_config)
         result['commands'] = commands
         result['warnings'] = warnings
         return result
@@ -164,7 +164,9 @@ class L2_acls(ConfigBase):
             self.sort_config(old_config)
             result['diff'] = get_formatted_config_diff(old_config,
                                                        new_config,
-                                                       self._module._verbosity)
+                                                       self._module._verbosity,
+                                                       module=self._module,
+                                                       test_keys=TEST_KEYS_formatted_diff)
         result['warnings'] = warnings
         return result
 
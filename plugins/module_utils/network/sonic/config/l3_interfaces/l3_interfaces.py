@@ -134,7 +134,9 @@ class L3_interfaces(ConfigBase):
             self.sort_lists_in_config(new_conf)
             result['diff'] = get_formatted_config_diff(old_conf,
                                                        new_conf,
-                                                       self._module._verbosity)
+                                                       self._module._verbosity,
+                                                       module=self._module,
+                                                       test_keys=TEST_KEYS_formatted_diff)
         result['warnings'] = warnings
         return result
 
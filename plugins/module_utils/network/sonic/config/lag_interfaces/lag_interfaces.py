@@ -149,7 +149,9 @@ class Lag_interfaces(ConfigBase):
                 self.sort_config(new_config)
             result['diff'] = get_formatted_config_diff(old_config,
                                                        new_config,
-                                                       self._module._verbosity)
+                                                       self._module._verbosity,
+                                                       module=self._module,
+                                                       test_keys=TEST_KEYS)
         result['warnings'] = warnings
         return result
 
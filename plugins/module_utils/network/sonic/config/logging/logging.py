@@ -125,7 +125,9 @@ class Logging(ConfigBase):
         if self._module._diff:
             result['diff'] = get_formatted_config_diff(existing_logging_facts,
                                                        new_config,
-                                                       self._module._verbosity)
+                                                       self._module._verbosity,
+                                                       module=self._module,
+                                                       test_keys=TEST_KEYS_formatted_diff)
         result['warnings'] = warnings
         return result
 
@@ -116,7 +116,8 @@ class Lst(ConfigBase):
         if self._module._diff:
             self.sort_lists_in_config(new_config)
             self.sort_lists_in_config(old_config)
-            result['diff'] = get_formatted_config_diff(old_config, new_config, self._module._verbosity)
+            result['diff'] = get_formatted_config_diff(old_config, new_config, self._module._verbosity,
+                                                       module=self._module, test_keys=TEST_KEYS_generate_config)
 
         result['warnings'] = warnings
         return result
@@ -129,7 +129,8 @@ class Mirroring(ConfigBase):
         if self._module._diff:
             self.sort_mirrors(old_config)
             self.sort_mirrors(new_config)
-            result['diff'] = get_formatted_config_diff(old_config, new_config, self._module._verbosity)
+            result['diff'] = get_formatted_config_diff(old_config, new_config, self._module._verbosity,
+                                                       module=self._module, test_keys=TEST_KEYS_generate_config)
         return result
 
     def set_config(self, existing_mirroring_facts):
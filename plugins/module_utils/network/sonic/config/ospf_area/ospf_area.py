@@ -262,7 +262,9 @@ class Ospf_area(ConfigBase):
             existing_ospf_area_facts.sort(key=lambda x: (x['area_id'], x['vrf_name']))
             result['config_diff'] = get_formatted_config_diff(existing_ospf_area_facts,
                                                               new_config,
-                                                              self._module._verbosity)
+                                                              self._module._verbosity,
+                                                              module=self._module,
+                                                              test_keys=TEST_KEYS_generate_config)
 
         result['warnings'] = warnings
         return result
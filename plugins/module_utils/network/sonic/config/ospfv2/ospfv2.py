@@ -243,7 +243,8 @@ class Ospfv2(ConfigBase):
             self.sort_lists_in_config(result['after(generated)'])
 
         if self._module._diff:
-            result['diff'] = get_formatted_config_diff(old_config, new_config, self._module._verbosity)
+            result['diff'] = get_formatted_config_diff(old_config, new_config, self._module._verbosity,
+                                                       module=self._module, test_keys=TEST_KEYS_diff)
 
         result['warnings'] = warnings
         return result
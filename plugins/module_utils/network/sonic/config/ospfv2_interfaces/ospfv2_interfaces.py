@@ -157,7 +157,8 @@ class Ospfv2_interfaces(ConfigBase):
             result['after(generated)'] = remove_empties_from_list(new_config)
 
         if self._module._diff:
-            result['diff'] = get_formatted_config_diff(old_config, new_config, self._module._verbosity)
+            result['diff'] = get_formatted_config_diff(old_config, new_config, self._module._verbosity,
+                                                       module=self._module, test_keys=TEST_KEYS)
 
         result['warnings'] = warnings
         return result
@@ -123,7 +123,8 @@ class Pim_global(ConfigBase):
                 old_config.sort(key=lambda x: x['vrf_name'])
             if new_config:
                 new_config.sort(key=lambda x: x['vrf_name'])
-            result['diff'] = get_formatted_config_diff(old_config, new_config, self._module._verbosity)
+            result['diff'] = get_formatted_config_diff(old_config, new_config, self._module._verbosity,
+                                                       module=self._module, test_keys=TEST_KEYS_GENERATE_CONFIG)
 
         result['commands'] = commands
         result['warnings'] = warnings
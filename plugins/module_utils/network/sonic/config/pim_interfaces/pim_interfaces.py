@@ -124,7 +124,8 @@ class Pim_interfaces(ConfigBase):
                 old_config.sort(key=lambda x: x['name'])
             if new_config:
                 new_config.sort(key=lambda x: x['name'])
-            result['diff'] = get_formatted_config_diff(old_config, new_config, self._module._verbosity)
+            result['diff'] = get_formatted_config_diff(old_config, new_config, self._module._verbosity,
+                                                       module=self._module, test_keys=TEST_KEYS_GENERATE_CONFIG)
 
         result['commands'] = commands
         result['warnings'] = warnings
@@ -213,7 +213,9 @@ class Poe(ConfigBase):
 
         if self._module._diff:
             result['config_diff'] = get_formatted_config_diff(existing_poe_facts,
-                                                              new_config)
+                                                              new_config,
+                                                              module=self._module,
+                                                              test_keys=TEST_KEYS_generate_config)
 
         result['warnings'] = warnings
         return result
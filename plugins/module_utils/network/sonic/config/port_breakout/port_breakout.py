@@ -29,7 +29,7 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
     update_states,
     get_diff,
     get_speed_from_breakout_mode,
-    get_breakout_mode,
+    get_breakout_modes,
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
     __DELETE_CONFIG_IF_NO_SUBCONFIG,
@@ -111,7 +111,9 @@ class Port_breakout(ConfigBase):
             old_config.sort(key=lambda x: x['name'])
             result['diff'] = get_formatted_config_diff(old_config,
                                                        new_config,
-                                                       self._module._verbosity)
+                                                       self._module._verbosity,
+                                                       module=self._module,
+                                                       test_keys=TEST_KEYS_generate_config)
         result['warnings'] = warnings
         return result
 
@@ -299,9 +301,11 @@ class Port_breakout(ConfigBase):
 
     def get_all_breakout_mode(self, have):
         new_have = []
+        # The breakout modes fetched with the facts are reused.
+        modes = get_breakout_modes(self._module, [cfg['name'] for cfg in have], refresh=False)
         for cfg in have:
             name = cfg['name']
-            mode = get_breakout_mode(self._module, name)
+            mode = modes[name]
             if mode:
                 new_have.append({'name': name, 'mode': mode})
         return new_have
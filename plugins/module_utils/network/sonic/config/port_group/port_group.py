@@ -135,7 +135,9 @@ class Port_group(ConfigBase):
         if self._module._diff:
             result['diff'] = get_formatted_config_diff(existing_port_group_facts,
                                                        new_config,
-                                                       self._module._verbosity)
+                                                       self._module._verbosity,
+                                                       module=self._module,
+                                                       test_keys=TEST_KEYS_formatted_diff)
         result['warnings'] = warnings
         return result
 
@@ -96,7 +96,9 @@ class Qos_buffer(ConfigBase):
         if commands and len(requests) > 0:
             if not self._module.check_mode:
                 try:
-                    edit_config_reboot(self._module, to_request(self._module, requests))
+                    downtime = edit_config_reboot(self._module, to_request(self._module, requests))
+                    if downtime is not None:
+                        result['reboot_downtime'] = downtime
                 except ConnectionError as exc:
                     self._module.fail_json(msg=str(exc), code=exc.code)
             result['changed'] = True
@@ -119,7 +121,9 @@ class Qos_buffer(ConfigBase):
             self.sort_lists_in_config(old_config)
             result['diff'] = get_formatted_config_diff(old_config,
                                                        new_config,
-                                                       self._module._verbosity)
+                                                       self._module._verbosity,
+                                                       module=self._module,
+                                                       test_keys=TEST_KEYS_formatted_diff)
 
         result['warnings'] = warnings
         return result
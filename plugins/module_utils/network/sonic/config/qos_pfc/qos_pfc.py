@@ -108,7 +108,8 @@ class Qos_pfc(ConfigBase):
         if self._module._diff:
             result['diff'] = get_formatted_config_diff(old_config,
                                                        new_config,
-                                                       self._module._verbosity)
+                                                       self._module._verbosity,
+                                                       module=self._module)
 
         result['warnings'] = warnings
         return result
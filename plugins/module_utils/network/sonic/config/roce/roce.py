@@ -84,7 +84,9 @@ class Roce(ConfigBase):
         if commands and len(requests) > 0:
             if not self._module.check_mode:
                 try:
-                    edit_config_reboot(self._module, to_request(self._module, requests))
+                    downtime = edit_config_reboot(self._module, to_request(self._module, requests))
+                    if downtime is not None:
+                        result['reboot_downtime'] = downtime
                 except ConnectionError as exc:
                     pass
             result['changed'] = True
@@ -104,7 +106,8 @@ class Roce(ConfigBase):
         if self._module._diff:
             result['diff'] = get_formatted_config_diff(old_config,
                                                        new_config,
-                                                       self._module._verbosity)
+                                                       self._module._verbosity,
+                                                       module=self._module)
 
         result['warnings'] = warnings
         return result
@@ -108,7 +108,8 @@ class Ssh(ConfigBase):
             new_config = get_new_config(commands, existing_ssh_facts)
             result['after(generated)'] = new_config
         if self._module._diff:
-            result['diff'] = get_formatted_config_diff(old_config, new_config, self._module._verbosity)
+            result['diff'] = get_formatted_config_diff(old_config, new_config, self._module._verbosity,
+                                                       module=self._module)
 
         result['warnings'] = warnings
         return result
@@ -136,7 +136,9 @@ class System(ConfigBase):
         if self._module._diff:
             result['diff'] = get_formatted_config_diff(existing_system_facts,
                                                        new_config,
-                                                       self._module._verbosity)
+                                                       self._module._verbosity,
+                                                       module=self._module,
+                                                       test_keys=TEST_KEYS_formatted_diff)
         result['warnings'] = warnings
         return result
 
@@ -115,7 +115,9 @@ class Tacacs_server(ConfigBase):
         if self._module._diff:
             result['diff'] = get_formatted_config_diff(existing_tacacs_server_facts,
                                                        new_config,
-                                                       self._module._verbosity)
+                                                       self._module._verbosity,
+                                                       module=self._module,
+                                                       test_keys=TEST_KEYS_formatted_diff)
         result['warnings'] = warnings
         return result
 
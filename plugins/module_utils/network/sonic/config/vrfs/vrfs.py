@@ -118,7 +118,9 @@ class Vrfs(ConfigBase):
         if self._module._diff:
             result['diff'] = get_formatted_config_diff(existing_vrf_interfaces_facts,
                                                        new_config,
-                                                       self._module._verbosity)
+                                                       self._module._verbosity,
+                                                       module=self._module,
+                                                       test_keys=TEST_KEYS_formatted_diff)
         result['warnings'] = warnings
         return result
 
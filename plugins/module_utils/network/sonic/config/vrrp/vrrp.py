@@ -176,7 +176,8 @@ class Vrrp(ConfigBase):
         if self._module._diff:
             self.sort_lists_in_config(old_config)
             self.sort_lists_in_config(new_config)
-            result['diff'] = get_formatted_config_diff(old_config, new_config, self._module._verbosity)
+            result['diff'] = get_formatted_config_diff(old_config, new_config, self._module._verbosity,
+                                                       module=self._module, test_keys=TEST_KEYS_formatted_diff)
 
         result['commands'] = commands
         result['warnings'] = warnings
@@ -123,7 +123,9 @@ class Vxlans(ConfigBase):
             self.sort_lists_in_config(old_config)
             result['diff'] = get_formatted_config_diff(old_config,
                                                        new_config,
-                                                       self._module._verbosity)
+                                                       self._module._verbosity,
+                                                       module=self._module,
+                                                       test_keys=test_keys_generate_config)
         result['warnings'] = warnings
         return result
 
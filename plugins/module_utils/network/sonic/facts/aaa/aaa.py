@@ -17,6 +17,7 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import validate_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     remove_empties
 )
@@ -62,7 +63,7 @@ class AaaFacts(object):
         objs = data
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_config(self.argument_spec, {'config': objs})
             facts['aaa'] = remove_empties(params['config'])
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
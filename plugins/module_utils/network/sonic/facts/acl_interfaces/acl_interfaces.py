@@ -15,15 +15,12 @@ __metaclass__ = type
 
 from copy import deepcopy
 
-from ansible.module_utils.connection import ConnectionError
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import validate_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.acl_interfaces.acl_interfaces import Acl_interfacesArgs
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
-    to_request,
-    edit_config
-)
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.acl_utils import get_acl_bindings
 
 
 class Acl_interfacesFacts(object):
@@ -67,7 +64,7 @@ class Acl_interfacesFacts(object):
         ansible_facts['ansible_network_resources'].pop('acl_interfaces', None)
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_config(self.argument_spec, {'config': objs})
             facts['acl_interfaces'] = params['config']
 
         ansible_facts['ansible_network_resources'].update(facts)
@@ -108,18 +105,7 @@ class Acl_interfacesFacts(object):
 
     def get_acl_interfaces(self):
         """Get all interface access-group configurations available in chassis"""
-        acl_interfaces_path = 'data/openconfig-acl:acl/interfaces'
-        method = 'GET'
-        request = [{'path': acl_interfaces_path, 'method': method}]
-
-        try:
-            response = edit_config(self._module, to_request(self._module, request))
-        except ConnectionError as exc:
-            self._module.fail_json(msg=str(exc), code=exc.code)
-
-        acl_interfaces = []
-        if response[0][1].get('openconfig-acl:interfaces'):
-            acl_interfaces = response[0][1]['openconfig-acl:interfaces'].get('interface', [])
+        acl_interfaces = get_acl_bindings(self._module)
 
         acl_interfaces_configs = {}
         for interface in acl_interfaces:
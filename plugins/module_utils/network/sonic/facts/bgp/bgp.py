@@ -18,6 +18,7 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import validate_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     remove_empties_from_list
 )
@@ -93,7 +94,7 @@ class BgpFacts(object):
         ansible_facts['ansible_network_resources'].pop('bgp', None)
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_config(self.argument_spec, {'config': objs})
             facts['bgp'] = remove_empties_from_list(params['config'])
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
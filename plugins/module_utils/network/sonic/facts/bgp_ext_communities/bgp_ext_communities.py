@@ -16,6 +16,7 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import validate_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.bgp_ext_communities.bgp_ext_communities import (
     Bgp_ext_communitiesArgs,
 )
@@ -129,7 +130,7 @@ class Bgp_ext_communitiesFacts(object):
         ansible_facts['ansible_network_resources'].pop('bgp_ext_communities', None)
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_config(self.argument_spec, {'config': objs})
             facts['bgp_ext_communities'] = params['config']
 
         ansible_facts['ansible_network_resources'].update(facts)
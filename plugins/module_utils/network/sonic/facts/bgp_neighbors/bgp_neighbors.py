@@ -18,6 +18,7 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import validate_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     remove_empties_from_list
 )
@@ -25,7 +26,7 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.bgp_utils import (
     get_all_bgp_neighbors,
     get_from_params_map,
-    get_peergroups,
+    get_all_peergroups,
 )
 
 
@@ -109,7 +110,7 @@ class Bgp_neighborsFacts(object):
         ansible_facts['ansible_network_resources'].pop('bgp_neighbors', None)
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_config(self.argument_spec, {'config': objs})
             facts['bgp_neighbors'] = remove_empties_from_list(params['config'])
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
@@ -129,6 +130,7 @@ class Bgp_neighborsFacts(object):
 
     def filter_neighbors_data(self, data):
         filtered_data = []
+        peergroups = get_all_peergroups(self._module, [conf['vrf_name'] for conf in data])
         for conf in data:
             vrf_name = conf['vrf_name']
             tmp = {}
@@ -139,7 +141,7 @@ class Bgp_neighborsFacts(object):
 
             tmp['vrf_name'] = vrf_name
             tmp['bgp_as'] = bgp_as
-            peergroup = get_peergroups(self._module, vrf_name)
+            peergroup = peergroups[vrf_name]
             if peergroup:
                 tmp['peer_group'] = peergroup
             fil_neighbors = []
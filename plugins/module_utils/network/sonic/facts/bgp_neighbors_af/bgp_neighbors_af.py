@@ -18,6 +18,7 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import validate_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     remove_empties_from_list
 )
@@ -199,7 +200,7 @@ class Bgp_neighbors_afFacts(object):
         ansible_facts['ansible_network_resources'].pop('bgp_neighbors_af', None)
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': remove_empties_from_list(objs)})
+            params = validate_config(self.argument_spec, {'config': remove_empties_from_list(objs)})
             facts['bgp_neighbors_af'] = params['config']
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
@@ -18,6 +18,7 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import validate_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.dhcp_snooping.dhcp_snooping import Dhcp_snoopingArgs
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     to_request,
@@ -63,7 +64,7 @@ class Dhcp_snoopingFacts(object):
         ansible_facts['ansible_network_resources'].pop('dhcp_snooping', None)
         facts = {}
         if obj:
-            params = utils.validate_config(self.argument_spec, {'config': obj})
+            params = validate_config(self.argument_spec, {'config': obj})
             params_cleaned = {'config': utils.remove_empties(params['config'])}
             facts['dhcp_snooping'] = params_cleaned['config']
 
@@ -12,144 +12,445 @@ calls the appropriate facts gathering function
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.facts.facts import FactsArgs
+from ansible.module_utils._text import to_text
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.facts.facts import (
     FactsBase,
 )
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vlans.vlans import VlansFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.interfaces.interfaces import InterfacesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l2_interfaces.l2_interfaces import L2_interfacesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l3_interfaces.l3_interfaces import L3_interfacesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.lag_interfaces.lag_interfaces import Lag_interfacesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp.bgp import BgpFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_af.bgp_af import Bgp_afFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_neighbors.bgp_neighbors import Bgp_neighborsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_neighbors_af.bgp_neighbors_af import Bgp_neighbors_afFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_as_paths.bgp_as_paths import Bgp_as_pathsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_communities.bgp_communities import Bgp_communitiesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_ext_communities.bgp_ext_communities import (
-    Bgp_ext_communitiesFacts,
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
+    get_connection,
+    get_connection_option,
+    init_timings,
+    send_edit_config
+)
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.request_batcher import (
+    CollectorFailure,
+    run_concurrently
 )
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ospfv2_interfaces.ospfv2_interfaces import Ospfv2_interfacesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ospfv2.ospfv2 import Ospfv2Facts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.mclag.mclag import MclagFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.prefix_lists.prefix_lists import Prefix_listsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vlan_mapping.vlan_mapping import Vlan_mappingFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vrfs.vrfs import VrfsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vrrp.vrrp import VrrpFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vxlans.vxlans import VxlansFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.users.users import UsersFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.port_breakout.port_breakout import Port_breakoutFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.aaa.aaa import AaaFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ldap.ldap import LdapFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.tacacs_server.tacacs_server import Tacacs_serverFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.system.system import SystemFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.radius_server.radius_server import Radius_serverFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.static_routes.static_routes import Static_routesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ntp.ntp import NtpFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.logging.logging import LoggingFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.pki.pki import PkiFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ip_neighbor.ip_neighbor import Ip_neighborFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.port_group.port_group import Port_groupFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.dhcp_relay.dhcp_relay import Dhcp_relayFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.dhcp_snooping.dhcp_snooping import Dhcp_snoopingFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.acl_interfaces.acl_interfaces import Acl_interfacesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l2_acls.l2_acls import L2_aclsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l3_acls.l3_acls import L3_aclsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.lldp_global.lldp_global import Lldp_globalFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.mac.mac import MacFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bfd.bfd import BfdFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.copp.copp import CoppFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.route_maps.route_maps import Route_mapsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.lldp_interfaces.lldp_interfaces import Lldp_interfacesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.stp.stp import StpFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.sflow.sflow import SflowFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.fips.fips import FipsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.roce.roce import RoceFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.qos_buffer.qos_buffer import Qos_bufferFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.qos_pfc.qos_pfc import Qos_pfcFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.qos_maps.qos_maps import Qos_mapsFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.qos_scheduler.qos_scheduler import Qos_schedulerFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.qos_wred.qos_wred import Qos_wredFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.qos_interfaces.qos_interfaces import Qos_interfacesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.pim_global.pim_global import Pim_globalFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.pim_interfaces.pim_interfaces import Pim_interfacesFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.login_lockout.login_lockout import Login_lockoutFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.poe.poe import PoeFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.mgmt_servers.mgmt_servers import Mgmt_serversFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ospf_area.ospf_area import Ospf_areaFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ssh.ssh import SshFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.lst.lst import LstFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.fbs_classifiers.fbs_classifiers import Fbs_classifiersFacts
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.mirroring.mirroring import MirroringFacts
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import trusted_validation
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.snapshot import device_snapshot
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.timings import timed_phase
 
 
 FACT_LEGACY_SUBSETS = {}
-FACT_RESOURCE_SUBSETS = dict(
-    vlans=VlansFacts,
-    interfaces=InterfacesFacts,
-    l2_interfaces=L2_interfacesFacts,
-    l3_interfaces=L3_interfacesFacts,
-    lag_interfaces=Lag_interfacesFacts,
-    bgp=BgpFacts,
-    bgp_af=Bgp_afFacts,
-    bgp_neighbors=Bgp_neighborsFacts,
-    bgp_neighbors_af=Bgp_neighbors_afFacts,
-    bgp_as_paths=Bgp_as_pathsFacts,
-    bgp_communities=Bgp_communitiesFacts,
-    bgp_ext_communities=Bgp_ext_communitiesFacts,
-    ospfv2_interfaces=Ospfv2_interfacesFacts,
-    ospfv2=Ospfv2Facts,
-    mclag=MclagFacts,
-    prefix_lists=Prefix_listsFacts,
-    vlan_mapping=Vlan_mappingFacts,
-    vrfs=VrfsFacts,
-    vrrp=VrrpFacts,
-    vxlans=VxlansFacts,
-    users=UsersFacts,
-    system=SystemFacts,
-    port_breakout=Port_breakoutFacts,
-    aaa=AaaFacts,
-    ldap=LdapFacts,
-    tacacs_server=Tacacs_serverFacts,
-    radius_server=Radius_serverFacts,
-    static_routes=Static_routesFacts,
-    ntp=NtpFacts,
-    logging=LoggingFacts,
-    pki=PkiFacts,
-    ip_neighbor=Ip_neighborFacts,
-    port_group=Port_groupFacts,
-    dhcp_relay=Dhcp_relayFacts,
-    dhcp_snooping=Dhcp_snoopingFacts,
-    acl_interfaces=Acl_interfacesFacts,
-    l2_acls=L2_aclsFacts,
-    l3_acls=L3_aclsFacts,
-    lldp_global=Lldp_globalFacts,
-    mac=MacFacts,
-    bfd=BfdFacts,
-    copp=CoppFacts,
-    route_maps=Route_mapsFacts,
-    lldp_interfaces=Lldp_interfacesFacts,
-    stp=StpFacts,
-    sflow=SflowFacts,
-    fips=FipsFacts,
-    roce=RoceFacts,
-    qos_buffer=Qos_bufferFacts,
-    qos_pfc=Qos_pfcFacts,
-    qos_maps=Qos_mapsFacts,
-    qos_scheduler=Qos_schedulerFacts,
-    qos_wred=Qos_wredFacts,
-    qos_interfaces=Qos_interfacesFacts,
-    pim_global=Pim_globalFacts,
-    pim_interfaces=Pim_interfacesFacts,
-    login_lockout=Login_lockoutFacts,
-    poe=PoeFacts,
-    mgmt_servers=Mgmt_serversFacts,
-    ospf_area=Ospf_areaFacts,
-    ssh=SshFacts,
-    lst=LstFacts,
-    fbs_classifiers=Fbs_classifiersFacts,
-    mirroring=MirroringFacts
+
+
+class LazyFactsRegistry(Mapping):
+    """ Mapping of the network resources to their facts classes.
+    A facts class is imported the first time it is looked up, so that a
+    module imports only the facts classes of the resources it gathers.
+    """
+
+    def __init__(self, **loaders):
+        self._loaders = loaders
+        self._facts_classes = {}
+
+    def __getitem__(self, key):
+        if key not in self._facts_classes:
+            self._facts_classes[key] = self._loaders[key]()
+        return self._facts_classes[key]
+
+    def __iter__(self):
+        return iter(self._loaders)
+
+    def __len__(self):
+        return len(self._loaders)
+
+
+# The facts classes are imported with explicit import statements, which are
+# needed for the facts modules to be included in the module payload.
+def _load_vlans():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vlans.vlans import VlansFacts
+    return VlansFacts
+
+
+def _load_interfaces():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.interfaces.interfaces import InterfacesFacts
+    return InterfacesFacts
+
+
+def _load_l2_interfaces():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l2_interfaces.l2_interfaces import L2_interfacesFacts
+    return L2_interfacesFacts
+
+
+def _load_l3_interfaces():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l3_interfaces.l3_interfaces import L3_interfacesFacts
+    return L3_interfacesFacts
+
+
+def _load_lag_interfaces():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.lag_interfaces.lag_interfaces import Lag_interfacesFacts
+    return Lag_interfacesFacts
+
+
+def _load_bgp():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp.bgp import BgpFacts
+    return BgpFacts
+
+
+def _load_bgp_af():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_af.bgp_af import Bgp_afFacts
+    return Bgp_afFacts
+
+
+def _load_bgp_neighbors():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_neighbors.bgp_neighbors import Bgp_neighborsFacts
+    return Bgp_neighborsFacts
+
+
+def _load_bgp_neighbors_af():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_neighbors_af.bgp_neighbors_af import Bgp_neighbors_afFacts
+    return Bgp_neighbors_afFacts
+
+
+def _load_bgp_as_paths():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_as_paths.bgp_as_paths import Bgp_as_pathsFacts
+    return Bgp_as_pathsFacts
+
+
+def _load_bgp_communities():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_communities.bgp_communities import Bgp_communitiesFacts
+    return Bgp_communitiesFacts
+
+
+def _load_bgp_ext_communities():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bgp_ext_communities.bgp_ext_communities import (
+        Bgp_ext_communitiesFacts,
+    )
+    return Bgp_ext_communitiesFacts
+
+
+def _load_ospfv2_interfaces():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ospfv2_interfaces.ospfv2_interfaces import Ospfv2_interfacesFacts
+    return Ospfv2_interfacesFacts
+
+
+def _load_ospfv2():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ospfv2.ospfv2 import Ospfv2Facts
+    return Ospfv2Facts
+
+
+def _load_mclag():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.mclag.mclag import MclagFacts
+    return MclagFacts
+
+
+def _load_prefix_lists():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.prefix_lists.prefix_lists import Prefix_listsFacts
+    return Prefix_listsFacts
+
+
+def _load_vlan_mapping():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vlan_mapping.vlan_mapping import Vlan_mappingFacts
+    return Vlan_mappingFacts
+
+
+def _load_vrfs():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vrfs.vrfs import VrfsFacts
+    return VrfsFacts
+
+
+def _load_vrrp():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vrrp.vrrp import VrrpFacts
+    return VrrpFacts
+
+
+def _load_vxlans():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vxlans.vxlans import VxlansFacts
+    return VxlansFacts
+
+
+def _load_users():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.users.users import UsersFacts
+    return UsersFacts
+
+
+def _load_system():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.system.system import SystemFacts
+    return SystemFacts
+
+
+def _load_port_breakout():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.port_breakout.port_breakout import Port_breakoutFacts
+    return Port_breakoutFacts
+
+
+def _load_aaa():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.aaa.aaa import AaaFacts
+    return AaaFacts
+
+
+def _load_ldap():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ldap.ldap import LdapFacts
+    return LdapFacts
+
+
+def _load_tacacs_server():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.tacacs_server.tacacs_server import Tacacs_serverFacts
+    return Tacacs_serverFacts
+
+
+def _load_radius_server():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.radius_server.radius_server import Radius_serverFacts
+    return Radius_serverFacts
+
+
+def _load_static_routes():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.static_routes.static_routes import Static_routesFacts
+    return Static_routesFacts
+
+
+def _load_ntp():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ntp.ntp import NtpFacts
+    return NtpFacts
+
+
+def _load_logging():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.logging.logging import LoggingFacts
+    return LoggingFacts
+
+
+def _load_pki():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.pki.pki import PkiFacts
+    return PkiFacts
+
+
+def _load_ip_neighbor():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ip_neighbor.ip_neighbor import Ip_neighborFacts
+    return Ip_neighborFacts
+
+
+def _load_port_group():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.port_group.port_group import Port_groupFacts
+    return Port_groupFacts
+
+
+def _load_dhcp_relay():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.dhcp_relay.dhcp_relay import Dhcp_relayFacts
+    return Dhcp_relayFacts
+
+
+def _load_dhcp_snooping():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.dhcp_snooping.dhcp_snooping import Dhcp_snoopingFacts
+    return Dhcp_snoopingFacts
+
+
+def _load_acl_interfaces():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.acl_interfaces.acl_interfaces import Acl_interfacesFacts
+    return Acl_interfacesFacts
+
+
+def _load_l2_acls():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l2_acls.l2_acls import L2_aclsFacts
+    return L2_aclsFacts
+
+
+def _load_l3_acls():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l3_acls.l3_acls import L3_aclsFacts
+    return L3_aclsFacts
+
+
+def _load_lldp_global():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.lldp_global.lldp_global import Lldp_globalFacts
+    return Lldp_globalFacts
+
+
+def _load_mac():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.mac.mac import MacFacts
+    return MacFacts
+
+
+def _load_bfd():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.bfd.bfd import BfdFacts
+    return BfdFacts
+
+
+def _load_copp():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.copp.copp import CoppFacts
+    return CoppFacts
+
+
+def _load_route_maps():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.route_maps.route_maps import Route_mapsFacts
+    return Route_mapsFacts
+
+
+def _load_lldp_interfaces():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.lldp_interfaces.lldp_interfaces import Lldp_interfacesFacts
+    return Lldp_interfacesFacts
+
+
+def _load_stp():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.stp.stp import StpFacts
+    return StpFacts
+
+
+def _load_sflow():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.sflow.sflow import SflowFacts
+    return SflowFacts
+
+
+def _load_fips():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.fips.fips import FipsFacts
+    return FipsFacts
+
+
+def _load_roce():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.roce.roce import RoceFacts
+    return RoceFacts
+
+
+def _load_qos_buffer():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.qos_buffer.qos_buffer import Qos_bufferFacts
+    return Qos_bufferFacts
+
+
+def _load_qos_pfc():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.qos_pfc.qos_pfc import Qos_pfcFacts
+    return Qos_pfcFacts
+
+
+def _load_qos_maps():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.qos_maps.qos_maps import Qos_mapsFacts
+    return Qos_mapsFacts
+
+
+def _load_qos_scheduler():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.qos_scheduler.qos_scheduler import Qos_schedulerFacts
+    return Qos_schedulerFacts
+
+
+def _load_qos_wred():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.qos_wred.qos_wred import Qos_wredFacts
+    return Qos_wredFacts
+
+
+def _load_qos_interfaces():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.qos_interfaces.qos_interfaces import Qos_interfacesFacts
+    return Qos_interfacesFacts
+
+
+def _load_pim_global():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.pim_global.pim_global import Pim_globalFacts
+    return Pim_globalFacts
+
+
+def _load_pim_interfaces():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.pim_interfaces.pim_interfaces import Pim_interfacesFacts
+    return Pim_interfacesFacts
+
+
+def _load_login_lockout():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.login_lockout.login_lockout import Login_lockoutFacts
+    return Login_lockoutFacts
+
+
+def _load_poe():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.poe.poe import PoeFacts
+    return PoeFacts
+
+
+def _load_mgmt_servers():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.mgmt_servers.mgmt_servers import Mgmt_serversFacts
+    return Mgmt_serversFacts
+
+
+def _load_ospf_area():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ospf_area.ospf_area import Ospf_areaFacts
+    return Ospf_areaFacts
+
+
+def _load_ssh():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ssh.ssh import SshFacts
+    return SshFacts
+
+
+def _load_lst():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.lst.lst import LstFacts
+    return LstFacts
+
+
+def _load_fbs_classifiers():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.fbs_classifiers.fbs_classifiers import Fbs_classifiersFacts
+    return Fbs_classifiersFacts
+
+
+def _load_mirroring():
+    from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.mirroring.mirroring import MirroringFacts
+    return MirroringFacts
+
+
+FACT_RESOURCE_SUBSETS = LazyFactsRegistry(
+    vlans=_load_vlans,
+    interfaces=_load_interfaces,
+    l2_interfaces=_load_l2_interfaces,
+    l3_interfaces=_load_l3_interfaces,
+    lag_interfaces=_load_lag_interfaces,
+    bgp=_load_bgp,
+    bgp_af=_load_bgp_af,
+    bgp_neighbors=_load_bgp_neighbors,
+    bgp_neighbors_af=_load_bgp_neighbors_af,
+    bgp_as_paths=_load_bgp_as_paths,
+    bgp_communities=_load_bgp_communities,
+    bgp_ext_communities=_load_bgp_ext_communities,
+    ospfv2_interfaces=_load_ospfv2_interfaces,
+    ospfv2=_load_ospfv2,
+    mclag=_load_mclag,
+    prefix_lists=_load_prefix_lists,
+    vlan_mapping=_load_vlan_mapping,
+    vrfs=_load_vrfs,
+    vrrp=_load_vrrp,
+    vxlans=_load_vxlans,
+    users=_load_users,
+    system=_load_system,
+    port_breakout=_load_port_breakout,
+    aaa=_load_aaa,
+    ldap=_load_ldap,
+    tacacs_server=_load_tacacs_server,
+    radius_server=_load_radius_server,
+    static_routes=_load_static_routes,
+    ntp=_load_ntp,
+    logging=_load_logging,
+    pki=_load_pki,
+    ip_neighbor=_load_ip_neighbor,
+    port_group=_load_port_group,
+    dhcp_relay=_load_dhcp_relay,
+    dhcp_snooping=_load_dhcp_snooping,
+    acl_interfaces=_load_acl_interfaces,
+    l2_acls=_load_l2_acls,
+    l3_acls=_load_l3_acls,
+    lldp_global=_load_lldp_global,
+    mac=_load_mac,
+    bfd=_load_bfd,
+    copp=_load_copp,
+    route_maps=_load_route_maps,
+    lldp_interfaces=_load_lldp_interfaces,
+    stp=_load_stp,
+    sflow=_load_sflow,
+    fips=_load_fips,
+    roce=_load_roce,
+    qos_buffer=_load_qos_buffer,
+    qos_pfc=_load_qos_pfc,
+    qos_maps=_load_qos_maps,
+    qos_scheduler=_load_qos_scheduler,
+    qos_wred=_load_qos_wred,
+    qos_interfaces=_load_qos_interfaces,
+    pim_global=_load_pim_global,
+    pim_interfaces=_load_pim_interfaces,
+    login_lockout=_load_login_lockout,
+    poe=_load_poe,
+    mgmt_servers=_load_mgmt_servers,
+    ospf_area=_load_ospf_area,
+    ssh=_load_ssh,
+    lst=_load_lst,
+    fbs_classifiers=_load_fbs_classifiers,
+    mirroring=_load_mirroring
 )
 
 
@@ -173,10 +474,68 @@ class Facts(FactsBase):
         :return: the facts gathered
         """
         netres_choices = FactsArgs.argument_spec['gather_network_resources'].get('choices', [])
-        if self.VALID_RESOURCE_SUBSETS:
-            self.get_network_resources_facts(FACT_RESOURCE_SUBSETS, resource_facts_type, data)
+        init_timings(self._module)
+        # The facts classes share the GET responses of the resources they
+        # have in common, e.g. the interfaces or the VRFs.
+        facts_workers = get_connection_option(self._module, 'facts_workers') or 1
+        trusted = get_connection_option(self._module, 'facts_validation') != 'full'
+        with timed_phase('facts_render'), device_snapshot(self._module), trusted_validation(trusted):
+            if self.VALID_RESOURCE_SUBSETS:
+                if facts_workers > 1:
+                    self.get_network_resources_facts_concurrently(FACT_RESOURCE_SUBSETS, resource_facts_type, data,
+                                                                  facts_workers)
+                else:
+                    self.get_network_resources_facts(FACT_RESOURCE_SUBSETS, resource_facts_type, data)
 
-        if self.VALID_LEGACY_GATHER_SUBSETS:
-            self.get_network_legacy_facts(FACT_LEGACY_SUBSETS, legacy_facts_type)
+            if self.VALID_LEGACY_GATHER_SUBSETS:
+                self.get_network_legacy_facts(FACT_LEGACY_SUBSETS, legacy_facts_type)
 
         return self.ansible_facts, self._warnings
+
+    def get_network_resources_facts_concurrently(self, facts_resource_obj_map, resource_facts_type=None, data=None,
+                                                 workers=1):
+        """ Collect the network resource facts like get_network_resources_facts(),
+        running the facts classes in a pool of threads
+
+        :param facts_resource_obj_map: The facts classes of the network resources
+        :param resource_facts_type: List of resource fact types
+        :param data: previously collected conf
+        :param workers: The number of facts classes run concurrently
+        """
+        if not resource_facts_type:
+            resource_facts_type = self._gather_network_resources
+
+        restorun_subsets = self.gen_runable(resource_facts_type, frozenset(facts_resource_obj_map.keys()),
+                                            resource_facts=True)
+        if not restorun_subsets:
+            return
+
+        self.ansible_facts['ansible_net_gather_network_resources'] = list(restorun_subsets)
+        instances = []
+        for key in sorted(restorun_subsets):
+            fact_cls_obj = facts_resource_obj_map.get(key)
+            if fact_cls_obj:
+                instances.append(fact_cls_obj(self._module))
+            else:
+                self._warnings.extend(["network resource fact gathering for '%s' is not supported" % key])
+
+        def get_populate_task(inst):
+            # Each facts class populates its own facts, they are merged in
+            # the order of the resources once all of them are gathered.
+            def populate_facts():
+                return inst.populate_facts(self._connection, {'ansible_network_resources': {}}, data)
+            return populate_facts
+
+        connection = get_connection(self._module)
+        results = run_concurrently(self._module, [get_populate_task(inst) for inst in instances], workers,
+                                   lambda commands, suppr_ntf_excp: send_edit_config(connection, commands, suppr_ntf_excp))
+        for inst_facts, exc in results:
+            if isinstance(exc, CollectorFailure):
+                self._module.fail_json(*exc.fail_args, **exc.fail_kwargs)
+            elif exc is not None:
+                self._module.fail_json(msg=to_text(exc))
+            for key, value in inst_facts.items():
+                if key == 'ansible_network_resources':
+                    self.ansible_facts[key].update(value)
+                else:
+                    self.ansible_facts[key] = value
@@ -17,6 +17,7 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import validate_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.fips.fips import FipsArgs
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     to_request,
@@ -61,7 +62,7 @@ class FipsFacts(object):
         ansible_facts['ansible_network_resources'].pop('fips', None)
         facts = {}
         if obj:
-            params = utils.validate_config(self.argument_spec, {'config': obj})
+            params = validate_config(self.argument_spec, {'config': obj})
             facts['fips'] = params['config']
 
         ansible_facts['ansible_network_resources'].update(facts)
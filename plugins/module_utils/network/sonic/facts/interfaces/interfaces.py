@@ -18,6 +18,7 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import validate_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.interfaces.interfaces import InterfacesArgs
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     to_request,
@@ -50,7 +51,8 @@ class InterfacesFacts(object):
     def get_all_interfaces(self):
         """Get all the interfaces available in chassis"""
         all_interfaces = {}
-        request = [{"path": "data/openconfig-interfaces:interfaces", "method": GET}]
+        request = [{"path": "data/openconfig-interfaces:interfaces", "method": GET, "content": "config",
+                    "stream": ["openconfig-interfaces:interfaces", "interface"]}]
         try:
             response = edit_config(self._module, to_request(self._module, request))
         except ConnectionError as exc:
@@ -93,7 +95,7 @@ class InterfacesFacts(object):
         facts = {}
         if objs:
             facts['interfaces'] = []
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_config(self.argument_spec, {'config': objs})
             for cfg in params['config']:
                 facts['interfaces'].append(utils.remove_empties(cfg))
         ansible_facts['ansible_network_resources'].update(facts)
@@ -15,15 +15,12 @@ __metaclass__ = type
 
 from copy import deepcopy
 
-from ansible.module_utils.connection import ConnectionError
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import validate_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.l2_acls.l2_acls import L2_aclsArgs
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
-    to_request,
-    edit_config
-)
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.acl_utils import get_acl_sets
 
 ETHERTYPE_FORMAT = '0x{:04x}'
 
@@ -100,7 +97,7 @@ class L2_aclsFacts(object):
         ansible_facts['ansible_network_resources'].pop('l2_acls', None)
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_config(self.argument_spec, {'config': objs})
             facts['l2_acls'] = utils.remove_empties({'config': params['config']})['config']
 
         ansible_facts['ansible_network_resources'].update(facts)
@@ -192,18 +189,7 @@ class L2_aclsFacts(object):
 
     def get_l2_acls(self):
         """Get all l2 acl configurations available in chassis"""
-        acls_path = 'data/openconfig-acl:acl/acl-sets'
-        method = 'GET'
-        request = [{'path': acls_path, 'method': method}]
-
-        try:
-            response = edit_config(self._module, to_request(self._module, request))
-        except ConnectionError as exc:
-            self._module.fail_json(msg=str(exc), code=exc.code)
-
-        acls = []
-        if response[0][1].get('openconfig-acl:acl-sets'):
-            acls = response[0][1]['openconfig-acl:acl-sets'].get('acl-set', [])
+        acls = get_acl_sets(self._module, 'mac')
 
         l2_acls_configs = []
         for acl in acls:
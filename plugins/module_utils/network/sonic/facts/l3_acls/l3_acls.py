@@ -15,15 +15,12 @@ __metaclass__ = type
 
 from copy import deepcopy
 
-from ansible.module_utils.connection import ConnectionError
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import validate_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.l3_acls.l3_acls import L3_aclsArgs
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
-    to_request,
-    edit_config
-)
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.acl_utils import get_acl_sets
 
 IPV4_HOST_MASK = '/32'
 IPV6_HOST_MASK = '/128'
@@ -121,7 +118,7 @@ class L3_aclsFacts(object):
         ansible_facts['ansible_network_resources'].pop('l3_acls', None)
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_config(self.argument_spec, {'config': objs})
             facts['l3_acls'] = utils.remove_empties({'config': params['config']})['config']
 
         ansible_facts['ansible_network_resources'].update(facts)
@@ -219,18 +216,7 @@ class L3_aclsFacts(object):
 
     def get_l3_acls(self):
         """Get all l3 acl configurations available in chassis"""
-        acls_path = 'data/openconfig-acl:acl/acl-sets'
-        method = 'GET'
-        request = [{'path': acls_path, 'method': method}]
-
-        try:
-            response = edit_config(self._module, to_request(self._module, request))
-        except ConnectionError as exc:
-            self._module.fail_json(msg=str(exc), code=exc.code)
-
-        acls = []
-        if response[0][1].get('openconfig-acl:acl-sets'):
-            acls = response[0][1]['openconfig-acl:acl-sets'].get('acl-set', [])
+        acls = get_acl_sets(self._module, ('ipv4', 'ipv6'))
 
         ipv4_acls_configs = []
         ipv6_acls_configs = []
@@ -18,6 +18,7 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import validate_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.l3_interfaces.l3_interfaces import L3_interfacesArgs
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     to_request,
@@ -49,7 +50,8 @@ class L3_interfacesFacts(object):
     def get_l3_interfaces(self):
         url = "data/openconfig-interfaces:interfaces/interface"
         method = "GET"
-        request = [{"path": url, "method": method}]
+        request = [{"path": url, "method": method, "content": "config",
+                    "fields": ["name", "subinterfaces", "openconfig-vlan:routed-vlan"]}]
 
         try:
             response = edit_config(self._module, to_request(self._module, request))
@@ -142,7 +144,7 @@ class L3_interfacesFacts(object):
         ansible_facts['ansible_network_resources'].pop('l3_interfaces', None)
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_config(self.argument_spec, {'config': objs})
             facts['l3_interfaces'] = params['config']
 
         ansible_facts['ansible_network_resources'].update(facts)
@@ -17,6 +17,7 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import validate_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.lldp_global.lldp_global import Lldp_globalArgs
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     to_request,
@@ -62,7 +63,7 @@ class Lldp_globalFacts(object):
         ansible_facts['ansible_network_resources'].pop('lldp_global', None)
         facts = {}
         if obj:
-            params = utils.validate_config(self.argument_spec, {'config': obj})
+            params = validate_config(self.argument_spec, {'config': obj})
             facts['lldp_global'] = utils.remove_empties(params['config'])
 
         ansible_facts['ansible_network_resources'].update(facts)
@@ -18,6 +18,7 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import validate_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.lldp_interfaces.lldp_interfaces import Lldp_interfacesArgs
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     to_request,
@@ -82,7 +83,7 @@ class Lldp_interfacesFacts(object):
         ansible_facts['ansible_network_resources'].pop('lldp_interfaces', None)
         facts = {}
         if obj:
-            params = utils.validate_config(self.argument_spec, {'config': obj})
+            params = validate_config(self.argument_spec, {'config': obj})
             facts['lldp_interfaces'] = utils.remove_empties({'config': params['config']})['config']
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
@@ -18,6 +18,7 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import validate_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.logging.logging import LoggingArgs
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     to_request,
@@ -65,7 +66,7 @@ class LoggingFacts(object):
         ansible_facts['ansible_network_resources'].pop('logging', None)
         facts = {}
         if obj:
-            params = utils.validate_config(self.argument_spec, {'config': obj})
+            params = validate_config(self.argument_spec, {'config': obj})
             facts['logging'] = params['config']
 
         ansible_facts['ansible_network_resources'].update(facts)
@@ -18,6 +18,7 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import validate_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.login_lockout.login_lockout import Login_lockoutArgs
 
 
@@ -66,7 +67,7 @@ class Login_lockoutFacts(object):
         ansible_facts['ansible_network_resources'].pop('login_lockout', None)
         facts = {}
         if obj:
-            params = utils.validate_config(self.argument_spec, {'config': obj})
+            params = validate_config(self.argument_spec, {'config': obj})
             facts['login_lockout'] = utils.remove_empties(params['config'])
 
         ansible_facts['ansible_network_resources'].update(facts)
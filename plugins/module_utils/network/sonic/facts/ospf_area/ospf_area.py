@@ -14,17 +14,14 @@ __metaclass__ = type
 
 from copy import deepcopy
 
-from ansible.module_utils.connection import ConnectionError
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     remove_empties,
-    validate_config,
     generate_dict
 )
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic \
-    import to_request, edit_config
-
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import validate_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.bgp_utils import (
-    get_all_vrfs
+    get_all_vrfs,
+    get_network_instance_responses
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.ospf_area.ospf_area import Ospf_areaArgs
 
@@ -209,19 +206,14 @@ class Ospf_areaFacts(object):
         :rtype: dictionary
         :returns: dictionary of vrf name to their ospf settings
         '''
-        ospf_path = 'data/openconfig-network-instance:network-instances/network-instance={vrf}' + \
-            '/protocols/protocol=OSPF,ospfv2/ospfv2'
-        method = "GET"
+        network_instance_path = 'data/openconfig-network-instance:network-instances/network-instance'
+        ospf_path = 'protocols/protocol=OSPF,ospfv2/ospfv2'
 
         ospf_settings = {}
 
         vrf_list = get_all_vrfs(self._module)
-        for vrf in vrf_list:
-            request = {"path": ospf_path.format(vrf=vrf), "method": method}
-            try:
-                response = edit_config(self._module, to_request(self._module, request))
-            except ConnectionError as exc:
-                self._module.fail_json(msg=str(exc))
+        responses = get_network_instance_responses(self._module, vrf_list, [ospf_path], network_instance_path)
+        for vrf, response in zip(vrf_list, responses):
             try:
                 response_body = response[0][1].get("openconfig-network-instance:ospfv2", {})
             except Exception as exc:
@@ -18,18 +18,15 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import validate_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.ospfv2.ospfv2 import Ospfv2Args
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
-    to_request,
-    edit_config
-)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.bgp_utils import (
     get_all_vrfs,
+    get_network_instance_responses,
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     remove_empties_from_list
 )
-from ansible.module_utils.connection import ConnectionError
 
 
 network_instance_path = '/data/openconfig-network-instance:network-instances/network-instance'
@@ -78,7 +75,7 @@ class Ospfv2Facts(object):
         ansible_facts['ansible_network_resources'].pop('ospfv2', None)
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_config(self.argument_spec, {'config': objs})
             facts['ospfv2'] = remove_empties_from_list(params['config'])
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
@@ -99,15 +96,8 @@ class Ospfv2Facts(object):
         """Get all OSPFv2 configurations available in chassis"""
         ospf_configs = []
         vrfs = get_all_vrfs(module)
-        for vrf_name in vrfs:
-            all_ospf_path = '%s=%s/%s' % (network_instance_path, vrf_name, protocol_ospf_path)
-            request = [{"path": all_ospf_path, "method": "GET"}]
-
-            try:
-                response = edit_config(module, to_request(module, request))
-            except ConnectionError as exc:
-                module.fail_json(msg=str(exc), code=exc.code)
-
+        responses = get_network_instance_responses(module, vrfs, [protocol_ospf_path], network_instance_path)
+        for vrf_name, response in zip(vrfs, responses):
             if 'openconfig-network-instance:ospfv2' in response[0][1]:
                 ospf_dict = {}
                 ospf_global = response[0][1]['openconfig-network-instance:ospfv2'].get('global', {})
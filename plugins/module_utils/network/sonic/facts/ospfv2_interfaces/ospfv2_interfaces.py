@@ -18,6 +18,7 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import validate_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.ospfv2_interfaces.ospfv2_interfaces import Ospfv2_interfacesArgs
 
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
@@ -73,7 +74,7 @@ class Ospfv2_interfacesFacts(object):
         ansible_facts['ansible_network_resources'].pop('ospfv2_interfaces', None)
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_config(self.argument_spec, {'config': objs})
             facts['ospfv2_interfaces'] = remove_empties_from_list(params['config'])
 
         ansible_facts['ansible_network_resources'].update(facts)
@@ -93,7 +94,7 @@ class Ospfv2_interfacesFacts(object):
 
     def get_ospfv2_interfaces(self):
         """Get all OSPFv2 interfaces available in chassis"""
-        request = [{"path": "data/openconfig-interfaces:interfaces", "method": "GET"}]
+        request = [{"path": "data/openconfig-interfaces:interfaces", "method": "GET", "content": "config"}]
 
         try:
             response = edit_config(self._module, to_request(self._module, request))
@@ -20,6 +20,7 @@ from ansible.module_utils.connection import ConnectionError
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import validate_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.pki.pki import (
     PkiArgs,
 )
@@ -111,7 +112,7 @@ class PkiFacts(object):
         ansible_facts["ansible_network_resources"].pop("pki", None)
         facts = {}
         if objs:
-            params = utils.validate_config(
+            params = validate_config(
                 self.argument_spec, {"config": objs}
             )
             facts["pki"] = params["config"]
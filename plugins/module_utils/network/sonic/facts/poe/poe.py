@@ -17,6 +17,7 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import validate_config
 from ansible.module_utils.connection import ConnectionError
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.poe.poe import PoeArgs
 
@@ -64,7 +65,7 @@ class PoeFacts(object):
             # using mock data instead
             data = self.get_poe_info()
 
-        cleaned_data = utils.remove_empties(utils.validate_config(self.argument_spec, {"config": data})["config"])
+        cleaned_data = utils.remove_empties(validate_config(self.argument_spec, {"config": data})["config"])
 
         ansible_facts['ansible_network_resources'].pop('poe', None)
         facts = {}
@@ -152,7 +153,7 @@ class PoeFacts(object):
     def get_poe_info(self):
         # get poe settings
         try:
-            request = [{"path": "data/openconfig-poe:poe", "method": "GET"}]
+            request = [{"path": "data/openconfig-poe:poe", "method": "GET", "content": "config"}]
             response = edit_config(self._module, to_request(self._module, request))
         except ConnectionError as exc:
             self._module.fail_json(msg=str(exc))
@@ -162,7 +163,7 @@ class PoeFacts(object):
 
         # get poe interface settings
         try:
-            request = [{"path": "data/openconfig-interfaces:interfaces", "method": "GET"}]
+            request = [{"path": "data/openconfig-interfaces:interfaces", "method": "GET", "content": "config"}]
             response = edit_config(self._module, to_request(self._module, request))
         except ConnectionError as exc:
             self._module.fail_json(msg=str(exc))
@@ -16,13 +16,14 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import validate_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.port_breakout.port_breakout import Port_breakoutArgs
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     to_request,
     edit_config
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
-    get_breakout_mode,
+    get_breakout_modes,
 )
 from ansible.module_utils.connection import ConnectionError
 
@@ -75,7 +76,7 @@ class Port_breakoutFacts(object):
         facts = {}
         if objs:
             facts['port_breakout'] = []
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_config(self.argument_spec, {'config': objs})
             if params:
                 facts['port_breakout'].extend(params['config'])
         ansible_facts['ansible_network_resources'].update(facts)
@@ -113,10 +114,11 @@ class Port_breakoutFacts(object):
             if name and mode:
                 if '[' in mode:
                     mode = mode[:mode.index('[')]
-                norm_port_breakout = {'name': name, 'mode': mode}
-                mode = get_breakout_mode(self._module, name)
-                if mode:
-                    norm_port_breakout['mode'] = mode
-                port_breakout_list.append(norm_port_breakout)
+                port_breakout_list.append({'name': name, 'mode': mode})
+
+        modes = get_breakout_modes(self._module, [port_breakout['name'] for port_breakout in port_breakout_list])
+        for port_breakout in port_breakout_list:
+            if modes[port_breakout['name']]:
+                port_breakout['mode'] = modes[port_breakout['name']]
 
         return port_breakout_list
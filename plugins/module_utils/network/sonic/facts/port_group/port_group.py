@@ -18,6 +18,7 @@ import warnings
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import validate_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.port_group.port_group import Port_groupArgs
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     to_request,
@@ -71,7 +72,7 @@ class Port_groupFacts(object):
         facts = {}
         if objs:
             facts['port_group'] = []
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_config(self.argument_spec, {'config': objs})
             if params:
                 facts['port_group'].extend(params['config'])
         ansible_facts['ansible_network_resources'].update(facts)
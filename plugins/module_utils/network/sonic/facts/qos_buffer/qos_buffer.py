@@ -16,6 +16,8 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import validate_config
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.qos_utils import get_qos_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     remove_empties
 )
@@ -60,7 +62,7 @@ class Qos_bufferFacts(object):
         objs = data
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_config(self.argument_spec, {'config': objs})
             facts['qos_buffer'] = remove_empties(params['config'])
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
@@ -89,8 +91,7 @@ class Qos_bufferFacts(object):
         else:
             config_dict['buffer_init'] = False
 
-        path = '/data/openconfig-qos:qos/openconfig-qos-buffer:buffer'
-        oc_cfg = self.get_config(module, path, 'openconfig-qos-buffer:buffer')
+        oc_cfg = get_qos_config(module, 'openconfig-qos-buffer:buffer', 'openconfig-qos-buffer:buffer')
         if oc_cfg:
             buffer_pools = oc_cfg.get('buffer-pools')
             if buffer_pools:
@@ -17,17 +17,12 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
-from ansible.module_utils.connection import ConnectionError
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import validate_config
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.qos_utils import get_qos_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     remove_empties_from_list
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.qos_interfaces.qos_interfaces import Qos_interfacesArgs
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
-    to_request,
-    edit_config
-)
-
-QOS_PATH = '/data/openconfig-qos:qos'
 
 
 class Qos_interfacesFacts(object):
@@ -63,7 +58,7 @@ class Qos_interfacesFacts(object):
             data = self.update_qos_interfaces(self._module)
         objs = data
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_config(self.argument_spec, {'config': objs})
             facts['qos_interfaces'] = remove_empties_from_list(params['config'])
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
@@ -180,15 +175,4 @@ class Qos_interfacesFacts(object):
         return config_list
 
     def get_config(self, module, path, list_name):
-        cfg = None
-        get_path = '%s/%s' % (QOS_PATH, path)
-        request = {'path': get_path, 'method': 'get'}
-
-        try:
-            response = edit_config(module, to_request(module, request))
-            if list_name in response[0][1]:
-                cfg = response[0][1].get(list_name)
-        except ConnectionError as exc:
-            module.fail_json(msg=str(exc), code=exc.code)
-
-        return cfg
+        return get_qos_config(module, path, list_name)
@@ -17,17 +17,12 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
-from ansible.module_utils.connection import ConnectionError
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import validate_config
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.qos_utils import get_qos_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     remove_empties
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.qos_maps.qos_maps import Qos_mapsArgs
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
-    to_request,
-    edit_config
-)
-
-QOS_PATH = '/data/openconfig-qos:qos'
 
 
 class Qos_mapsFacts(object):
@@ -63,7 +58,7 @@ class Qos_mapsFacts(object):
         objs = data
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_config(self.argument_spec, {'config': objs})
             facts['qos_maps'] = remove_empties(params['config'])
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
@@ -129,18 +124,7 @@ class Qos_mapsFacts(object):
         return config_dict
 
     def get_config(self, module, map_path):
-        cfg = None
-        get_path = '%s/%s' % (QOS_PATH, map_path)
-        request = {'path': get_path, 'method': 'get'}
-
-        try:
-            response = edit_config(module, to_request(module, request))
-            if map_path in response[0][1]:
-                cfg = response[0][1].get(map_path)
-        except ConnectionError as exc:
-            module.fail_json(msg=str(exc), code=exc.code)
-
-        return cfg
+        return get_qos_config(module, map_path, map_path)
 
     def update_config(self, maps_cfg, lookup_dict, config_dict):
         """
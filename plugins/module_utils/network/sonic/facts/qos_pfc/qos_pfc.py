@@ -14,18 +14,15 @@ __metaclass__ = type
 
 from copy import deepcopy
 
-from ansible.module_utils.connection import ConnectionError
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import validate_config
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.qos_utils import get_qos_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     remove_empties
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.qos_pfc.qos_pfc import Qos_pfcArgs
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
-    to_request,
-    edit_config
-)
 
 
 class Qos_pfcFacts(object):
@@ -62,7 +59,7 @@ class Qos_pfcFacts(object):
         objs = self.render_config(self.generated_spec, data)
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_config(self.argument_spec, {'config': objs})
             facts['qos_pfc'] = remove_empties(params['config'])
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
@@ -80,18 +77,7 @@ class Qos_pfcFacts(object):
         return conf
 
     def get_config(self, module):
-        cfg = None
-        get_path = '/data/openconfig-qos:qos/pfc-watchdog'
-        request = {'path': get_path, 'method': 'get'}
-
-        try:
-            response = edit_config(module, to_request(module, request))
-            if 'openconfig-qos:pfc-watchdog' in response[0][1]:
-                cfg = response[0][1].get('openconfig-qos:pfc-watchdog')
-        except ConnectionError as exc:
-            module.fail_json(msg=str(exc), code=exc.code)
-
-        return cfg
+        return get_qos_config(module, 'pfc-watchdog', 'openconfig-qos:pfc-watchdog')
 
     def update_qos_pfc(self, cfg):
         config_dict = {}
@@ -14,18 +14,15 @@ __metaclass__ = type
 
 from copy import deepcopy
 
-from ansible.module_utils.connection import ConnectionError
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import validate_config
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.qos_utils import get_qos_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     remove_empties_from_list
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.qos_scheduler.qos_scheduler import Qos_schedulerArgs
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
-    to_request,
-    edit_config
-)
 
 
 class Qos_schedulerFacts(object):
@@ -62,7 +59,7 @@ class Qos_schedulerFacts(object):
         objs = self.render_config(self.generated_spec, data)
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_config(self.argument_spec, {'config': objs})
             facts['qos_scheduler'] = remove_empties_from_list(params['config'])
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
@@ -80,18 +77,7 @@ class Qos_schedulerFacts(object):
         return conf
 
     def get_config(self, module):
-        cfg = None
-        get_path = '/data/openconfig-qos:qos/scheduler-policies'
-        request = {'path': get_path, 'method': 'get'}
-
-        try:
-            response = edit_config(module, to_request(module, request))
-            if 'openconfig-qos:scheduler-policies' in response[0][1]:
-                cfg = response[0][1].get('openconfig-qos:scheduler-policies')
-        except ConnectionError as exc:
-            module.fail_json(msg=str(exc), code=exc.code)
-
-        return cfg
+        return get_qos_config(module, 'scheduler-policies', 'openconfig-qos:scheduler-policies')
 
     def update_qos_scheduler(self, cfg):
 
@@ -17,15 +17,12 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
-from ansible.module_utils.connection import ConnectionError
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import validate_config
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.qos_utils import get_qos_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     remove_empties_from_list
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.qos_wred.qos_wred import Qos_wredArgs
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
-    to_request,
-    edit_config
-)
 
 
 class Qos_wredFacts(object):
@@ -62,7 +59,7 @@ class Qos_wredFacts(object):
         objs = data
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_config(self.argument_spec, {'config': objs})
             facts['qos_wred'] = remove_empties_from_list(params['config'])
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
@@ -106,14 +103,4 @@ class Qos_wredFacts(object):
         return config_list
 
     def get_config(self, module):
-        cfg = None
-        get_path = '/data/openconfig-qos:qos/wred-profiles'
-        request = {'path': get_path, 'method': 'get'}
-
-        try:
-            response = edit_config(module, to_request(module, request))
-            if 'openconfig-qos:wred-profiles' in response[0][1]:
-                cfg = response[0][1].get('openconfig-qos:wred-profiles', None)
-        except ConnectionError as exc:
-            module.fail_json(msg=str(exc), code=exc.code)
-        return cfg
+        return get_qos_config(module, 'wred-profiles', 'openconfig-qos:wred-profiles')
@@ -17,6 +17,7 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import validate_config
 from ansible.module_utils.connection import ConnectionError
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.sflow.sflow import SflowArgs
 
@@ -62,7 +63,7 @@ class SflowFacts(object):
             # validate can add null values for things missing from device config,
             #   so doing that before remove empties
             cleaned_data = utils.remove_empties(
-                utils.validate_config(self.argument_spec, data)
+                validate_config(self.argument_spec, data)
             )
             if cleaned_data:
                 facts["sflow"] = cleaned_data["config"]
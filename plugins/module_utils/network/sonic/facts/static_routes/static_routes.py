@@ -15,20 +15,17 @@ __metaclass__ = type
 
 from copy import deepcopy
 
-from ansible.module_utils.connection import ConnectionError
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import validate_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     remove_empties_from_list
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.static_routes.static_routes import Static_routesArgs
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
-    to_request,
-    edit_config
-)
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.bgp_utils import (
     get_all_vrfs,
+    get_network_instance_responses,
 )
 
 network_instance_path = '/data/openconfig-network-instance:network-instances/network-instance'
@@ -69,7 +66,7 @@ class Static_routesFacts(object):
         objs = data
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_config(self.argument_spec, {'config': objs})
             facts['static_routes'] = remove_empties_from_list(params['config'])
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
@@ -77,13 +74,8 @@ class Static_routesFacts(object):
     def get_static_routes(self, module):
         all_static_routes = []
         vrfs = get_all_vrfs(module)
-        for vrf_name in vrfs:
-            get_path = '%s=%s/%s' % (network_instance_path, vrf_name, protocol_static_routes_path)
-            request = {'path': get_path, 'method': 'get'}
-            try:
-                response = edit_config(module, to_request(module, request))
-            except ConnectionError as exc:
-                module.fail_json(msg=str(exc), code=exc.code)
+        responses = get_network_instance_responses(module, vrfs, [protocol_static_routes_path], network_instance_path)
+        for vrf_name, response in zip(vrfs, responses):
             for resp in response:
                 if 'openconfig-network-instance:static-routes' in resp[1]:
                     static_routes_dict = resp[1].get('openconfig-network-instance:static-routes', {})
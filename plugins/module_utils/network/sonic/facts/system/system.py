@@ -16,6 +16,7 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import validate_config
 
 from ansible.module_utils.connection import ConnectionError
 
@@ -167,7 +168,7 @@ class SystemFacts(object):
         objs = self.render_config(self.generated_spec, data)
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_config(self.argument_spec, {'config': objs})
             facts['system'] = utils.remove_empties(params['config'])
         ansible_facts['ansible_network_resources'].update(facts)
         return ansible_facts
@@ -19,7 +19,9 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import validate_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
+    get_connection_option,
     to_request,
     edit_config
 )
@@ -73,7 +75,7 @@ class Vlan_mappingFacts(object):
         ansible_facts['ansible_network_resources'].pop('vlan_mapping', None)
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_config(self.argument_spec, {'config': objs})
             facts['vlan_mapping'] = params['config']
 
         ansible_facts['ansible_network_resources'].update(facts)
@@ -100,11 +102,9 @@ class Vlan_mappingFacts(object):
         interfaces = self.get_ports() + self.get_portchannels()
 
         vlan_mapping_configs = {}
-        for interface in interfaces:
-            response = self.get_port_mappings(interface)
-
-            if "openconfig-interfaces-ext:mapped-vlans" in response:
-                vlan_list = response["openconfig-interfaces-ext:mapped-vlans"].get("mapped-vlan", {})
+        for interface, mapped_vlans in zip(interfaces, self.get_all_port_mappings(interfaces)):
+            if mapped_vlans:
+                vlan_list = mapped_vlans.get("mapped-vlan", {})
                 for vlan_mapping in vlan_list:
                     vlan_mapping_dict = {}
 
@@ -188,22 +188,57 @@ class Vlan_mappingFacts(object):
 
         return vlan_mapping_configs
 
-    def get_port_mappings(self, interface):
-        """Get a ports vlan mappings from device"""
-        ifname = interface["ifname"]
-        if '/' in ifname:
-            ifname = ifname.replace('/', '%2F')
+    def get_all_port_mappings(self, interfaces):
+        """Get the mapped-vlans container of each interface from device,
+        None for an interface without vlan mappings
+        """
+        mappings = None
+        if interfaces and get_connection_option(self._module, 'bulk_vlan_mapping'):
+            mappings = self.get_bulk_port_mappings(interfaces)
+        if mappings is None:
+            mappings = self.get_port_mappings(interfaces)
+        return mappings
+
+    def get_bulk_port_mappings(self, interfaces):
+        """Get the vlan mappings of all the interfaces with a single request,
+        None if the device rejects the request or does not return the names
+        of the interfaces
+        """
+        request = {"path": "data/openconfig-interfaces:interfaces", "method": "GET",
+                   "fields": "interface(name;openconfig-interfaces-ext:mapped-vlans)"}
+        try:
+            response = edit_config(self._module, to_request(self._module, request))
+        except ConnectionError:
+            return None
+
+        mappings = {}
+        if response and response[0][1]:
+            for interface in response[0][1].get("openconfig-interfaces:interfaces", {}).get("interface", []):
+                if "openconfig-interfaces-ext:mapped-vlans" in interface:
+                    if "name" not in interface:
+                        # The mappings can not be attributed to their interface.
+                        return None
+                    mappings[interface["name"]] = interface["openconfig-interfaces-ext:mapped-vlans"]
+
+        return [mappings.get(interface["ifname"]) for interface in interfaces]
+
+    def get_port_mappings(self, interfaces):
+        """Get the vlan mappings of the interfaces from device, requested for
+        each interface in a single request list
+        """
+        if not interfaces:
+            return []
 
-        port_mappings = "data/openconfig-interfaces:interfaces/interface=%s/openconfig-interfaces-ext:mapped-vlans" % ifname
+        port_mappings = "data/openconfig-interfaces:interfaces/interface=%s/openconfig-interfaces-ext:mapped-vlans"
         method = "GET"
-        request = [{"path": port_mappings, "method": method}]
+        requests = [{"path": port_mappings % interface["ifname"].replace('/', '%2F'), "method": method} for interface in interfaces]
 
         try:
-            response = edit_config(self._module, to_request(self._module, request))
+            responses = edit_config(self._module, to_request(self._module, requests))
         except ConnectionError as exc:
             self._module.fail_json(msg=str(exc), code=exc.code)
 
-        return response[0][1]
+        return [response[1].get("openconfig-interfaces-ext:mapped-vlans") if response[1] else None for response in responses]
 
     def get_ports(self):
         """Get all port names on device"""
@@ -18,6 +18,7 @@ from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import validate_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.vlans.vlans import VlansArgs
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     to_request,
@@ -67,7 +68,7 @@ class VlansFacts(object):
         ansible_facts['ansible_network_resources'].pop('vlans', None)
         facts = {}
         if objs:
-            params = utils.validate_config(self.argument_spec, {'config': objs})
+            params = validate_config(self.argument_spec, {'config': objs})
             facts['vlans'] = params['config']
 
         ansible_facts['ansible_network_resources'].update(facts)
@@ -95,7 +96,7 @@ class VlansFacts(object):
 
     def get_vlans(self):
         """Get all the l2_interfaces available in chassis"""
-        request = [{"path": "data/openconfig-interfaces:interfaces", "method": GET}]
+        request = [{"path": "data/openconfig-interfaces:interfaces", "method": GET, "content": "config"}]
         try:
             response = edit_config(self._module, to_request(self._module, request))
         except ConnectionError as exc:
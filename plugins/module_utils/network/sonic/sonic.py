@@ -39,6 +39,14 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
 )
 from ansible.module_utils.connection import Connection, ConnectionError
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.config import NetworkConfig, ConfigLine
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.request_optimizer import optimize_requests
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.request_batcher import get_request_batcher
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.snapshot import get_device_snapshot
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.timings import (
+    get_active_timings,
+    start_timings,
+    timed_phase
+)
 
 _DEVICE_CONFIGS = {}
 STANDARD_ETH_REGEXP = r"(Eth\d+(/\d+)+)"
@@ -69,6 +77,24 @@ def get_capabilities(module):
     return module._sonic_capabilities
 
 
+def get_connection_option(module, option):
+    """Return the value of a connection plugin option which is applied on
+    the module side, or None if the module does not run over a persistent
+    connection
+    """
+    if not module._socket_path:
+        return None
+    return get_capabilities(module).get('options', {}).get(option)
+
+
+def init_timings(module):
+    """Start the timings of the module run if they are enabled with the
+    'timings' connection option
+    """
+    if get_active_timings() is None and get_connection_option(module, 'timings'):
+        start_timings(module, get_connection(module), get_connection_option(module, 'timings_file'))
+
+
 def get_config(module, flags=None):
     flags = to_list(flags)
     flag_str = " ".join(flags)
@@ -135,6 +161,43 @@ def edit_config(module, commands, skip_code=None, suppr_ntf_excp=True):
             if url:
                 request["path"] = update_url(url)
     # End
+    if get_connection_option(module, 'coalesce_requests'):
+        commands = optimize_requests(commands)
+    init_timings(module)
+    is_get = all(isinstance(request, dict) and (request.get('method') or '').lower() == 'get' for request in commands)
+    snapshot = get_device_snapshot(module)
+    if snapshot is None:
+        return send_requests(module, connection, commands, is_get, suppr_ntf_excp)
+    if not is_get:
+        snapshot.clear()
+        return send_requests(module, connection, commands, is_get, suppr_ntf_excp)
+
+    # Serve the GET requests from the device snapshot of the facts gathering
+    # and send only the requests which are not in it yet.
+    responses = [None if command.get('stream') else snapshot.get(command, suppr_ntf_excp) for command in commands]
+    missing_commands = [command for command, response in zip(commands, responses) if response is None]
+    if missing_commands:
+        missing_responses = iter(send_requests(module, connection, missing_commands, is_get, suppr_ntf_excp))
+        for index, command in enumerate(commands):
+            if responses[index] is None:
+                responses[index] = next(missing_responses)
+                if not command.get('stream'):
+                    snapshot.set(command, responses[index], suppr_ntf_excp)
+    return responses
+
+
+def send_requests(module, connection, commands, is_get, suppr_ntf_excp=True):
+    with timed_phase('facts_fetch' if is_get else 'commit'):
+        page_size = get_connection_option(module, 'stream_page_size')
+        if page_size and is_get and any(request.get('stream') for request in commands):
+            return get_streamed_responses(connection, commands, page_size, suppr_ntf_excp)
+        batcher = get_request_batcher(module)
+        if batcher is not None and is_get:
+            return batcher.submit(commands, suppr_ntf_excp)
+        return send_edit_config(connection, commands, suppr_ntf_excp)
+
+
+def send_edit_config(connection, commands, suppr_ntf_excp=True):
     if suppr_ntf_excp:
         # Default: not used for cliconf
         return connection.edit_config(commands)
@@ -142,7 +205,45 @@ def edit_config(module, commands, skip_code=None, suppr_ntf_excp=True):
         return connection.edit_config(commands, suppr_ntf_excp)
 
 
+def get_streamed_responses(connection, commands, page_size, suppr_ntf_excp=True):
+    """Return the responses of a list of GET requests. For a request with
+    a 'stream' path of keys, only the list at that path is returned, as an
+    iterator which reads the list entries from the connection page by page.
+    """
+    other_commands = [command for command in commands if not command.get('stream')]
+    other_responses = iter(send_edit_config(connection, other_commands, suppr_ntf_excp) if other_commands else [])
+    responses = []
+    for command in commands:
+        if not command.get('stream'):
+            responses.append(next(other_responses))
+            continue
+
+        code, handle = connection.open_stream(command, page_size, suppr_ntf_excp)
+        data = iter_stream(connection, handle, page_size) if handle else iter([])
+        for key in reversed(command['stream']):
+            data = {key: data}
+        responses.append([code, data])
+    return responses
+
+
+def iter_stream(connection, handle, page_size):
+    """Return an iterator of the list entries of a stream opened in the
+    connection
+    """
+    while True:
+        with timed_phase('facts_fetch'):
+            page = connection.read_stream(handle)
+        for entry in page:
+            yield entry
+        if len(page) < page_size:
+            return
+
+
 def edit_config_reboot(module, commands, skip_code=None):
+    """Send the requests, waiting for the device to become ready again if
+    they cause it to reboot, and return the downtime in seconds, or None if
+    the device did not reboot
+    """
     connection = get_connection(module)
 
     # Start: This is to convert interface name from Eth1/1 to Eth1%2f1
@@ -153,7 +254,9 @@ def edit_config_reboot(module, commands, skip_code=None):
             if url:
                 request["path"] = update_url(url)
     # End
-    connection.edit_config_reboot(commands)
+    init_timings(module)
+    with timed_phase('commit'):
+        return connection.edit_config_reboot(commands)
 
 
 def update_url(url):
@@ -168,5 +271,7 @@ def update_url(url):
 
 
 def to_request(module, requests):
-    transform = ComplexList(dict(path=dict(key=True), method=dict(), data=dict(type='dict')), module)
+    transform = ComplexList(dict(path=dict(key=True), method=dict(), data=dict(type='dict'),
+                                 depth=dict(type='int'), fields=dict(type='raw'), content=dict(),
+                                 stream=dict(type='list'), cache=dict(type='raw')), module)
     return transform(to_list(requests))
@@ -0,0 +1,100 @@
+#
+# -*- coding: utf-8 -*-
+# Copyright 2025 Dell Inc. or its subsidiaries. All Rights Reserved
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# acl_utils
+
+"""
+The ACL configuration requested by the facts classes of the l2_acls,
+l3_acls and acl_interfaces modules. The ACL sets of all the types are
+requested once and split by type in a single pass. Within a facts gathering,
+the sets of the other types are kept in the device snapshot for the facts
+classes of the other ACL resources.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
+    to_request,
+    edit_config
+)
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.snapshot import get_device_snapshot
+from ansible.module_utils.connection import ConnectionError
+
+ACL_SETS_PATH = 'data/openconfig-acl:acl/acl-sets'
+ACL_INTERFACES_PATH = 'data/openconfig-acl:acl/interfaces'
+GET = 'GET'
+
+ACL_SET_TYPES = {
+    'ACL_L2': 'mac',
+    'openconfig-acl:ACL_L2': 'mac',
+    'ACL_IPV4': 'ipv4',
+    'openconfig-acl:ACL_IPV4': 'ipv4',
+    'ACL_IPV6': 'ipv6',
+    'openconfig-acl:ACL_IPV6': 'ipv6'
+}
+
+
+def get_acl_sets(module, acl_types):
+    """Return the ACL sets of a type ('mac', 'ipv4' or 'ipv6'), or of a
+    tuple of types, configured on the device. The sets are in the order of
+    the types, then in the order of the device.
+    """
+    if isinstance(acl_types, str):
+        acl_types = (acl_types,)
+
+    snapshot = get_device_snapshot(module)
+    if snapshot is not None:
+        views = [snapshot.pop_view('acl_sets:' + acl_type) for acl_type in acl_types]
+        if all(view is not None for view in views):
+            return [acl for view in views for acl in view]
+
+    all_acl_sets = split_acl_sets(get_all_acl_sets(module))
+    if snapshot is not None:
+        for other_type, acl_sets in all_acl_sets.items():
+            if other_type not in acl_types:
+                snapshot.set_view('acl_sets:' + other_type, acl_sets)
+    return [acl for acl_type in acl_types for acl in all_acl_sets[acl_type]]
+
+
+def get_all_acl_sets(module):
+    """Get the ACL sets of all the types configured on the device"""
+    request = [{'path': ACL_SETS_PATH, 'method': GET, 'content': 'config',
+                'stream': ['openconfig-acl:acl-sets', 'acl-set']}]
+    try:
+        response = edit_config(module, to_request(module, request))
+    except ConnectionError as exc:
+        module.fail_json(msg=str(exc), code=exc.code)
+
+    if response[0][1].get('openconfig-acl:acl-sets'):
+        return response[0][1]['openconfig-acl:acl-sets'].get('acl-set', [])
+    return []
+
+
+def split_acl_sets(acls):
+    """Split a list of ACL sets by type, ACL sets of other types are
+    dropped
+    """
+    acl_sets = {'mac': [], 'ipv4': [], 'ipv6': []}
+    for acl in acls:
+        acl_type = ACL_SET_TYPES.get(acl['config'].get('type'))
+        if acl_type:
+            acl_sets[acl_type].append(acl)
+    return acl_sets
+
+
+def get_acl_bindings(module):
+    """Get the ACL bindings of the interfaces configured on the device"""
+    request = [{'path': ACL_INTERFACES_PATH, 'method': GET, 'content': 'config'}]
+    try:
+        response = edit_config(module, to_request(module, request))
+    except ConnectionError as exc:
+        module.fail_json(msg=str(exc), code=exc.code)
+
+    if response[0][1].get('openconfig-acl:interfaces'):
+        return response[0][1]['openconfig-acl:interfaces'].get('interface', [])
+    return []
@@ -0,0 +1,190 @@
+#
+# -*- coding: utf-8 -*-
+# Copyright 2025 Dell Inc. or its subsidiaries. All Rights Reserved
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# argspec_validator
+
+"""
+Validation of the facts rendered from the device configuration. The
+argument specs of the resource modules are compiled once per process into
+functions which only apply the type conversions and the default values of
+the options. The data rendered by the facts classes is trusted, the
+relations between the options (mutually_exclusive, required_together, ...)
+are not checked. Any data which the compiled function can not handle
+exactly like AnsibleModule (unsupported options, invalid choices,
+conversion errors, ...) is validated by the generic validator of
+ansible.netcommon, so the result is the same.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from contextlib import contextmanager
+from copy import deepcopy
+
+from ansible.module_utils.common.parameters import DEFAULT_TYPE_VALIDATORS
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
+    utils,
+)
+
+# Keys of an option spec supported by the compiled validators. The
+# relations between sub-options are not checked for trusted data.
+SUPPORTED_OPTION_KEYS = frozenset((
+    'type', 'elements', 'options', 'default', 'choices', 'required', 'no_log',
+    'mutually_exclusive', 'required_together', 'required_one_of', 'required_if', 'required_by'
+))
+
+_COMPILED_SPECS = {}
+_TRUSTED_VALIDATION = True
+
+
+class FallbackRequired(Exception):
+    """Raised by a compiled validator for data which must be validated by the
+    generic validator
+    """
+
+
+def compile_argspec(argument_spec):
+    """Return a function which validates data against an argument spec like
+    AnsibleModule, or None if the argument spec is not supported
+    """
+    try:
+        return _compile_options(argument_spec)
+    except FallbackRequired:
+        return None
+
+
+def get_compiled_argspec(argument_spec):
+    """Return the compiled validator of an argument spec, compiling it on
+    first use
+    """
+    # The argument specs are class attributes, the spec is kept in the cache
+    # so that its id is not reused.
+    cached = _COMPILED_SPECS.get(id(argument_spec))
+    if cached is None or cached[0] is not argument_spec:
+        cached = (argument_spec, compile_argspec(argument_spec))
+        _COMPILED_SPECS[id(argument_spec)] = cached
+    return cached[1]
+
+
+def validate_config(argument_spec, data):
+    """Validate the data rendered by a facts class against the argument spec
+    of its module. Same as validate_config() of ansible.netcommon.
+    """
+    if _TRUSTED_VALIDATION:
+        validate = get_compiled_argspec(argument_spec)
+        if validate is not None:
+            try:
+                return validate(data)
+            except (FallbackRequired, TypeError, ValueError):
+                pass
+    return utils.validate_config(argument_spec, data)
+
+
+@contextmanager
+def trusted_validation(enabled=True):
+    """Enable or disable the compiled validators within the context"""
+    global _TRUSTED_VALIDATION
+
+    previous = _TRUSTED_VALIDATION
+    _TRUSTED_VALIDATION = enabled
+    try:
+        yield
+    finally:
+        _TRUSTED_VALIDATION = previous
+
+
+def _compile_options(argument_spec):
+    options = []
+    for name, option_spec in argument_spec.items():
+        if not SUPPORTED_OPTION_KEYS.issuperset(option_spec):
+            raise FallbackRequired(name)
+        wanted = option_spec.get('type') or 'str'
+        elements = option_spec.get('elements')
+        sub_spec = option_spec.get('options')
+        validate_options = None
+        if sub_spec is not None and (wanted == 'dict' or (wanted == 'list' and elements == 'dict')):
+            validate_options = _compile_options(sub_spec)
+
+        if wanted == 'list':
+            convert_element = _get_converter(elements, validate_options is not None) if elements else deepcopy
+            convert = _get_list_converter(convert_element)
+        elif elements:
+            raise FallbackRequired(name)
+        else:
+            convert = _get_converter(wanted, validate_options is not None)
+
+        choices = option_spec.get('choices')
+        if choices is not None and not isinstance(choices, (list, tuple, set, frozenset)):
+            raise FallbackRequired(name)
+        options.append((name, convert, option_spec.get('default'), choices, option_spec.get('required', False),
+                        validate_options, wanted == 'list'))
+
+    names = frozenset(argument_spec)
+
+    def validate(parameters):
+        if not isinstance(parameters, dict) or not names.issuperset(parameters):
+            raise FallbackRequired()
+
+        # Like AnsibleModule, the options keep the order of the data and the
+        # missing options are added with their default value first.
+        result = dict(parameters)
+        missing = []
+        for name, convert, default, choices, required, validate_options, is_list in options:
+            if name in parameters:
+                value = parameters[name]
+                if value is None:
+                    if default is not None or required or (choices is not None and None not in choices):
+                        raise FallbackRequired(name)
+                    continue
+            elif default is not None:
+                value = deepcopy(default)
+            elif required:
+                raise FallbackRequired(name)
+            else:
+                missing.append(name)
+                continue
+
+            value = convert(value)
+            if choices is not None:
+                if is_list:
+                    if any(item not in choices for item in value):
+                        raise FallbackRequired(name)
+                elif value not in choices:
+                    raise FallbackRequired(name)
+            if validate_options is not None:
+                value = [validate_options(item) for item in value] if is_list else validate_options(value)
+            result[name] = value
+
+        for name in missing:
+            result[name] = None
+        return result
+
+    return validate
+
+
+def _get_converter(wanted, has_options=False):
+    try:
+        check = DEFAULT_TYPE_VALIDATORS[wanted]
+    except (KeyError, TypeError):
+        # Custom type checkers are not supported
+        raise FallbackRequired(wanted)
+
+    if wanted == 'str':
+        return lambda value: value if type(value) is str else check(value)
+    if wanted == 'int':
+        return lambda value: value if isinstance(value, int) else check(value)
+    if wanted == 'bool':
+        return lambda value: value if isinstance(value, bool) else check(value)
+    if wanted == 'dict' and has_options:
+        # The options of the dict are copied by their own validator.
+        return check
+    return lambda value: deepcopy(check(value))
+
+
+def _get_list_converter(convert_element):
+    check = DEFAULT_TYPE_VALIDATORS['list']
+    return lambda value: [convert_element(item) for item in check(value)]
@@ -15,9 +15,11 @@ __metaclass__ = type
 
 
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
+    get_subtree_response,
     normalize_interface_name,
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
+    get_connection_option,
     to_request,
     edit_config
 )
@@ -43,6 +45,13 @@ GET = "get"
 network_instance_path = '/data/openconfig-network-instance:network-instances/network-instance'
 protocol_bgp_path = 'protocols/protocol=BGP,bgp/bgp'
 
+# Paths of the configuration changing the list of VRFs. The list of VRFs is
+# cached by the connection until a request changes one of them.
+VRF_LIST_CACHE_PATHS = [
+    'data/sonic-vrf:sonic-vrf/VRF/VRF_LIST=*',
+    'data/openconfig-network-instance:network-instances/network-instance=*'
+]
+
 
 def to_bgp_as_notation_request_type(as_notation):
     """Convert as_notation types to Openconfig As-dot enums"""
@@ -221,7 +230,7 @@ def get_all_vrfs(module):
     """Get all VRF configurations available in chassis"""
     all_vrfs = []
     ret = []
-    request = {"path": "data/sonic-vrf:sonic-vrf/VRF/VRF_LIST", "method": GET}
+    request = {"path": "data/sonic-vrf:sonic-vrf/VRF/VRF_LIST", "method": GET, "cache": VRF_LIST_CACHE_PATHS}
     try:
         response = edit_config(module, to_request(module, request))
     except ConnectionError as exc:
@@ -236,16 +245,85 @@ def get_all_vrfs(module):
     return all_vrfs
 
 
-def get_peergroups(module, vrf_name):
-    peer_groups = []
-    request_path = '%s=%s/protocols/protocol=BGP,bgp/bgp/peer-groups' % (network_instance_path, vrf_name)
-    request = {"path": request_path, "method": GET}
+def get_network_instance_responses(module, vrfs, subpaths, base_path=network_instance_path):
+    """Get subtrees of the network instances of a list of VRFs. Return for
+    each VRF the list of the GET responses of the subtree paths, as if each
+    subtree of each VRF was requested separately. With the
+    'bulk_network_instances' connection option, the subtrees of all the VRFs
+    are fetched with a single request.
+    """
+    if not vrfs:
+        return []
+
+    if get_connection_option(module, 'bulk_network_instances'):
+        try:
+            return get_bulk_network_instance_responses(module, vrfs, subpaths, base_path)
+        except ConnectionError:
+            # The 'fields' query parameter is not supported for the network
+            # instances, fall back to the requests per VRF.
+            pass
+
+    requests = []
+    for vrf_name in vrfs:
+        for subpath in subpaths:
+            requests.append({"path": '%s=%s/%s' % (base_path, vrf_name, subpath), "method": GET})
+    # The per-VRF requests are sent together so that they can be
+    # dispatched concurrently by the httpapi plugin.
     try:
-        response = edit_config(module, to_request(module, request))
+        response = edit_config(module, to_request(module, requests))
     except ConnectionError as exc:
         module.fail_json(msg=str(exc), code=exc.code)
 
+    count = len(subpaths)
+    return [response[index:index + count] for index in range(0, len(response), count)]
+
+
+def get_bulk_network_instance_responses(module, vrfs, subpaths, base_path=network_instance_path):
+    """Get subtrees of the network instances of a list of VRFs with a single
+    request. The request selects only the subtrees with the 'fields' query
+    parameter. The subtrees which can not be identified in the response are
+    requested separately.
+    """
+    fields = ['name']
+    for subpath in subpaths:
+        fields.append('/'.join(segment.split('=')[0] for segment in subpath.split('/')))
+    list_path, list_name = base_path.rsplit('/', 1)
+    request = {"path": list_path, "method": GET, "fields": '%s(%s)' % (list_name, ';'.join(fields))}
+    response = edit_config(module, to_request(module, request))
+
+    instances = {}
     resp = response[0][1]
+    if 'openconfig-network-instance:network-instances' in resp:
+        for instance in resp['openconfig-network-instance:network-instances'].get(list_name, []):
+            if 'name' in instance:
+                instances[instance['name']] = instance
+
+    responses = [[get_subtree_response(instances.get(vrf_name), subpath, 'openconfig-network-instance') for subpath in subpaths] for vrf_name in vrfs]
+
+    missing = []
+    for vrf_name, vrf_responses in zip(vrfs, responses):
+        for index, subpath in enumerate(subpaths):
+            if vrf_responses[index] is None:
+                missing.append((vrf_responses, index, {"path": '%s=%s/%s' % (base_path, vrf_name, subpath), "method": GET}))
+    if missing:
+        response = edit_config(module, to_request(module, [request for vrf_responses, index, request in missing]))
+        for (vrf_responses, index, request), resp in zip(missing, response):
+            vrf_responses[index] = resp
+
+    return responses
+
+
+def get_all_peergroups(module, vrfs):
+    """Get the BGP peer groups of a list of VRFs"""
+    all_peer_groups = {}
+    responses = get_network_instance_responses(module, vrfs, ['protocols/protocol=BGP,bgp/bgp/peer-groups'])
+    for vrf_name, vrf_responses in zip(vrfs, responses):
+        all_peer_groups[vrf_name] = get_peergroups_from_response(vrf_responses[0][1])
+    return all_peer_groups
+
+
+def get_peergroups_from_response(resp):
+    peer_groups = []
     if 'openconfig-network-instance:peer-groups' in resp:
         data = resp['openconfig-network-instance:peer-groups']
         if 'peer-group' in data:
@@ -464,20 +542,11 @@ def get_all_bgp_af_redistribute(module, vrfs, af_redis_params_map):
     """Get all BGP Global Address Family Redistribute configurations available in chassis"""
     all_af_redis_data = []
     ret_redis_data = []
-    for vrf_name in vrfs:
-        af_redis_data = {}
-        request_path = '%s=%s/table-connections' % (network_instance_path, vrf_name)
-        request = {"path": request_path, "method": GET}
-        try:
-            response = edit_config(module, to_request(module, request))
-        except ConnectionError as exc:
-            module.fail_json(msg=str(exc), code=exc.code)
-
-        if "openconfig-network-instance:table-connections" in response[0][1]:
-            af_redis_data.update({vrf_name: response[0][1]['openconfig-network-instance:table-connections']})
-
-        if af_redis_data:
-            all_af_redis_data.append(af_redis_data)
+    responses = get_network_instance_responses(module, vrfs, ['table-connections'])
+    for vrf_name, vrf_responses in zip(vrfs, responses):
+        resp = vrf_responses[0]
+        if "openconfig-network-instance:table-connections" in resp[1]:
+            all_af_redis_data.append({vrf_name: resp[1]['openconfig-network-instance:table-connections']})
 
     if all_af_redis_data:
         for vrf_name in vrfs:
@@ -505,18 +574,13 @@ def get_all_bgp_af_redistribute(module, vrfs, af_redis_params_map):
 def get_all_bgp_globals(module, vrfs):
     """Get all BGP configurations available in chassis"""
     all_bgp_globals = []
-    for vrf_name in vrfs:
-        get_path = '%s=%s/%s/global' % (network_instance_path, vrf_name, protocol_bgp_path)
-        request = {"path": get_path, "method": GET}
-        try:
-            response = edit_config(module, to_request(module, request))
-        except ConnectionError as exc:
-            module.fail_json(msg=str(exc), code=exc.code)
-        for resp in response:
-            if "openconfig-network-instance:global" in resp[1]:
-                bgp_data = {'global': resp[1].get("openconfig-network-instance:global", {})}
-                bgp_data.update({'vrf_name': vrf_name})
-                all_bgp_globals.append(bgp_data)
+    responses = get_network_instance_responses(module, vrfs, ['%s/global' % protocol_bgp_path])
+    for vrf_name, vrf_responses in zip(vrfs, responses):
+        resp = vrf_responses[0]
+        if "openconfig-network-instance:global" in resp[1]:
+            bgp_data = {'global': resp[1].get("openconfig-network-instance:global", {})}
+            bgp_data.update({'vrf_name': vrf_name})
+            all_bgp_globals.append(bgp_data)
     return all_bgp_globals
 
 
@@ -657,58 +721,25 @@ def get_bgp_af_data(module, af_params_map):
     return objs
 
 
-def get_bgp_as(module, vrf_name):
-    as_val = None
-    get_path = '%s=%s/%s/global/config' % (network_instance_path, vrf_name, protocol_bgp_path)
-    request = {"path": get_path, "method": GET}
-    try:
-        response = edit_config(module, to_request(module, request))
-    except ConnectionError as exc:
-        module.fail_json(msg=str(exc), code=exc.code)
-
-    resp = response[0][1]
-    if "openconfig-network-instance:config" in resp and 'as' in resp['openconfig-network-instance:config']:
-        as_val = resp['openconfig-network-instance:config']['as']
-    return as_val
-
-
-def get_bgp_neighbors(module, vrf_name):
-    neighbors_data = None
-    get_path = '%s=%s/%s/neighbors' % (network_instance_path, vrf_name, protocol_bgp_path)
-    request = {"path": get_path, "method": GET}
-    try:
-        response = edit_config(module, to_request(module, request))
-    except ConnectionError as exc:
-        module.fail_json(msg=str(exc), code=exc.code)
-
-    resp = response[0][1]
-    if "openconfig-network-instance:neighbors" in resp:
-        neighbors_data = resp['openconfig-network-instance:neighbors']
-
-    return neighbors_data
-
-
 def get_all_bgp_neighbors(module):
     vrf_list = get_all_vrfs(module)
     """Get all BGP neighbor configurations available in chassis"""
     all_bgp_neighbors = []
 
-    for vrf_name in vrf_list:
-        neighbors_cfg = {}
-
-        bgp_as = get_bgp_as(module, vrf_name)
-        if bgp_as:
-            neighbors_cfg['bgp_as'] = bgp_as
-            neighbors_cfg['vrf_name'] = vrf_name
-        else:
-            continue
-
-        neighbors = get_bgp_neighbors(module, vrf_name)
-        if neighbors:
-            neighbors_cfg['neighbors'] = neighbors
-
-        if neighbors_cfg:
-            all_bgp_neighbors.append(neighbors_cfg)
+    bgp_vrfs = []
+    responses = get_network_instance_responses(module, vrf_list, ['%s/global/config' % protocol_bgp_path])
+    for vrf_name, vrf_responses in zip(vrf_list, responses):
+        resp = vrf_responses[0][1]
+        if "openconfig-network-instance:config" in resp and resp['openconfig-network-instance:config'].get('as'):
+            bgp_vrfs.append(vrf_name)
+            all_bgp_neighbors.append({'bgp_as': resp['openconfig-network-instance:config']['as'], 'vrf_name': vrf_name})
+
+    # The neighbors are requested only for the VRFs in which BGP is configured.
+    responses = get_network_instance_responses(module, bgp_vrfs, ['%s/neighbors' % protocol_bgp_path])
+    for neighbors_cfg, vrf_responses in zip(all_bgp_neighbors, responses):
+        resp = vrf_responses[0][1]
+        if resp.get('openconfig-network-instance:neighbors'):
+            neighbors_cfg['neighbors'] = resp['openconfig-network-instance:neighbors']
 
     return all_bgp_neighbors
 
@@ -15,6 +15,8 @@ from copy import (
 from difflib import (
     context_diff
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import get_connection_option
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.timings import timed
 
 
 def get_key_sets(dict_conf):
@@ -31,17 +33,13 @@ def get_key_sets(dict_conf):
 
 
 def get_test_key_set(key, test_keys):
-    tst_keys = deepcopy(test_keys)
     t_key_set = set()
-    if not tst_keys or not key:
+    if not test_keys or not key:
         return t_key_set
 
-    t_keys = next((t_key_item[key] for t_key_item in tst_keys if key in t_key_item), None)
+    t_keys = next((t_key_item[key] for t_key_item in test_keys if key in t_key_item), None)
     if t_keys:
-        t_keys.pop('__merge_op', None)
-        t_keys.pop('__delete_op', None)
-        t_keys.pop('__key_match_op', None)
-        t_key_set = set(t_keys.keys())
+        t_key_set = set(t_keys.keys()).difference(('__merge_op', '__delete_op', '__key_match_op'))
 
     return t_key_set
 
@@ -328,18 +326,60 @@ def get_delete_op(key, test_keys):
     return del_op
 
 
+#
+# The new configuration is derived copy-on-write: the existing configuration
+# and the commands are never modified, only the dicts and lists along the path
+# to a changed node are copied, and unchanged nodes are shared with the
+# existing configuration.
+#
+# The pre-defined merge and delete operations only add, replace or remove the
+# keys of the configuration passed to them, so they get a shallow copy of it.
+# Any other operation may modify the command and the configuration at any
+# level, it gets a copy of both in which no node is shared.
+#
+COPY_ON_WRITE_OPS = frozenset((
+    __MERGE_OP_DEFAULT,
+    __DELETE_CONFIG,
+    __DELETE_CONFIG_IF_NO_SUBCONFIG,
+    __DELETE_SUBCONFIG_AND_LEAFS,
+    __DELETE_SUBCONFIG_ONLY,
+    __DELETE_LEAFS_OR_CONFIG_IF_NO_NON_KEY_LEAF,
+    __DELETE_LEAFS_THEN_CONFIG_IF_NO_NON_KEY_LEAF,
+    __DELETE_SAME_LEAFS_THEN_CONFIG_IF_NO_NON_KEY_LEAF,
+    __DELETE_CONFIG_IF_NO_NON_KEY_LEAF_OR_SUBCONFIG,
+    __DELETE_OP_DEFAULT
+))
+
+
+def copy_config(conf):
+    if isinstance(conf, dict):
+        return dict((key, copy_config(value)) for key, value in conf.items())
+    if isinstance(conf, list):
+        return [copy_config(item) for item in conf]
+    return deepcopy(conf)
+
+
+def apply_config_op(op, key_set, command, exist_conf):
+    if op in COPY_ON_WRITE_OPS:
+        done, new_conf = op(key_set, command, dict(exist_conf))
+    else:
+        command = copy_config(command)
+        done, new_conf = op(key_set, command, copy_config(exist_conf))
+
+    return command, done, new_conf
+
+
+@timed('diff')
 def get_new_config(commands, exist_conf, test_keys=None):
 
     if not commands:
         return exist_conf
 
-    cmds = deepcopy(commands)
-
     n_conf = list()
     e_conf = exist_conf
-    for cmd in cmds:
-        state = cmd['state']
-        cmd.pop('state')
+    for cmd in commands:
+        cmd = dict(cmd)
+        state = cmd.pop('state')
 
         if state == 'merged':
             n_conf = derive_config_from_merged_cmd(cmd, e_conf, test_keys)
@@ -355,7 +395,9 @@ def get_new_config(commands, exist_conf, test_keys=None):
 
         e_conf = n_conf
 
-    return n_conf
+    # The derived configuration shares its unchanged nodes with the existing
+    # configuration and the commands, it is copied once.
+    return deepcopy(n_conf)
 
 
 def derive_config_from_merged_cmd(command, exist_conf, test_keys=None):
@@ -400,27 +442,21 @@ def derive_config_from_merged_cmd_dict(command, exist_conf, test_keys=None, key_
     if merge_op is None:
         merge_op = merge_op_dft
 
-    new_conf = deepcopy(exist_conf)
     if not command:
-        return False, new_conf
+        return False, exist_conf
 
-    trival_cmd_key_set, dict_list_cmd_key_set = get_key_sets(command)
-    trival_exist_key_set, dict_list_exist_key_set = get_key_sets(new_conf)
+    key_matched = key_match_op(key_set, command, exist_conf)
+    if not key_matched:
+        return key_matched, exist_conf
 
-    common_trival_key_set = trival_cmd_key_set.intersection(trival_exist_key_set)
-    common_dict_list_key_set = dict_list_cmd_key_set.intersection(dict_list_exist_key_set)
-
-    key_matched = key_match_op(key_set, command, new_conf)
-    if key_matched:
-        done, new_conf = merge_op(key_set, command, new_conf)
-        if done:
-            return key_matched, new_conf
-        else:
-            nu, dict_list_exist_key_set = get_key_sets(new_conf)
-            common_dict_list_key_set = dict_list_cmd_key_set.intersection(dict_list_exist_key_set)
-    else:
+    nu, dict_list_cmd_key_set = get_key_sets(command)
+    command, done, new_conf = apply_config_op(merge_op, key_set, command, exist_conf)
+    if done:
         return key_matched, new_conf
 
+    nu, dict_list_exist_key_set = get_key_sets(new_conf)
+    common_dict_list_key_set = dict_list_cmd_key_set.intersection(dict_list_exist_key_set)
+
     for key in key_set:
         common_dict_list_key_set.discard(key)
 
@@ -435,7 +471,12 @@ def derive_config_from_merged_cmd_dict(command, exist_conf, test_keys=None, key_
 
         if (isinstance(cmd_value, list) and isinstance(exist_value, list)):
             c_list = cmd_value
-            e_list = exist_value
+            e_list = list(exist_value)
+            new_conf[key] = e_list
+            if exist_value is cmd_value and exist_conf.get(key) is not cmd_value:
+                # The list of the command was added by the operation, it is
+                # merged with itself.
+                c_list = e_list
 
             new_conf_list = list()
             not_dict_item = False
@@ -453,7 +494,7 @@ def derive_config_from_merged_cmd_dict(command, exist_conf, test_keys=None, key_
                                                                                         t_key_match_op,
                                                                                         t_merge_op)
                             if k_mtchd:
-                                new_conf[key].remove(e_item)
+                                e_list.remove(e_item)
                                 if new_conf_dict:
                                     new_conf_list.append(new_conf_dict)
                                 matched_key_dict = True
@@ -546,27 +587,21 @@ def derive_config_from_deleted_cmd_dict(command, exist_conf, test_keys=None, key
     if delete_op is None:
         delete_op = delete_op_dft
 
-    new_conf = deepcopy(exist_conf)
     if not command:
         return True, []
 
-    trival_cmd_key_set, dict_list_cmd_key_set = get_key_sets(command)
-    trival_exist_key_set, dict_list_exist_key_set = get_key_sets(new_conf)
-
-    common_trival_key_set = trival_cmd_key_set.intersection(trival_exist_key_set)
-    common_dict_list_key_set = dict_list_cmd_key_set.intersection(dict_list_exist_key_set)
+    key_matched = key_match_op(key_set, command, exist_conf)
+    if not key_matched:
+        return key_matched, exist_conf
 
-    key_matched = key_match_op(key_set, command, new_conf)
-    if key_matched:
-        done, new_conf = delete_op(key_set, command, new_conf)
-        if done:
-            return key_matched, new_conf
-        else:
-            nu, dict_list_exist_key_set = get_key_sets(new_conf)
-            common_dict_list_key_set = dict_list_cmd_key_set.intersection(dict_list_exist_key_set)
-    else:
+    nu, dict_list_cmd_key_set = get_key_sets(command)
+    command, done, new_conf = apply_config_op(delete_op, key_set, command, exist_conf)
+    if done:
         return key_matched, new_conf
 
+    nu, dict_list_exist_key_set = get_key_sets(new_conf)
+    common_dict_list_key_set = dict_list_cmd_key_set.intersection(dict_list_exist_key_set)
+
     for key in key_set:
         common_dict_list_key_set.discard(key)
 
@@ -581,7 +616,12 @@ def derive_config_from_deleted_cmd_dict(command, exist_conf, test_keys=None, key
 
         if (isinstance(cmd_value, list) and isinstance(exist_value, list)):
             c_list = cmd_value
-            e_list = exist_value
+            e_list = list(exist_value)
+            new_conf[key] = e_list
+            if exist_value is cmd_value and exist_conf.get(key) is not cmd_value:
+                # The list of the command was added by the operation, it is
+                # merged with itself.
+                c_list = e_list
 
             new_conf_list = list()
             not_dict_item = False
@@ -597,7 +637,7 @@ def derive_config_from_deleted_cmd_dict(command, exist_conf, test_keys=None, key
                                                                                          t_key_match_op,
                                                                                          t_delete_op)
                             if k_mtchd:
-                                new_conf[key].remove(e_item)
+                                e_list.remove(e_item)
                                 if new_conf_dict:
                                     new_conf_list.append(new_conf_dict)
                                 break
@@ -647,7 +687,12 @@ def derive_config_from_deleted_cmd_dict(command, exist_conf, test_keys=None, key
     return key_matched, new_conf
 
 
-def get_formatted_config_diff(exist_conf, new_conf, verbosity=0):
+@timed('diff')
+def get_formatted_config_diff(exist_conf, new_conf, verbosity=0, module=None, test_keys=None):
+
+    if module is not None and is_structured_diff_enabled(module):
+        changes = get_config_changes(exist_conf, new_conf, test_keys)
+        return get_formatted_config_changes(changes, verbosity)
 
     exist_conf = json.dumps(exist_conf, sort_keys=True, indent=4, separators=(u',', u': ')) + u'\n'
     new_conf = json.dumps(new_conf, sort_keys=True, indent=4, separators=(u',', u': ')) + u'\n'
@@ -668,3 +713,149 @@ def get_formatted_config_diff(exist_conf, new_conf, verbosity=0):
         formatted_diff = {'prepared': u''.join(diffs)}
 
     return formatted_diff
+
+
+#
+# Structured configuration diff
+#
+# The existing and the new configuration are walked once. The items of a list
+# are matched by the values of their test keys, or by their value if the list
+# has no test keys, so the order of the items is ignored. A value of None is
+# the same as a missing key.
+#
+
+
+def is_structured_diff_enabled(module):
+    modules = get_connection_option(module, 'structured_diff')
+    if not modules:
+        return False
+    names = set(get_resource_name(name) for name in modules)
+    return 'all' in names or get_resource_name(module._name) in names
+
+
+def get_resource_name(module_name):
+    name = module_name.rsplit('.', 1)[-1]
+    if name.startswith('sonic_'):
+        name = name[len('sonic_'):]
+    return name
+
+
+def get_config_changes(exist_conf, new_conf, test_keys=None):
+    """Return the list of the changes from the existing to the new
+    configuration. Each change is a dict with the path of the changed node,
+    the change ('added', 'removed' or 'changed') and the old and/or new value.
+    """
+    changes = []
+    add_config_changes(changes, 'config', 'config', exist_conf, new_conf, test_keys)
+    return changes
+
+
+def add_config_changes(changes, path, key, old, new, test_keys):
+    if old == new:
+        return
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        keys = list(old) + [n_key for n_key in new if n_key not in old]
+        for n_key in keys:
+            add_config_changes(changes, '%s.%s' % (path, n_key), n_key, old.get(n_key), new.get(n_key), test_keys)
+    elif isinstance(old, list) and isinstance(new, list):
+        add_list_changes(changes, path, key, old, new, test_keys)
+    elif old is None:
+        changes.append({'path': path, 'change': 'added', 'new': new})
+    elif new is None:
+        changes.append({'path': path, 'change': 'removed', 'old': old})
+    else:
+        changes.append({'path': path, 'change': 'changed', 'old': old, 'new': new})
+
+
+def add_list_changes(changes, path, key, old, new, test_keys):
+    t_keys = sorted(get_test_key_set(key, test_keys))
+
+    new_items = {}
+    unmatched_new = []
+    for item in new:
+        item_id = get_item_id(item, t_keys)
+        if item_id and item_id not in new_items:
+            new_items[item_id] = item
+        else:
+            unmatched_new.append(item)
+
+    unmatched_old = []
+    for item in old:
+        item_id = get_item_id(item, t_keys)
+        if item_id and item_id in new_items:
+            add_config_changes(changes, get_item_path(path, item, t_keys), key, item, new_items.pop(item_id), test_keys)
+        else:
+            unmatched_old.append(item)
+    unmatched_new.extend(new_items.values())
+
+    # The remaining items are matched by their value.
+    new_counts = {}
+    for item in unmatched_new:
+        value = get_hashable(item)
+        new_counts[value] = new_counts.get(value, 0) + 1
+    for item in unmatched_old:
+        value = get_hashable(item)
+        if new_counts.get(value):
+            new_counts[value] -= 1
+        else:
+            changes.append({'path': get_item_path(path, item, t_keys), 'change': 'removed', 'old': item})
+    for item in unmatched_new:
+        value = get_hashable(item)
+        if new_counts.get(value):
+            new_counts[value] -= 1
+            changes.append({'path': get_item_path(path, item, t_keys), 'change': 'added', 'new': item})
+
+
+def get_item_id(item, t_keys):
+    if not t_keys or not isinstance(item, dict):
+        return None
+    return tuple((t_key, get_hashable(item[t_key])) for t_key in t_keys if item.get(t_key) is not None)
+
+
+def get_item_path(path, item, t_keys):
+    if not t_keys or not isinstance(item, dict):
+        return '%s[]' % path
+    key_values = ['%s=%s' % (t_key, format_key_value(item[t_key])) for t_key in t_keys if item.get(t_key) is not None]
+    return '%s[%s]' % (path, ','.join(key_values))
+
+
+def get_hashable(value):
+    if isinstance(value, dict):
+        return tuple(sorted((key, get_hashable(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return ('[]',) + tuple(get_hashable(item) for item in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def format_key_value(value):
+    if isinstance(value, (dict, list)):
+        return format_config_value(value)
+    return str(value)
+
+
+def format_config_value(value):
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def get_formatted_config_changes(changes, verbosity=0):
+    """Render the changes returned by get_config_changes() as text, one line
+    per change. With a verbosity of 3 or more, the changes are also returned.
+    """
+    lines = []
+    for change in changes:
+        if change['change'] == 'added':
+            lines.append(u'+ %s: %s' % (change['path'], format_config_value(change['new'])))
+        elif change['change'] == 'removed':
+            lines.append(u'- %s: %s' % (change['path'], format_config_value(change['old'])))
+        else:
+            lines.append(u'! %s: %s -> %s' % (change['path'], format_config_value(change['old']), format_config_value(change['new'])))
+
+    formatted_diff = {'prepared': u''.join(line + u'\n' for line in lines)}
+    if verbosity >= 3:
+        formatted_diff['changes'] = changes
+    return formatted_diff
@@ -0,0 +1,71 @@
+#
+# -*- coding: utf-8 -*-
+# Copyright 2025 Dell Inc. or its subsidiaries. All Rights Reserved
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# qos_utils
+
+"""
+The QoS configuration requested by the facts classes of the QoS modules.
+With the 'bulk_qos' connection option, the configuration of the
+openconfig-qos tree is requested once and the subtree of each facts class is
+taken from it. Within a facts gathering the request is sent once (see
+utils/snapshot.py), across modules its response can be cached with the
+'get_cache_ttl' option.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
+    get_subtree_response
+)
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
+    get_connection_option,
+    to_request,
+    edit_config
+)
+from ansible.module_utils.connection import ConnectionError
+
+QOS_PATH = '/data/openconfig-qos:qos'
+GET = 'get'
+
+
+def get_qos_config(module, path, key_name):
+    """Return the configuration of a subtree of the QoS configuration, or
+    None if it is not configured. The path is relative to QOS_PATH, the key
+    name is the qualified name of the subtree in the GET response.
+    """
+    response = None
+    if get_connection_option(module, 'bulk_qos'):
+        response = get_bulk_qos_response(module, path)
+    if response is None:
+        request = {'path': '%s/%s' % (QOS_PATH, path), 'method': GET}
+        try:
+            response = edit_config(module, to_request(module, request))[0]
+        except ConnectionError as exc:
+            module.fail_json(msg=str(exc), code=exc.code)
+
+    if response[1] and key_name in response[1]:
+        return response[1][key_name]
+    return None
+
+
+def get_bulk_qos_response(module, path):
+    """Return the GET response of a subtree of the QoS configuration taken
+    from the configuration of the whole openconfig-qos tree, or None if the
+    device rejects the request or the subtree can not be identified in its
+    response
+    """
+    request = {'path': QOS_PATH, 'method': GET, 'content': 'config'}
+    try:
+        response = edit_config(module, to_request(module, request))
+    except ConnectionError:
+        return None
+
+    qos = None
+    if response and response[0][1]:
+        qos = response[0][1].get('openconfig-qos:qos')
+    return get_subtree_response(qos, path, 'openconfig-qos')
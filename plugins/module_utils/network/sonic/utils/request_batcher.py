@@ -0,0 +1,183 @@
+#
+# -*- coding: utf-8 -*-
+# Copyright 2025 Dell Inc. or its subsidiaries. All Rights Reserved
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# request_batcher
+
+"""
+Concurrent execution of the facts collectors of a module. The GET requests
+of the collectors which run at the same time are combined into a single
+request list, so that the httpapi plugin can send them to the device
+concurrently (see the 'get_workers' option).
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.snapshot import DeviceSnapshot
+
+
+class CollectorFailure(BaseException):
+    """Raised in place of fail_json() in a collector thread. Like the
+    SystemExit raised by fail_json(), it is not caught by 'except Exception'.
+    """
+
+    def __init__(self, args, kwargs):
+        super(CollectorFailure, self).__init__(kwargs.get('msg'))
+        self.fail_args = args
+        self.fail_kwargs = kwargs
+
+
+class RequestBatcher(object):
+    """Combines the GET requests of concurrent workers. A batch is sent once
+    all the running workers wait for a response.
+    """
+
+    def __init__(self, send):
+        self._send = send
+        self._cond = threading.Condition()
+        self._active = 0
+        self._pending = []
+
+    def start_worker(self):
+        with self._cond:
+            self._active += 1
+
+    def stop_worker(self):
+        with self._cond:
+            self._active -= 1
+            self._flush_if_blocked()
+
+    def submit(self, commands, suppr_ntf_excp=True):
+        """Return the responses of a list of GET requests"""
+        entry = {'commands': commands, 'suppr_ntf_excp': suppr_ntf_excp, 'done': False}
+        with self._cond:
+            self._pending.append(entry)
+            self._flush_if_blocked()
+            while not entry['done']:
+                self._cond.wait()
+
+        if 'error' in entry:
+            raise entry['error']
+        return entry['responses']
+
+    def _flush_if_blocked(self):
+        # Called with the lock held. All the other workers wait for the
+        # lock to be released, so the batch is sent with it held.
+        if not self._pending or len(self._pending) < self._active:
+            return
+
+        batch, self._pending = self._pending, []
+        for suppr_ntf_excp in (True, False):
+            entries = [entry for entry in batch if entry['suppr_ntf_excp'] == suppr_ntf_excp]
+            if entries:
+                self._send_batch(entries, suppr_ntf_excp)
+        self._cond.notify_all()
+
+    def _send_batch(self, entries, suppr_ntf_excp):
+        commands = []
+        indexes = {}
+        for entry in entries:
+            for command in entry['commands']:
+                key = DeviceSnapshot.get_key(command, suppr_ntf_excp)
+                if key not in indexes:
+                    indexes[key] = len(commands)
+                    commands.append(command)
+
+        try:
+            responses = self._send(commands, suppr_ntf_excp)
+        except Exception as exc:
+            if len(entries) == 1:
+                entries[0]['error'] = exc
+                entries[0]['done'] = True
+                return
+            # Send the requests of each worker separately, so that the error
+            # is raised only to the worker whose request failed.
+            for entry in entries:
+                self._set_result(entry, suppr_ntf_excp)
+            return
+
+        sent = set()
+        for entry in entries:
+            entry_responses = []
+            for command in entry['commands']:
+                index = indexes[DeviceSnapshot.get_key(command, suppr_ntf_excp)]
+                # Workers sharing a request get their own copy of the response.
+                entry_responses.append(responses[index] if index not in sent else deepcopy(responses[index]))
+                sent.add(index)
+            entry['responses'] = entry_responses
+            entry['done'] = True
+
+    def _set_result(self, entry, suppr_ntf_excp):
+        try:
+            entry['responses'] = self._send(entry['commands'], suppr_ntf_excp)
+        except Exception as exc:
+            entry['error'] = exc
+        entry['done'] = True
+
+
+def run_concurrently(module, tasks, workers, send):
+    """Run a list of tasks in a pool of threads, sending their GET requests
+    with a RequestBatcher. Return a list of (result, exception) tuples in the
+    order of the tasks. The warnings of the tasks are issued in the order of
+    the tasks.
+    """
+    batcher = RequestBatcher(send)
+    task_warnings = threading.local()
+    fail_json = module.fail_json
+    warn = module.warn
+
+    def raise_failure(*args, **kwargs):
+        raise CollectorFailure(args, kwargs)
+
+    def add_warning(warning):
+        if getattr(task_warnings, 'warnings', None) is None:
+            warn(warning)
+        else:
+            task_warnings.warnings.append(warning)
+
+    def run_task(task, counted):
+        # Only the running tasks are counted, a queued task can not send
+        # requests before a thread of the pool is free.
+        if not counted:
+            batcher.start_worker()
+        task_warnings.warnings = []
+        try:
+            return task(), None, task_warnings.warnings
+        except BaseException as exc:
+            return None, exc, task_warnings.warnings
+        finally:
+            batcher.stop_worker()
+
+    module.fail_json = raise_failure
+    module.warn = add_warning
+    module._sonic_request_batcher = batcher
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # The first tasks start at once, they are counted before they
+            # start so that their first requests are sent in one batch.
+            first_tasks = min(workers, len(tasks))
+            for index in range(first_tasks):
+                batcher.start_worker()
+            futures = [executor.submit(run_task, task, index < first_tasks) for index, task in enumerate(tasks)]
+            results = [future.result() for future in futures]
+    finally:
+        module.fail_json = fail_json
+        module.warn = warn
+        module._sonic_request_batcher = None
+
+    for result, exc, warnings in results:
+        for warning in warnings:
+            warn(warning)
+    return [(result, exc) for result, exc, warnings in results]
+
+
+def get_request_batcher(module):
+    return getattr(module, '_sonic_request_batcher', None)
@@ -0,0 +1,503 @@
+#
+# -*- coding: utf-8 -*-
+# Copyright 2025 Dell Inc. or its subsidiaries. All Rights Reserved
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# request_optimizer
+
+"""
+Request plan optimizer for the REST API requests generated by the resource
+modules. It reduces the number of requests sent to the device by
+- merging consecutive PATCH requests which target the same YANG list or
+  container (or a descendant of it) into a single payload, and
+- dropping DELETE requests which are shadowed by a later DELETE request of
+  the same or a parent path.
+The order in which the remaining requests are sent is not changed.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import re
+from copy import deepcopy
+
+from ansible.module_utils.six.moves.urllib.parse import unquote
+
+PATCH = 'patch'
+DELETE = 'delete'
+
+# The key leaves of the YANG lists whose entries can be merged, by schema
+# path (the local names of the nodes below 'data'). The keys are in the
+# order of the key values of a request path. The entries of a list which is
+# not in this table are never merged, the requests are sent as they are.
+LIST_KEYS = {
+    'acl/acl-sets/acl-set': ('name', 'type'),
+    'acl/acl-sets/acl-set/acl-entries/acl-entry': ('sequence-id',),
+    'bfd/bfd-mhop-sessions/multi-hop': ('remote-address', 'interface', 'vrf', 'local-address'),
+    'bfd/bfd-profile/profile': ('profile-name',),
+    'bfd/bfd-shop-sessions/single-hop': ('remote-address', 'interface', 'vrf', 'local-address'),
+    'components/component': ('name',),
+    'components/component/port/breakout-mode/groups/group': ('index',),
+    'copp/copp-groups/copp-group': ('name',),
+    'dhcp-snooping-static-binding/entry': ('mac', 'iptype'),
+    'fbs/classifiers/classifier': ('class-name',),
+    'interfaces/interface': ('name',),
+    'interfaces/interface/routed-vlan/ipv4/addresses/address': ('ip',),
+    'interfaces/interface/routed-vlan/ipv4/ospfv2/if-addresses': ('address',),
+    'interfaces/interface/routed-vlan/ipv4/ospfv2/if-addresses/md-authentications/md-authentication': ('authentication-key-id',),
+    'interfaces/interface/routed-vlan/ipv6/addresses/address': ('ip',),
+    'interfaces/interface/subinterfaces/subinterface': ('index',),
+    'interfaces/interface/subinterfaces/subinterface/ipv4/addresses/address': ('ip',),
+    'interfaces/interface/subinterfaces/subinterface/ipv4/addresses/address/vrrp/vrrp-group': ('virtual-router-id',),
+    'interfaces/interface/subinterfaces/subinterface/ipv4/addresses/address/vrrp/vrrp-group/vrrp-track/vrrp-track-interface': ('track-intf',),
+    'interfaces/interface/subinterfaces/subinterface/ipv4/ospfv2/if-addresses': ('address',),
+    'interfaces/interface/subinterfaces/subinterface/ipv4/ospfv2/if-addresses/md-authentications/md-authentication': ('authentication-key-id',),
+    'interfaces/interface/subinterfaces/subinterface/ipv6/addresses/address': ('ip',),
+    'interfaces/interface/subinterfaces/subinterface/ipv6/addresses/address/vrrp/vrrp-group': ('virtual-router-id',),
+    'interfaces/interface/subinterfaces/subinterface/ipv6/addresses/address/vrrp/vrrp-group/vrrp-track/vrrp-track-interface': ('track-intf',),
+    'lldp/interfaces/interface': ('name',),
+    'lst/interfaces/interface': ('id',),
+    'lst/interfaces/interface/upstream-groups/upstream-group': ('group-name',),
+    'lst/lst-groups/lst-group': ('name',),
+    'mclag/interfaces/interface': ('name',),
+    'mclag/mclag-domains/mclag-domain': ('domain-id',),
+    'mclag/mclag-gateway-macs/mclag-gateway-mac': ('gateway-mac',),
+    'mclag/vlan-ifs/vlan-if': ('name',),
+    'mclag/vlan-interfaces/vlan-interface': ('name',),
+    'mirror/sessions/session': ('name',),
+    'neighbor-globals/neighbor-global': ('name',),
+    'network-instances/network-instance': ('name',),
+    'network-instances/network-instance/evpn/ethernet-segments/ethernet-segment': ('name',),
+    'network-instances/network-instance/fdb/mac-table/entries/entry': ('mac-address', 'vlan'),
+    'network-instances/network-instance/interfaces/interface': ('id',),
+    'network-instances/network-instance/protocols/protocol': ('identifier', 'name'),
+    'network-instances/network-instance/protocols/protocol/bgp/global/afi-safis/afi-safi': ('afi-safi-name',),
+    'network-instances/network-instance/protocols/protocol/bgp/global/afi-safis/afi-safi/aggregate-address-config/aggregate-address': ('prefix',),
+    'network-instances/network-instance/protocols/protocol/bgp/global/afi-safis/afi-safi/l2vpn-evpn/route-advertise/route-advertise-list':
+        ('advertise-afi-safi',),
+    'network-instances/network-instance/protocols/protocol/bgp/global/afi-safis/afi-safi/l2vpn-evpn/vnis/vni': ('vni-number',),
+    'network-instances/network-instance/protocols/protocol/bgp/global/afi-safis/afi-safi/network-config/network': ('prefix',),
+    'network-instances/network-instance/protocols/protocol/bgp/neighbors/neighbor': ('neighbor-address',),
+    'network-instances/network-instance/protocols/protocol/bgp/neighbors/neighbor/afi-safis/afi-safi': ('afi-safi-name',),
+    'network-instances/network-instance/protocols/protocol/bgp/peer-groups/peer-group': ('peer-group-name',),
+    'network-instances/network-instance/protocols/protocol/bgp/peer-groups/peer-group/afi-safis/afi-safi': ('afi-safi-name',),
+    'network-instances/network-instance/protocols/protocol/ospfv2/areas/area': ('identifier',),
+    'network-instances/network-instance/protocols/protocol/ospfv2/areas/area/networks/network': ('address-prefix',),
+    'network-instances/network-instance/protocols/protocol/ospfv2/areas/area/virtual-links/virtual-link': ('remote-router-id',),
+    'network-instances/network-instance/protocols/protocol/ospfv2/areas/area/virtual-links/virtual-link/md-authentications/md-authentication':
+        ('authentication-key-id',),
+    'network-instances/network-instance/protocols/protocol/ospfv2/global/graceful-restart/helpers/helper': ('neighbour-id',),
+    'network-instances/network-instance/protocols/protocol/ospfv2/global/inter-area-propagation-policies/inter-area-policy': ('src-area',),
+    'network-instances/network-instance/protocols/protocol/ospfv2/global/inter-area-propagation-policies/inter-area-policy/ranges/range':
+        ('address-prefix',),
+    'network-instances/network-instance/protocols/protocol/ospfv2/global/passive-interfaces/passive-interface': ('name', 'subinterface', 'address'),
+    'network-instances/network-instance/protocols/protocol/ospfv2/global/route-distribution-policies/distribute-list': ('protocol', 'direction'),
+    'network-instances/network-instance/protocols/protocol/pim/interfaces/interface': ('interface-id',),
+    'network-instances/network-instance/protocols/protocol/static-routes/static': ('prefix',),
+    'network-instances/network-instance/protocols/protocol/static-routes/static/next-hops/next-hop': ('index',),
+    'network-instances/network-instance/table-connections/table-connection': ('src-protocol', 'dst-protocol', 'address-family'),
+    'pki/security-profiles/security-profile': ('profile-name',),
+    'pki/trust-stores/trust-store': ('name',),
+    'poe/cards/card': ('card-id',),
+    'port-groups/port-group': ('id',),
+    'qos/buffer/buffer-pools/buffer-pool': ('name',),
+    'qos/buffer/buffer-profiles/buffer-profile': ('name',),
+    'qos/dot1p-maps/dot1p-map': ('name',),
+    'qos/dot1p-maps/dot1p-map/dot1p-map-entries/dot1p-map-entry': ('dot1p',),
+    'qos/dscp-maps/dscp-map': ('name',),
+    'qos/dscp-maps/dscp-map/dscp-map-entries/dscp-map-entry': ('dscp',),
+    'qos/forwarding-group-dot1p-maps/forwarding-group-dot1p-map': ('name',),
+    'qos/forwarding-group-dot1p-maps/forwarding-group-dot1p-map/forwarding-group-dot1p-map-entries/forwarding-group-dot1p-map-entry': ('fwd-group',),
+    'qos/forwarding-group-dscp-maps/forwarding-group-dscp-map': ('name',),
+    'qos/forwarding-group-dscp-maps/forwarding-group-dscp-map/forwarding-group-dscp-map-entries/forwarding-group-dscp-map-entry': ('fwd-group',),
+    'qos/forwarding-group-priority-group-maps/forwarding-group-priority-group-map': ('name',),
+    'qos/forwarding-group-priority-group-maps/forwarding-group-priority-group-map/forwarding-group-priority-group-map-entries/'
+    'forwarding-group-priority-group-map-entry': ('fwd-group',),
+    'qos/forwarding-group-queue-maps/forwarding-group-queue-map': ('name',),
+    'qos/forwarding-group-queue-maps/forwarding-group-queue-map/forwarding-group-queue-map-entries/forwarding-group-queue-map-entry': ('fwd-group',),
+    'qos/interfaces/interface': ('interface-id',),
+    'qos/interfaces/interface/pfc/pfc-priorities/pfc-priority': ('dot1p',),
+    'qos/pfc-priority-priority-group-maps/pfc-priority-priority-group-map': ('name',),
+    'qos/pfc-priority-priority-group-maps/pfc-priority-priority-group-map/pfc-priority-priority-group-map-entries/pfc-priority-priority-group-map-entry':
+        ('dot1p',),
+    'qos/pfc-priority-queue-maps/pfc-priority-queue-map': ('name',),
+    'qos/pfc-priority-queue-maps/pfc-priority-queue-map/pfc-priority-queue-map-entries/pfc-priority-queue-map-entry': ('dot1p',),
+    'qos/queues/queue': ('name',),
+    'qos/scheduler-policies/scheduler-policy': ('name',),
+    'qos/scheduler-policies/scheduler-policy/schedulers/scheduler': ('sequence',),
+    'qos/wred-profiles/wred-profile': ('name',),
+    'relay-agent/dhcp/interfaces/interface': ('id',),
+    'relay-agent/dhcpv6/interfaces/interface': ('id',),
+    'routing-policy/defined-sets/bgp-defined-sets/as-path-sets/as-path-set': ('as-path-set-name',),
+    'routing-policy/defined-sets/bgp-defined-sets/community-sets/community-set': ('community-set-name',),
+    'routing-policy/defined-sets/bgp-defined-sets/ext-community-sets/ext-community-set': ('ext-community-set-name',),
+    'routing-policy/defined-sets/prefix-sets/prefix-set': ('name',),
+    'routing-policy/defined-sets/prefix-sets/prefix-set/extended-prefixes/extended-prefix': ('ip-prefix', 'sequence-number', 'masklength-range'),
+    'routing-policy/policy-definitions/policy-definition': ('name',),
+    'routing-policy/policy-definitions/policy-definition/statements/statement': ('name',),
+    'sampling/sflow/collectors/collector': ('address', 'port', 'network-instance'),
+    'sampling/sflow/interfaces/interface': ('name',),
+    'sonic-device-metadata/DEVICE_METADATA/DEVICE_METADATA_LIST': ('name',),
+    'sonic-sag/SAG_GLOBAL/SAG_GLOBAL_LIST': ('table_distinguisher',),
+    'sonic-vlan/VLAN/VLAN_LIST': ('name',),
+    'sonic-vrf/VRF/VRF_LIST': ('vrf_name',),
+    'sonic-vxlan/EVPN_NVO/EVPN_NVO_LIST': ('name',),
+    'sonic-vxlan/SUPPRESS_VLAN_NEIGH/SUPPRESS_VLAN_NEIGH_LIST': ('name',),
+    'sonic-vxlan/VXLAN_TUNNEL/VXLAN_TUNNEL_LIST': ('name',),
+    'sonic-vxlan/VXLAN_TUNNEL_MAP/VXLAN_TUNNEL_MAP_LIST': ('name', 'mapname'),
+    'stp/interfaces/interface': ('name',),
+    'stp/mstp/mst-instances/mst-instance': ('mst-id',),
+    'stp/mstp/mst-instances/mst-instance/interfaces/interface': ('name',),
+    'stp/pvst/vlans': ('vlan-id',),
+    'stp/pvst/vlans/interfaces/interface': ('name',),
+    'stp/rapid-pvst/vlan': ('vlan-id',),
+    'stp/rapid-pvst/vlan/interfaces/interface': ('name',),
+    'system/aaa/authentication/users/user': ('username',),
+    'system/aaa/server-groups/server-group': ('name',),
+    'system/aaa/server-groups/server-group/ldap/maps/map': ('name', 'from'),
+    'system/aaa/server-groups/server-group/servers/server': ('address',),
+    'system/logging/remote-servers/remote-server': ('host',),
+    'system/ntp/ntp-keys/ntp-key': ('key-id',),
+    'system/ntp/servers/server': ('address',),
+}
+
+# The prefix of an identityref value, e.g. 'openconfig-policy-types:'
+IDENTITY_PREFIX_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9]*(-[a-zA-Z0-9]+)+:')
+
+
+def optimize_requests(requests):
+    """Return an equivalent list of requests with the PATCH requests
+    coalesced and the shadowed DELETE requests removed
+    """
+    if not requests or not all(isinstance(request, dict) for request in requests):
+        return requests
+
+    return RequestPlan(requests).optimize()
+
+
+def split_path(path):
+    """Return the segments of a request path and a flag indicating
+    whether the path has a query string
+    """
+    path, sep, query = path.partition('?')
+    segments = tuple(segment for segment in path.replace('%2F', '%2f').split('/') if segment)
+    return segments, bool(query)
+
+
+def parse_segment(segment):
+    """Return the node name and the list key values of a path segment"""
+    name, sep, keys = segment.partition('=')
+    if not sep:
+        return name, None
+    return name, tuple(unquote(key) for key in keys.split(','))
+
+
+def local_name(name):
+    return name.split(':', 1)[-1]
+
+
+def is_scalar(value):
+    return not isinstance(value, (dict, list))
+
+
+def key_value(value):
+    """Return a list key value as it is given in a request path"""
+    return IDENTITY_PREFIX_RE.sub('', str(value), count=1)
+
+
+def get_entry_key(entry, key_names):
+    """Return the key values of a list entry, or None if the entry does not
+    have all its key leaves
+    """
+    if not isinstance(entry, dict) or not all(name in entry and is_scalar(entry[name]) for name in key_names):
+        return None
+    return tuple(key_value(entry[name]) for name in key_names)
+
+
+class PathTrie(object):
+    """Trie of request paths, used to find the first later request whose
+    path overlaps with a given path
+    """
+
+    def __init__(self):
+        self.children = {}
+        self.own = None
+        self.subtree = None
+
+    def insert(self, segments, index):
+        node = self
+        node.subtree = index
+        for segment in segments:
+            node = node.children.setdefault(segment, PathTrie())
+            node.subtree = index
+        node.own = index
+
+    def find_first_overlap(self, segments):
+        """Return the index of the first request at an ancestor of, at, or
+        below the given path, and whether it is at an ancestor or at the path
+        """
+        first = None
+        node = self
+        for segment in segments:
+            if node.own is not None and (first is None or node.own < first):
+                first = node.own
+            node = node.children.get(segment)
+            if node is None:
+                return first, True
+
+        if node.own is not None and (first is None or node.own <= first):
+            first = node.own
+        if node.subtree is not None and (first is None or node.subtree < first):
+            return node.subtree, False
+        return first, True
+
+
+class RequestPlan(object):
+    """Optimizer for a list of requests of a single module run"""
+
+    def __init__(self, requests):
+        self.requests = requests
+        self._list_indexes = {}
+
+    def optimize(self):
+        return self.coalesce_patch_requests(self.remove_shadowed_delete_requests(self.requests))
+
+    @staticmethod
+    def remove_shadowed_delete_requests(requests):
+        """Remove the DELETE requests whose path is deleted again by the
+        first later request touching it
+        """
+        trie = PathTrie()
+        keep = [True] * len(requests)
+        for index in range(len(requests) - 1, -1, -1):
+            request = requests[index]
+            segments, has_query = split_path(request.get('path') or '')
+            if segments[:1] != ('data',):
+                # RPCs and other non data tree requests may touch anything.
+                segments = ()
+
+            if (request.get('method') or '').lower() == DELETE and segments and not has_query:
+                first, is_ancestor = trie.find_first_overlap(segments)
+                if first is not None and is_ancestor:
+                    first_request = requests[first]
+                    if ((first_request.get('method') or '').lower() == DELETE and
+                            not split_path(first_request.get('path') or '')[1]):
+                        keep[index] = False
+                        continue
+
+            trie.insert(segments, index)
+
+        return [request for index, request in enumerate(requests) if keep[index]]
+
+    def coalesce_patch_requests(self, requests):
+        """Merge each PATCH request into the preceding PATCH request when it
+        targets the same node or a descendant of it
+        """
+        optimized_requests = []
+        last_is_copy = False
+        for request in requests:
+            if optimized_requests and self.can_merge(optimized_requests[-1], request):
+                target_request = optimized_requests[-1]
+                if not last_is_copy:
+                    # Never change the payload of the requests of the caller.
+                    target_request = dict(target_request)
+                    target_request['data'] = deepcopy(target_request['data'])
+                if self.merge_request(target_request, request):
+                    optimized_requests[-1] = target_request
+                    last_is_copy = True
+                    continue
+            optimized_requests.append(request)
+            last_is_copy = False
+
+        return optimized_requests
+
+    @staticmethod
+    def can_merge(prev_request, request):
+        for req in (prev_request, request):
+            if (req.get('method') or '').lower() != PATCH:
+                return False
+            if not isinstance(req.get('data'), dict) or len(req['data']) != 1:
+                return False
+        return True
+
+    def merge_request(self, target_request, request):
+        """Merge the payload of a request into the payload of the target
+        request. Return False if the request can not be merged.
+        """
+        t_segments, t_has_query = split_path(target_request['path'])
+        r_segments, r_has_query = split_path(request['path'])
+        if t_has_query or r_has_query or len(t_segments) < 2 or len(r_segments) < len(t_segments):
+            return False
+        if t_segments[0] != 'data' or r_segments[:len(t_segments) - 1] != t_segments[:-1]:
+            return False
+
+        t_name, t_keys = parse_segment(t_segments[-1])
+        r_name, r_keys = parse_segment(r_segments[len(t_segments) - 1])
+        if t_name != r_name or (t_keys is not None and t_keys != r_keys):
+            return False
+
+        t_data = target_request['data']
+        t_member = next(iter(t_data))
+        r_member = next(iter(request['data']))
+        if local_name(t_member) != local_name(t_name):
+            return False
+
+        # The schema path of the current node, used to find the key leaves
+        # of the lists.
+        schema_path = tuple(local_name(parse_segment(segment)[0]) for segment in t_segments[1:])
+        remaining = r_segments[len(t_segments):]
+        if not remaining:
+            if local_name(r_member) != local_name(t_name):
+                return False
+            r_value = request['data'][r_member]
+            if not self.can_merge_value(t_data.get(t_member), r_value, schema_path):
+                return False
+            self.merge_value(t_data, t_member, deepcopy(r_value), schema_path)
+            return True
+
+        node = t_data[t_member]
+        if r_keys is not None:
+            node = self.find_entry_by_keys(node, r_keys, schema_path)
+        if not isinstance(node, dict):
+            return False
+
+        # Locate the parent node of the request target before changing the
+        # target payload, so that a request which can not be merged leaves
+        # it untouched.
+        to_create = []
+        for segment in remaining[:-1]:
+            name, keys = parse_segment(segment)
+            schema_path += (local_name(name),)
+            if to_create:
+                if keys is not None:
+                    return False
+                to_create.append(name)
+                continue
+            member = self.find_member(node, name)
+            if member is None:
+                if keys is not None:
+                    return False
+                to_create.append(name)
+                continue
+            node = node[member]
+            if keys is not None:
+                node = self.find_entry_by_keys(node, keys, schema_path)
+            if not isinstance(node, dict):
+                return False
+
+        name, keys = parse_segment(remaining[-1])
+        schema_path += (local_name(name),)
+        if local_name(r_member) != local_name(name):
+            return False
+        r_value = request['data'][r_member]
+        if keys is not None and not isinstance(r_value, list):
+            return False
+
+        member = None if to_create else self.find_member(node, name)
+        if member is not None and not self.can_merge_value(node[member], r_value, schema_path):
+            return False
+        for create_name in to_create:
+            node = node.setdefault(create_name, {})
+        self.merge_value(node, member or name, deepcopy(r_value), schema_path)
+        return True
+
+    @staticmethod
+    def find_member(node, name):
+        """Return the member of a payload node matching a node name,
+        ignoring the module prefix
+        """
+        if name in node:
+            return name
+        name = local_name(name)
+        return next((member for member in node if local_name(member) == name), None)
+
+    def can_merge_value(self, existing, value, schema_path):
+        """Return whether a value can be merged into the existing value of a
+        node: the entries of each list must be matched by their key leaves
+        """
+        if isinstance(existing, dict) and isinstance(value, dict):
+            return all(self.can_merge_value(existing.get(key), sub_value, schema_path + (local_name(key),))
+                       for key, sub_value in value.items())
+        if isinstance(existing, list) and isinstance(value, list):
+            if all(is_scalar(entry) for entry in existing + value):
+                return True
+            index = self.get_list_index(existing, schema_path)
+            if not index[1] or not index[3]:
+                return False
+            new_entries = {}
+            for new_entry in value:
+                if is_scalar(new_entry):
+                    continue
+                entry_key = get_entry_key(new_entry, index[1])
+                if entry_key is None:
+                    return False
+                entry = index[2].get(entry_key) or new_entries.setdefault(entry_key, new_entry)
+                if entry is not new_entry and not self.can_merge_value(entry, new_entry, schema_path):
+                    return False
+        return True
+
+    def merge_value(self, parent, member, value, schema_path):
+        existing = parent.get(member)
+        if isinstance(existing, dict) and isinstance(value, dict):
+            for key, sub_value in value.items():
+                self.merge_value(existing, key, sub_value, schema_path + (local_name(key),))
+        elif isinstance(existing, list) and isinstance(value, list):
+            self.merge_list(existing, value, schema_path)
+        else:
+            parent[member] = value
+
+    def merge_list(self, entries, new_entries, schema_path):
+        """Merge the entries of a YANG list or leaf-list. The list entries
+        are matched by their key leaves (see can_merge_value()).
+        """
+        index = None
+        for new_entry in new_entries:
+            if not isinstance(new_entry, dict):
+                if new_entry not in entries:
+                    entries.append(new_entry)
+                continue
+
+            if index is None:
+                index = self.get_list_index(entries, schema_path)
+            entry_key = get_entry_key(new_entry, index[1])
+            entry = index[2].get(entry_key)
+            if entry is None:
+                entries.append(new_entry)
+                index[2][entry_key] = new_entry
+            else:
+                for key, value in new_entry.items():
+                    self.merge_value(entry, key, value, schema_path + (local_name(key),))
+
+    def get_list_index(self, entries, schema_path):
+        """Return the index of the entries of a list by their key values"""
+        index = self._list_indexes.get(id(entries))
+        if index is None or index[0] is not entries:
+            key_names = LIST_KEYS.get('/'.join(schema_path), ())
+            by_key = {}
+            # Whether all the entries have their key leaves
+            complete = True
+            for entry in entries:
+                if is_scalar(entry):
+                    continue
+                entry_key = get_entry_key(entry, key_names) if key_names else None
+                if entry_key is None:
+                    complete = False
+                else:
+                    by_key.setdefault(entry_key, entry)
+            index = (entries, key_names, by_key, complete)
+            self._list_indexes[id(entries)] = index
+        return index
+
+    def find_entry_by_keys(self, entries, keys, schema_path):
+        """Return the entry of a list payload whose key leaves have the key
+        values of a request path, or None if there is no such entry or the
+        key leaves of the list are not known
+        """
+        if not isinstance(entries, list):
+            return None
+        index = self.get_list_index(entries, schema_path)
+        if len(index[1]) != len(keys):
+            return None
+        return index[2].get(tuple(key_value(key) for key in keys))
@@ -0,0 +1,89 @@
+#
+# -*- coding: utf-8 -*-
+# Copyright 2025 Dell Inc. or its subsidiaries. All Rights Reserved
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# snapshot
+
+"""
+Snapshot of the device configuration shared by the facts classes of a
+single facts gathering. Each distinct GET request is sent to the device
+once, later requests for the same resource are served from the snapshot.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from contextlib import contextmanager
+from copy import deepcopy
+
+QUERY_KEYS = ('depth', 'fields', 'content')
+
+
+class DeviceSnapshot(object):
+    """GET responses received during a facts gathering, keyed by request"""
+
+    def __init__(self):
+        self._responses = {}
+        self._views = {}
+
+    @staticmethod
+    def get_key(request, suppr_ntf_excp=True):
+        query = []
+        for key in QUERY_KEYS:
+            value = request.get(key)
+            if isinstance(value, (list, tuple)):
+                value = tuple(value)
+            query.append(value)
+        return (request.get('path'), tuple(query), bool(suppr_ntf_excp))
+
+    def get(self, request, suppr_ntf_excp=True):
+        """Return a copy of the response of a request, or None if the
+        request is not in the snapshot
+        """
+        key = self.get_key(request, suppr_ntf_excp)
+        if key not in self._responses:
+            return None
+        # The facts classes may change the responses they are given.
+        return deepcopy(self._responses[key])
+
+    def set(self, request, response, suppr_ntf_excp=True):
+        self._responses[self.get_key(request, suppr_ntf_excp)] = deepcopy(response)
+
+    def set_view(self, name, view):
+        """Keep data derived from the responses (e.g. a part of a response
+        split for another facts class) until it is taken with pop_view()
+        """
+        self._views[name] = view
+
+    def pop_view(self, name):
+        """Return and remove a view, or None if it is not in the snapshot.
+        A view is not copied, it is given to a single caller.
+        """
+        return self._views.pop(name, None)
+
+    def clear(self):
+        self._responses.clear()
+        self._views.clear()
+
+
+def get_device_snapshot(module):
+    return getattr(module, '_sonic_snapshot', None)
+
+
+@contextmanager
+def device_snapshot(module):
+    """Share a device snapshot between all the GET requests of the module
+    sent within the context
+    """
+    if get_device_snapshot(module) is not None:
+        yield module._sonic_snapshot
+        return
+
+    module._sonic_snapshot = DeviceSnapshot()
+    try:
+        yield module._sonic_snapshot
+    finally:
+        module._sonic_snapshot = None
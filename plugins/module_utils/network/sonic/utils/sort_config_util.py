@@ -10,6 +10,11 @@ __metaclass__ = type
 from copy import (
     deepcopy
 )
+from operator import (
+    itemgetter
+)
+
+_SORT_PLANS = {}
 
 
 def get_dict_list_key_set(dict_conf):
@@ -81,43 +86,74 @@ def sort_config_dict(config, test_keys=None):
     if not config:
         return []
 
-    if test_keys is None:
-        test_keys = []
+    return sort_config_dict_by_plan(config, get_sort_plan(test_keys))
+
+
+def get_sort_plan(test_keys):
+    """Return the sort plan of the test keys, compiling it on first use.
+    The sort plan maps the key of each list sorted by its test keys to the
+    key function of the sort.
+    """
+    if not test_keys:
+        return {}
+
+    # The test keys are module constants, they are kept in the cache so that
+    # their id is not reused.
+    cached = _SORT_PLANS.get(id(test_keys))
+    if cached is None or cached[0] is not test_keys:
+        cached = (test_keys, compile_sort_plan(test_keys))
+        _SORT_PLANS[id(test_keys)] = cached
+    return cached[1]
+
+
+def compile_sort_plan(test_keys):
+    sort_plan = {}
+    for s_key_item in test_keys:
+        for key, s_info in s_key_item.items():
+            # As in get_test_key_tuple(), the first entry of a key is used.
+            if not key or key in sort_plan:
+                continue
+            s_key_tuple = s_info.get('__test_keys', tuple()) if s_info else tuple()
+            if not s_key_tuple:
+                sort_plan[key] = None
+                continue
+            s_key_op = s_info.get('__sort_op', __SORT_OP_DEFAULT)
+            if s_key_op is __SORT_OP_DEFAULT and len(s_key_tuple) > 1:
+                sort_plan[key] = itemgetter(*s_key_tuple)
+            else:
+                sort_plan[key] = lambda x, s_key_op=s_key_op, s_key_tuple=s_key_tuple: s_key_op(s_key_tuple, x)
+    return sort_plan
+
+
+def sort_config_dict_by_plan(config, sort_plan):
 
     new_conf = dict(sorted(config.items()))
 
-    dict_list_key_set = get_dict_list_key_set(new_conf)
-    for key in dict_list_key_set:
+    for key, conf_value in new_conf.items():
 
-        conf_value = new_conf[key]
+        if not conf_value:
+            continue
 
         if isinstance(conf_value, list):
-            c_list = conf_value
-            not_dict_item = False
             new_conf_list = list()
-            for c_item in c_list:
+            for c_item in conf_value:
                 if isinstance(c_item, dict):
-                    new_conf_dict = sort_config_dict(c_item, test_keys)
-                    new_conf_list.append(new_conf_dict)
+                    new_conf_list.append(sort_config_dict_by_plan(c_item, sort_plan) if c_item else [])
                 else:
-                    not_dict_item = True
+                    new_conf_list = None
                     break
 
-            if not_dict_item:
-                new_conf[key].sort()
-            elif new_conf_list:
-                conf_value = new_conf_list
-                s_key_tuple = get_test_key_tuple(key, test_keys)
-                s_key_op = get_sort_op(key, test_keys)
-                if s_key_tuple:
-                    conf_value = sorted(conf_value, key=lambda x: s_key_op(s_key_tuple, x))
-                new_conf[key] = conf_value
+            if new_conf_list is None:
+                conf_value.sort()
+            else:
+                # The list is a copy, it is sorted in place.
+                s_key_func = sort_plan.get(key)
+                if s_key_func:
+                    new_conf_list.sort(key=s_key_func)
+                new_conf[key] = new_conf_list
 
         elif isinstance(conf_value, dict):
-            new_conf[key] = sort_config_dict(conf_value, test_keys)
-
-        else:
-            continue
+            new_conf[key] = sort_config_dict_by_plan(conf_value, sort_plan)
 
     return new_conf
 
@@ -0,0 +1,165 @@
+#
+# -*- coding: utf-8 -*-
+# Copyright 2025 Dell Inc. or its subsidiaries. All Rights Reserved
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# timings
+
+"""
+Timing instrumentation of resource module runs. When enabled with the
+httpapi 'timings' option, the time of a module run is split into the
+following phases, each of them recorded as exclusive time:
+- facts_fetch: GET requests sent while gathering the facts
+- facts_render: rendering of the facts from the responses
+- diff: computation of the configuration differences
+- request_build: everything else, mostly the generation of the requests
+- commit: configuration requests sent to the device
+- post_facts: gathering of the facts after the configuration change
+The phases, together with the requests recorded by the httpapi plugin, are
+returned under the 'timings' key of the module result.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+PHASES = ('facts_fetch', 'facts_render', 'diff', 'request_build', 'commit', 'post_facts')
+
+# Phase charged with the time which is not spent in any other phase
+DEFAULT_PHASE = 'request_build'
+
+_ACTIVE_TIMINGS = None
+
+
+class ModuleTimings(object):
+    """Timings of a single module run"""
+
+    def __init__(self, timings_file=None):
+        self.start = time.time()
+        self.timings_file = timings_file
+        self.phases = dict((phase, 0.0) for phase in PHASES)
+        self.committed = False
+        self._stack = []
+        self._mark = self.start
+        self._thread = threading.current_thread()
+
+    def _charge(self):
+        now = time.time()
+        phase = self._stack[-1] if self._stack else DEFAULT_PHASE
+        self.phases[phase] += now - self._mark
+        self._mark = now
+
+    @contextmanager
+    def phase(self, phase):
+        """Record the time spent in a phase, excluding the time spent in
+        nested phases
+        """
+        if threading.current_thread() is not self._thread:
+            # The time of the facts collectors run in other threads is
+            # charged to the phase of the thread which started the module.
+            yield
+            return
+
+        if phase == 'commit':
+            self.committed = True
+        elif self.committed and phase in ('facts_fetch', 'facts_render'):
+            phase = 'post_facts'
+
+        self._charge()
+        self._stack.append(phase)
+        try:
+            yield
+        finally:
+            self._charge()
+            self._stack.pop()
+
+    def get_result(self, requests=None):
+        self._charge()
+        return {
+            'total': round(self._mark - self.start, 4),
+            'phases': dict((phase, round(value, 4)) for phase, value in self.phases.items()),
+            'requests': requests or []
+        }
+
+    def write(self, module_name, result):
+        """Append the timings of the module run to the timings file as a
+        JSON line
+        """
+        if not self.timings_file:
+            return
+        record = {'module': module_name, 'start': self.start, 'changed': result.get('changed')}
+        record.update(result['timings'])
+        with open(self.timings_file, 'a') as timings_file:
+            timings_file.write(json.dumps(record, sort_keys=True) + '\n')
+
+
+def get_active_timings():
+    return _ACTIVE_TIMINGS
+
+
+def start_timings(module, connection, timings_file=None):
+    """Start the timings of a module run. The timings are added to the
+    result when the module exits.
+    """
+    global _ACTIVE_TIMINGS
+
+    timings = ModuleTimings(timings_file)
+    _ACTIVE_TIMINGS = timings
+    # Discard the requests recorded by the connection for a previous module
+    # run which did not exit normally.
+    connection.get_request_timings()
+
+    def exit_with_timings(exit_func):
+        @wraps(exit_func)
+        def wrapper(*args, **kwargs):
+            try:
+                requests = connection.get_request_timings()
+            except Exception:
+                requests = None
+            kwargs['timings'] = timings.get_result(requests)
+            try:
+                timings.write(module._name, kwargs)
+            except (IOError, OSError) as exc:
+                module.warn('Could not write the timings to %s: %s' % (timings.timings_file, exc))
+            return exit_func(*args, **kwargs)
+        return wrapper
+
+    module.exit_json = exit_with_timings(module.exit_json)
+    module.fail_json = exit_with_timings(module.fail_json)
+    return timings
+
+
+def timed_phase(phase):
+    """Return a context manager recording the time spent in a phase of the
+    active module run
+    """
+    if _ACTIVE_TIMINGS is None:
+        return _no_timings()
+    return _ACTIVE_TIMINGS.phase(phase)
+
+
+@contextmanager
+def _no_timings():
+    yield
+
+
+def timed(phase):
+    """Decorator recording the time spent in a function as a phase of the
+    active module run
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _ACTIVE_TIMINGS is None:
+                return func(*args, **kwargs)
+            with _ACTIVE_TIMINGS.phase(phase):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
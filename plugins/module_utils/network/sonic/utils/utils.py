@@ -25,10 +25,12 @@ from ansible.module_utils.common.network import (
 )
 from ansible.module_utils.common.validation import check_required_arguments
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
+    get_connection_option,
     to_request,
     edit_config
 )
 from ansible.module_utils.connection import ConnectionError
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.timings import timed
 
 DEFAULT_TEST_KEY = {'config': {'name': ''}}
 GET = 'get'
@@ -65,6 +67,7 @@ def add_config_defaults(root, default_entry):
                 root[default_entry[0]['name']] = default_entry[0]['default']
 
 
+@timed('diff')
 def get_diff(base_data, compare_with_data, test_keys=None, is_skeleton=None):
     diff = []
     if is_skeleton is None:
@@ -128,38 +131,20 @@ def get_diff_dict(base_data, compare_with_data, test_keys=None, is_skeleton=None
             keys_to_compare = next((test_key_item[key] for test_key_item in test_keys if key in test_key_item), None)
             changed_list = []
             if p_list and d_list:
+                remaining_keys = [test_key_item for test_key_item in test_keys if key not in test_key_item]
+                d_index = ListItemIndex(d_list, keys_to_compare, test_keys, is_skeleton)
                 for p_list_item in p_list:
                     matched = False
                     has_diff = False
-                    for d_list_item in d_list:
-                        if (isinstance(p_list_item, dict) and isinstance(d_list_item, dict)):
-                            if keys_to_compare:
-                                key_matched_cnt = 0
-                                test_keys_present_cnt = 0
-                                common_keys = set(p_list_item).intersection(d_list_item)
+                    position = d_index.find(p_list_item)
+                    if position is not None:
+                        matched = True
+                        if keys_to_compare and isinstance(p_list_item, dict):
+                            dict_diff = get_diff_dict(p_list_item, d_list[position], remaining_keys, is_skeleton)
+                            if dict_diff:
+                                has_diff = True
                                 for test_key in keys_to_compare:
-                                    if test_key in common_keys:
-                                        test_keys_present_cnt += 1
-                                        if p_list_item[test_key] == d_list_item[test_key]:
-                                            key_matched_cnt += 1
-                                if key_matched_cnt and key_matched_cnt == test_keys_present_cnt:
-                                    remaining_keys = [test_key_item for test_key_item in test_keys if key not in test_key_item]
-                                    dict_diff = get_diff_dict(p_list_item, d_list_item, remaining_keys, is_skeleton)
-                                    matched = True
-                                    if dict_diff:
-                                        has_diff = True
-                                        for test_key in keys_to_compare:
-                                            dict_diff.update({test_key: p_list_item[test_key]})
-                                    break
-                            else:
-                                dict_diff = get_diff_dict(p_list_item, d_list_item, test_keys, is_skeleton)
-                                if not dict_diff:
-                                    matched = True
-                                    break
-                        else:
-                            if p_list_item == d_list_item:
-                                matched = True
-                                break
+                                    dict_diff.update({test_key: p_list_item[test_key]})
                     if not matched:
                         if is_skeleton:
                             changed_list.append(p_list_item)
@@ -192,6 +177,93 @@ def get_diff_dict(base_data, compare_with_data, test_keys=None, is_skeleton=None
     return changed_dict
 
 
+class ListItemIndex(object):
+    """Index of the items of a list compared by get_diff_dict(). It finds
+    the first item of the list which matches a given item, like a scan of
+    the list, without comparing the item with each item of the list:
+    - dicts match if at least one of the test keys is present in both and
+      the test keys present in both have the same values
+    - other items match if they are equal
+    Dicts compared without test keys, and items with unhashable values, are
+    matched by scanning the list.
+    """
+
+    def __init__(self, items, keys_to_compare, test_keys, is_skeleton):
+        self._items = items
+        self._keys_to_compare = keys_to_compare
+        self._test_keys = test_keys
+        self._is_skeleton = is_skeleton
+        self._groups = None
+        self._indexes = {}
+        self._values = None
+        self._unhashable_positions = None
+
+    def find(self, item):
+        """Return the position of the first matching item, or None"""
+        try:
+            if isinstance(item, dict):
+                if self._keys_to_compare:
+                    return self._find_dict(item)
+            else:
+                return self._find_value(item)
+        except TypeError:
+            pass
+        return next((position for position, list_item in enumerate(self._items) if self._match(item, list_item)), None)
+
+    def _find_dict(self, item):
+        if self._groups is None:
+            # The dicts are grouped by the test keys they contain.
+            self._groups = {}
+            for position, list_item in enumerate(self._items):
+                if isinstance(list_item, dict):
+                    present_keys = tuple(test_key for test_key in self._keys_to_compare if test_key in list_item)
+                    self._groups.setdefault(present_keys, []).append(position)
+
+        item_keys = [test_key for test_key in self._keys_to_compare if test_key in item]
+        found = None
+        for present_keys, positions in self._groups.items():
+            common_keys = tuple(test_key for test_key in item_keys if test_key in present_keys)
+            if not common_keys:
+                continue
+            index = self._indexes.get((present_keys, common_keys))
+            if index is None:
+                index = {}
+                for position in reversed(positions):
+                    index[tuple(self._items[position][test_key] for test_key in common_keys)] = position
+                self._indexes[(present_keys, common_keys)] = index
+            position = index.get(tuple(item[test_key] for test_key in common_keys))
+            if position is not None and (found is None or position < found):
+                found = position
+        return found
+
+    def _find_value(self, item):
+        if self._values is None:
+            self._values = {}
+            self._unhashable_positions = []
+            for position in reversed(range(len(self._items))):
+                try:
+                    self._values[self._items[position]] = position
+                except TypeError:
+                    self._unhashable_positions.append(position)
+            self._unhashable_positions.reverse()
+        found = self._values.get(item)
+        # Unhashable items (e.g. BgpAsn) may define their own equality.
+        for position in self._unhashable_positions:
+            if found is not None and position > found:
+                break
+            if item == self._items[position]:
+                return position
+        return found
+
+    def _match(self, item, list_item):
+        if isinstance(item, dict) and isinstance(list_item, dict):
+            if self._keys_to_compare:
+                common_keys = [test_key for test_key in self._keys_to_compare if test_key in item and test_key in list_item]
+                return bool(common_keys) and all(item[test_key] == list_item[test_key] for test_key in common_keys)
+            return not get_diff_dict(item, list_item, self._test_keys, self._is_skeleton)
+        return item == list_item
+
+
 def convert_dict_to_single_entry_list(base_data, compare_with_data, test_keys):
     # if it is dict comparision convert dict into single entry list by adding 'config' as key
     new_base = {'config': [base_data]}
@@ -385,9 +457,17 @@ def remove_none(config):
     return config
 
 
+# Paths of the configuration changing the interface naming mode. The device
+# metadata is cached by the connection until a request changes one of them.
+INTF_NAMING_MODE_CACHE_PATHS = [
+    'data/sonic-device-metadata:sonic-device-metadata/DEVICE_METADATA/DEVICE_METADATA_LIST=*/intf_naming_mode'
+]
+
+
 def get_device_interface_naming_mode(module):
     intf_naming_mode = ""
-    request = {"path": "data/sonic-device-metadata:sonic-device-metadata/DEVICE_METADATA/DEVICE_METADATA_LIST=localhost", "method": GET}
+    request = {"path": "data/sonic-device-metadata:sonic-device-metadata/DEVICE_METADATA/DEVICE_METADATA_LIST=localhost", "method": GET,
+               "cache": INTF_NAMING_MODE_CACHE_PATHS}
     try:
         response = edit_config(module, to_request(module, request))
     except ConnectionError as exc:
@@ -500,13 +580,79 @@ def get_speed_from_breakout_mode(breakout_mode):
     return 'SPEED_' + breakout_mode.split('x')[1].replace('G', 'GB')
 
 
+PLATFORM_COMPONENTS_PATH = 'data/openconfig-platform:components'
+BREAKOUT_MODE_FIELDS = 'component(name;port/openconfig-platform-port:breakout-mode)'
+
+
 def get_breakout_mode(module, name):
+    return get_breakout_modes(module, [name]).get(name)
+
+
+def get_breakout_modes(module, names, refresh=True):
+    """Return a dict of the breakout modes of the ports, by port name. The
+    result is kept in the module, it is reused by a later call with refresh
+    set to False (e.g. by the config class after the facts are gathered).
+    """
+    modes = getattr(module, '_sonic_breakout_modes', None)
+    if refresh or modes is None or any(name not in modes for name in names):
+        modes = None
+        if get_connection_option(module, 'bulk_port_breakout'):
+            modes = get_bulk_breakout_modes(module, names)
+        if modes is None:
+            modes = get_port_breakout_modes(module, names)
+        module._sonic_breakout_modes = modes
+    return dict((name, modes.get(name)) for name in names)
+
+
+def get_bulk_breakout_modes(module, names):
+    """Return the breakout modes of the ports fetched with a single GET
+    request of the platform components, or None if the device rejects it or
+    does not return the names of the components
+    """
+    request = {'path': PLATFORM_COMPONENTS_PATH, 'method': GET, 'fields': BREAKOUT_MODE_FIELDS}
+    try:
+        response = edit_config(module, to_request(module, request))
+    except ConnectionError:
+        return None
+
+    modes = dict.fromkeys(names)
+    components = []
+    if response and response[0][1]:
+        components = response[0][1].get('openconfig-platform:components', {}).get('component', [])
+    for component in components:
+        if 'name' not in component:
+            # The breakout mode can not be attributed to its port.
+            return None
+        if component['name'] in modes:
+            modes[component['name']] = get_breakout_mode_from_component(component)
+    return modes
+
+
+def get_port_breakout_modes(module, names):
+    """Return the breakout modes of the ports, requesting the component of
+    each port in a single request list
+    """
+    requests = [{'path': '%s/component=%s' % (PLATFORM_COMPONENTS_PATH, name.replace('/', '%2f')), 'method': GET} for name in names]
+    if not requests:
+        return {}
+    try:
+        responses = edit_config(module, to_request(module, requests))
+    except ConnectionError:
+        # Find the port whose request failed.
+        return dict((name, get_single_breakout_mode(module, name)) for name in names)
+
+    modes = {}
+    for name, response in zip(names, responses):
+        modes[name] = None
+        if response and response[1] and 'openconfig-platform:component' in response[1]:
+            modes[name] = get_breakout_mode_from_component(response[1]['openconfig-platform:component'][0])
+    return modes
+
+
+def get_single_breakout_mode(module, name):
     response = None
     mode = None
-    component_name = name
-    if "/" in name:
-        component_name = name.replace("/", "%2f")
-    url = "data/openconfig-platform:components/component=%s" % (component_name)
+    url = '%s/component=%s' % (PLATFORM_COMPONENTS_PATH, name.replace('/', '%2f'))
     request = [{"path": url, "method": GET}]
     try:
         response = edit_config(module, to_request(module, request))
@@ -521,23 +667,85 @@ def get_breakout_mode(module, name):
             module.fail_json(msg=str(exc), code=exc.code)
 
     if response and "openconfig-platform:component" in response[0][1]:
-        raw_port_breakout = response[0][1]['openconfig-platform:component'][0]
-        port_name = raw_port_breakout.get('name', None)
-        port_data = raw_port_breakout.get('port', None)
-        if port_name and port_data and 'openconfig-platform-port:breakout-mode' in port_data:
-            if 'groups' in port_data['openconfig-platform-port:breakout-mode']:
-                group = port_data['openconfig-platform-port:breakout-mode']['groups']['group'][0]
-                if 'config' in group:
-                    cfg = group.get('config', None)
-                    breakout_speed = cfg.get('breakout-speed', None)
-                    num_breakouts = cfg.get('num-breakouts', None)
-                    if breakout_speed and num_breakouts:
-                        speed = breakout_speed.replace('openconfig-if-ethernet:SPEED_', '')
-                        speed = speed.replace('GB', 'G')
-                        mode = str(num_breakouts) + 'x' + speed
+        mode = get_breakout_mode_from_component(response[0][1]['openconfig-platform:component'][0])
     return mode
 
 
+def get_breakout_mode_from_component(raw_port_breakout):
+    mode = None
+    port_name = raw_port_breakout.get('name', None)
+    port_data = raw_port_breakout.get('port', None)
+    if port_name and port_data and 'openconfig-platform-port:breakout-mode' in port_data:
+        if 'groups' in port_data['openconfig-platform-port:breakout-mode']:
+            group = port_data['openconfig-platform-port:breakout-mode']['groups']['group'][0]
+            if 'config' in group:
+                cfg = group.get('config', None)
+                breakout_speed = cfg.get('breakout-speed', None)
+                num_breakouts = cfg.get('num-breakouts', None)
+                if breakout_speed and num_breakouts:
+                    speed = breakout_speed.replace('openconfig-if-ethernet:SPEED_', '')
+                    speed = speed.replace('GB', 'G')
+                    mode = str(num_breakouts) + 'x' + speed
+    return mode
+
+
+def get_subtree_response(node, subpath, module_name):
+    """Return the GET response of a subtree path of a node, in the format of
+    the response of a request for the subtree path. The module name is the
+    name of the YANG module of the node. Return None if a list entry of the
+    subtree path can not be identified because the keys of the list entries
+    are not returned in the node.
+    """
+    segments = subpath.split('/')
+    for index, segment in enumerate(segments):
+        name, sep, keys = segment.partition('=')
+        if ':' in name:
+            module_name, name = name.split(':', 1)
+        node = get_subtree_child(node, name, module_name)
+        if node is not None and sep:
+            entries = node
+            node = get_subtree_list_entry(entries, keys.split(','))
+            if node is None and has_unidentified_entries(entries, keys.split(',')):
+                return None
+            if node is not None and index + 1 == len(segments):
+                node = [node]
+        if node is None:
+            # Same as a 'not found' response
+            return [{}, {}]
+
+    return [200, {'%s:%s' % (module_name, name): node}]
+
+
+def get_subtree_child(node, name, module_name):
+    if not isinstance(node, dict):
+        return None
+    if name in node:
+        return node[name]
+    # Augmented nodes are qualified with the name of their module.
+    return node.get('%s:%s' % (module_name, name))
+
+
+def get_subtree_list_entry(entries, keys):
+    if not isinstance(entries, list):
+        return None
+    for entry in entries:
+        if all(key in get_entry_values(entry) for key in keys):
+            return entry
+    return None
+
+
+def has_unidentified_entries(entries, keys):
+    # The keys of the list entries may not be returned for the selected
+    # fields. The entries with fewer leaves than keys can not be told apart.
+    if not isinstance(entries, list):
+        return False
+    return any(len(get_entry_values(entry)) < len(keys) for entry in entries)
+
+
+def get_entry_values(entry):
+    return set(str(value).split(':')[-1] for value in entry.values() if not isinstance(value, (dict, list)))
+
+
 def command_list_str_to_dict(module, warnings, cmd_list_in, exec_cmd=False):
     cmd_list_out = []
     for cmd in cmd_list_in:
@@ -584,6 +792,7 @@ def send_requests(module, requests):
     return reply
 
 
+@timed('diff')
 def get_replaced_config(new_conf, exist_conf, test_keys=None):
 
     replace_conf = []
@@ -688,26 +897,28 @@ def get_replaced_config_dict(new_conf, exist_conf, test_keys=None, key_set=None)
             replaced_list = list()
             not_dict_item = False
             dict_no_key_item = False
-            for n_item in n_list:
-                for e_item in e_list:
-                    if (isinstance(n_item, dict) and isinstance(e_item, dict)):
-                        if t_keys:
-                            remaining_keys = [t_key_item for t_key_item in test_keys if key not in t_key_item]
+            if t_keys:
+                remaining_keys = [t_key_item for t_key_item in test_keys if key not in t_key_item]
+                e_index = ListKeyIndex(e_list, t_key_set)
+                for n_item in n_list:
+                    for e_position in e_index.find_candidates(n_item):
+                        e_item = e_list[e_position]
+                        if (isinstance(n_item, dict) and isinstance(e_item, dict)):
                             replaced_dict = get_replaced_config_dict(n_item, e_item,
                                                                      remaining_keys, t_key_set)
+                            if replaced_dict:
+                                replaced_list.append(replaced_dict)
+                                break
                         else:
-                            dict_no_key_item = True
+                            not_dict_item = True
                             break
 
-                        if replaced_dict:
-                            replaced_list.append(replaced_dict)
-                            break
-                    else:
-                        not_dict_item = True
+                    if not_dict_item:
                         break
-
-                if not_dict_item or dict_no_key_item:
-                    break
+            elif (isinstance(n_list[0], dict) and isinstance(e_list[0], dict)):
+                dict_no_key_item = True
+            else:
+                not_dict_item = True
 
             if dict_no_key_item:
                 replaced_list = e_list
@@ -746,6 +957,58 @@ def get_replaced_config_dict(new_conf, exist_conf, test_keys=None, key_set=None)
     return replaced_conf
 
 
+class ListKeyIndex(object):
+    """Index of the dicts of a list compared by get_replaced_config_dict(),
+    by the values of their test keys. The candidates for an item are the
+    positions of the dicts which have the same non-empty values for all the
+    test keys, in the order of the list. A scan of the list stops at the
+    first item which is not a dict, so the candidates stop there too.
+    """
+
+    def __init__(self, items, test_keys):
+        self._items = items
+        self._test_keys = tuple(test_keys)
+        self._stop = next((position for position, item in enumerate(items) if not isinstance(item, dict)), len(items))
+        self._index = None
+
+    def find_candidates(self, item):
+        """Return the positions of the items of the list which may match
+        the given item
+        """
+        if not isinstance(item, dict):
+            # Only dicts are matched by their test keys.
+            return range(min(1, len(self._items)))
+        if self._index is None:
+            self._index = {}
+            try:
+                for position in range(self._stop):
+                    values = self._get_values(self._items[position])
+                    if values is not None:
+                        self._index.setdefault(values, []).append(position)
+            except TypeError:
+                self._index = False
+        try:
+            if self._index is False:
+                raise TypeError()
+            values = self._get_values(item)
+            positions = self._index.get(values, []) if values is not None else []
+        except TypeError:
+            # Unhashable values are compared with each item
+            positions = range(self._stop)
+        if self._stop < len(self._items):
+            positions = list(positions) + [self._stop]
+        return positions
+
+    def _get_values(self, item):
+        values = []
+        for test_key in self._test_keys:
+            value = item.get(test_key)
+            if value in [None, [], {}]:
+                return None
+            values.append(value)
+        return tuple(values)
+
+
 def check_required(module, required_parameters, parameters, options_context=None):
     '''This utility is a wrapper for the Ansible "check_required_arguments"
     function. The "required_parameters" input list provides a list of
@@ -98,6 +98,12 @@ commands:
   returned: always
   type: list
   sample: ['command 1', 'command 2', 'command 3']
+reboot_downtime:
+  description: The number of seconds the device took to become ready again after the reboot caused by the configuration change.
+  returned: when the device reboots
+  type: float
+  sample: 92.4
+  version_added: 3.1.0
 """
 
 
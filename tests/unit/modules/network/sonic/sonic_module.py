@@ -56,6 +56,13 @@ class TestSonicModule(ModuleTestCase):
 
         return data
 
+    @staticmethod
+    def patch_connection_options(target, options):
+        """Return a patch of the get_connection_option() imported by the
+        target module, which returns the given connection options
+        """
+        return patch(target + '.get_connection_option', side_effect=lambda module, option: options.get(option))
+
     def initialize_facts_get_requests(self, facts_get_requests):
         for request in facts_get_requests:
             self._facts_requests_dict[request['path']] = request['response']
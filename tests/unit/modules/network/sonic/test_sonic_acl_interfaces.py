@@ -20,7 +20,7 @@ class TestSonicAclInterfacesModule(TestSonicModule):
     @classmethod
     def setUpClass(cls):
         cls.mock_facts_edit_config = patch(
-            "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.acl_interfaces.acl_interfaces.edit_config"
+            "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.acl_utils.edit_config"
         )
         cls.mock_config_edit_config = patch(
             "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.config.acl_interfaces.acl_interfaces.edit_config"
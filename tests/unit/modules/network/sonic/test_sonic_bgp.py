@@ -46,6 +46,16 @@ class TestSonicBgpModule(TestSonicModule):
         result = self.execute_module(changed=True)
         self.validate_config_requests()
 
+    def test_sonic_bgp_merged_02(self):
+        # The BGP globals of all the VRFs are fetched with a single request.
+        set_module_args(self.fixture_data['merged_02']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['merged_02']['existing_bgp_config'])
+        self.initialize_config_requests(self.fixture_data['merged_02']['expected_config_requests'])
+        with self.patch_connection_options('ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.bgp_utils',
+                                           {'bulk_network_instances': True}):
+            result = self.execute_module(changed=True)
+        self.validate_config_requests()
+
     def test_sonic_bgp_deleted_01(self):
         set_module_args(self.fixture_data['deleted_01']['module_args'])
         self.initialize_facts_get_requests(self.fixture_data['deleted_01']['existing_bgp_config'])
@@ -20,7 +20,7 @@ class TestSonicL3AclsModule(TestSonicModule):
     @classmethod
     def setUpClass(cls):
         cls.mock_facts_edit_config = patch(
-            "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l3_acls.l3_acls.edit_config"
+            "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.acl_utils.edit_config"
         )
         cls.mock_config_edit_config = patch(
             "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.config.l3_acls.l3_acls.edit_config"
@@ -103,3 +103,13 @@ class TestSonicL3AclsModule(TestSonicModule):
 
         result = self.execute_module(changed=True)
         self.validate_config_requests()
+
+    def test_sonic_l3_acls_deleted_02_acl_sets_requested_once(self):
+        set_module_args(self.fixture_data['deleted_02']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['deleted_02']['facts_get_requests'])
+        self.initialize_config_requests(self.fixture_data['deleted_02']['config_requests'])
+
+        result = self.execute_module(changed=True)
+        # The IPv4 and IPv6 ACL sets are requested together, once in the
+        # facts gathering before and once after the configuration change.
+        self.assertEqual(self.facts_edit_config.call_count, 2)
@@ -19,9 +19,6 @@ class TestSonicOspfAreaModule(TestSonicModule):
 
     @classmethod
     def setUpClass(cls):
-        cls.mock_facts_edit_config = patch(
-            "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ospf_area.ospf_area.edit_config"
-        )
         cls.mock_config_edit_config = patch(
             "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.config.ospf_area.ospf_area.edit_config"
         )
@@ -36,8 +33,6 @@ class TestSonicOspfAreaModule(TestSonicModule):
 
     def setUp(self):
         super(TestSonicOspfAreaModule, self).setUp()
-        self.facts_edit_config = self.mock_facts_edit_config.start()
-        self.facts_edit_config.side_effect = self.facts_side_effect
 
         self.config_edit_config = self.mock_config_edit_config.start()
         self.config_edit_config.side_effect = self.config_side_effect
@@ -50,7 +45,6 @@ class TestSonicOspfAreaModule(TestSonicModule):
 
     def tearDown(self):
         super(TestSonicOspfAreaModule, self).tearDown()
-        self.mock_facts_edit_config.stop()
         self.mock_config_edit_config.stop()
         self.mock_get_interface_naming_mode.stop()
         self.mock_bgp_utils_edit_config.stop()
@@ -19,9 +19,6 @@ class TestSonicOspfv2Module(TestSonicModule):
 
     @classmethod
     def setUpClass(cls):
-        cls.mock_facts_edit_config = patch(
-            "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.ospfv2.ospfv2.edit_config"
-        )
         cls.mock_config_edit_config = patch(
             "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.config.ospfv2.ospfv2.edit_config"
         )
@@ -35,11 +32,9 @@ class TestSonicOspfv2Module(TestSonicModule):
 
     def setUp(self):
         super(TestSonicOspfv2Module, self).setUp()
-        self.facts_edit_config = self.mock_facts_edit_config.start()
         self.config_edit_config = self.mock_config_edit_config.start()
         self.utils_edit_config = self.mock_bgp_utils_edit_config.start()
 
-        self.facts_edit_config.side_effect = self.facts_side_effect
         self.config_edit_config.side_effect = self.config_side_effect
         self.utils_edit_config.side_effect = self.facts_side_effect
 
@@ -48,7 +43,6 @@ class TestSonicOspfv2Module(TestSonicModule):
 
     def tearDown(self):
         super(TestSonicOspfv2Module, self).tearDown()
-        self.mock_facts_edit_config.stop()
         self.mock_config_edit_config.stop()
         self.mock_bgp_utils_edit_config.stop()
         self.mock_get_interface_naming_mode.stop()
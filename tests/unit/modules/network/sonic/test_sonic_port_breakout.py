@@ -74,6 +74,16 @@ class TestSonicPortBreakoutModule(TestSonicModule):
         result = self.execute_module(changed=True)
         self.validate_config_requests()
 
+    def test_sonic_port_breakout_deleted_03(self):
+        # The breakout modes of all the ports are fetched with a single request.
+        set_module_args(self.fixture_data['deleted_03']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['deleted_03']['existing_port_breakout_config'])
+        self.initialize_config_requests(self.fixture_data['deleted_03']['expected_config_requests'])
+        with self.patch_connection_options('ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils',
+                                           {'bulk_port_breakout': True}):
+            result = self.execute_module(changed=True)
+        self.validate_config_requests()
+
     def test_sonic_port_breakout_replaced_01(self):
         set_module_args(self.fixture_data['replaced_01']['module_args'])
         self.initialize_facts_get_requests(self.fixture_data['replaced_01']['existing_port_breakout_config'])
@@ -22,6 +22,9 @@ class TestSonicQosBufferModule(TestSonicModule):
         cls.mock_facts_edit_config = patch(
             "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.qos_buffer.qos_buffer.edit_config"
         )
+        cls.mock_qos_utils_edit_config = patch(
+            "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.qos_utils.edit_config"
+        )
         cls.mock_config_edit_config_reboot = patch(
             "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.config.qos_buffer.qos_buffer.edit_config_reboot"
         )
@@ -35,6 +38,8 @@ class TestSonicQosBufferModule(TestSonicModule):
         self.facts_edit_config = self.mock_facts_edit_config.start()
         self.config_edit_config = self.mock_config_edit_config_reboot.start()
         self.facts_edit_config.side_effect = self.facts_side_effect
+        self.qos_utils_edit_config = self.mock_qos_utils_edit_config.start()
+        self.qos_utils_edit_config.side_effect = self.facts_side_effect
         self.config_edit_config.side_effect = self.config_side_effect
         self.get_interface_naming_mode = self.mock_get_interface_naming_mode.start()
         self.get_interface_naming_mode.return_value = 'native'
@@ -42,6 +47,7 @@ class TestSonicQosBufferModule(TestSonicModule):
     def tearDown(self):
         super(TestSonicQosBufferModule, self).tearDown()
         self.mock_facts_edit_config.stop()
+        self.mock_qos_utils_edit_config.stop()
         self.mock_config_edit_config_reboot.stop()
         self.mock_get_interface_naming_mode.stop()
 
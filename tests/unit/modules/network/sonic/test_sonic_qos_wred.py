@@ -20,7 +20,7 @@ class TestSonicQosWredModule(TestSonicModule):
     @classmethod
     def setUpClass(cls):
         cls.mock_facts_edit_config = patch(
-            "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.qos_wred.qos_wred.edit_config"
+            "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.qos_utils.edit_config"
         )
         cls.mock_config_edit_config = patch(
             "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.config.qos_wred.qos_wred.edit_config"
@@ -78,3 +78,13 @@ class TestSonicQosWredModule(TestSonicModule):
         self.initialize_config_requests(self.fixture_data['deleted_01']['expected_config_requests'])
         result = self.execute_module(changed=True)
         self.validate_config_requests()
+
+    def test_sonic_qos_wred_deleted_02(self):
+        # The WRED profiles are taken from the whole QoS configuration.
+        set_module_args(self.fixture_data['deleted_02']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['deleted_02']['existing_qos_wred_config'])
+        self.initialize_config_requests(self.fixture_data['deleted_02']['expected_config_requests'])
+        with self.patch_connection_options('ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.qos_utils',
+                                           {'bulk_qos': True}):
+            result = self.execute_module(changed=True)
+        self.validate_config_requests()
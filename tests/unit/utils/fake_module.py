@@ -0,0 +1,52 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+from ansible.module_utils.common.parameters import DEFAULT_TYPE_VALIDATORS
+from ansible.module_utils.connection import ConnectionError
+
+
+class FakeConnection(object):
+
+    def __init__(self, module):
+        self._module = module
+
+    def edit_config(self, commands, suppr_ntf_excp=True):
+        return self._module.send_requests(commands)
+
+
+class FakeModule(object):
+    """Module whose requests are answered by get_response() of a subclass.
+    The 'bulk' value is returned for the connection option named by
+    'bulk_option', all other options are unset; the bulk requests are
+    rejected by the device if it is 'unsupported'.
+    """
+    # Used by to_request()
+    _CHECK_ARGUMENT_TYPES_DISPATCHER = DEFAULT_TYPE_VALIDATORS
+    bulk_option = None
+
+    def __init__(self, bulk=None):
+        self._socket_path = None
+        self._sonic_connection = FakeConnection(self)
+        self.bulk = bulk
+        self.requests_sent = []
+
+    def fail_json(self, **kwargs):
+        raise AssertionError(kwargs['msg'])
+
+    def send_requests(self, commands):
+        self.requests_sent.extend(commands)
+        if self.bulk == 'unsupported' and any(self.is_bulk_request(command) for command in commands):
+            raise ConnectionError('Bad request')
+        return [self.get_response(command) for command in commands]
+
+    def is_bulk_request(self, command):
+        return bool(command.get('fields'))
+
+    def get_response(self, command):
+        return [{}, {}]
+
+    def get_connection_option(self, module, option):
+        if option == self.bulk_option:
+            return self.bulk
+        return None
@@ -0,0 +1,89 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import unittest
+
+from ansible_collections.dellemc.enterprise_sonic.tests.unit.utils.fake_module import FakeModule
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l2_acls.l2_acls import L2_aclsFacts
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.l3_acls.l3_acls import L3_aclsFacts
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.acl_utils import (
+    get_acl_sets,
+    split_acl_sets
+)
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.snapshot import device_snapshot
+
+
+def get_acl_set(name, acl_type, rules=None):
+    acl = {'name': name, 'type': acl_type, 'config': {'name': name, 'type': acl_type}}
+    if rules:
+        acl['acl-entries'] = {'acl-entry': rules}
+    return acl
+
+
+L2_RULE = {'sequence-id': 1, 'config': {'sequence-id': 1}, 'actions': {'config': {'forwarding-action': 'ACCEPT'}},
+           'l2': {'config': {'ethertype': 'openconfig-packet-match-types:ETHERTYPE_ARP'}}}
+L3_RULE = {'sequence-id': 1, 'config': {'sequence-id': 1}, 'actions': {'config': {'forwarding-action': 'DROP'}},
+           'ipv4': {'config': {'protocol': 'openconfig-packet-match-types:IP_TCP', 'source-address': '1.1.1.0/24',
+                               'destination-address': '0.0.0.0/0'}}}
+
+ACL_SETS = [
+    get_acl_set('mac1', 'openconfig-acl:ACL_L2', [L2_RULE]),
+    get_acl_set('ipv4-1', 'openconfig-acl:ACL_IPV4', [L3_RULE]),
+    get_acl_set('ipv6-1', 'ACL_IPV6'),
+    get_acl_set('mac2', 'ACL_L2'),
+    get_acl_set('mirror', 'ACL_MIRROR')
+]
+
+
+class AclModule(FakeModule):
+
+    def get_response(self, command):
+        return [200, {'openconfig-acl:acl-sets': {'acl-set': ACL_SETS}}]
+
+
+class TestAclUtils(unittest.TestCase):
+
+    def test_split_acl_sets(self):
+        acl_sets = split_acl_sets(ACL_SETS)
+        self.assertEqual([acl['name'] for acl in acl_sets['mac']], ['mac1', 'mac2'])
+        self.assertEqual([acl['name'] for acl in acl_sets['ipv4']], ['ipv4-1'])
+        self.assertEqual([acl['name'] for acl in acl_sets['ipv6']], ['ipv6-1'])
+
+    def test_shared_in_facts_gathering(self):
+        module = AclModule()
+        with device_snapshot(module):
+            l2_facts = L2_aclsFacts(module).populate_facts(None, {'ansible_network_resources': {}})
+            l3_facts = L3_aclsFacts(module).populate_facts(None, {'ansible_network_resources': {}})
+        self.assertEqual(len(module.requests_sent), 1)
+        self.assertEqual([acl['name'] for acl in l2_facts['ansible_network_resources']['l2_acls']], ['mac1', 'mac2'])
+        l3_acls = l3_facts['ansible_network_resources']['l3_acls']
+        self.assertEqual([(afi['address_family'], [acl['name'] for acl in afi['acls']]) for afi in l3_acls],
+                         [('ipv4', ['ipv4-1']), ('ipv6', ['ipv6-1'])])
+
+    def test_acl_sets_given_once(self):
+        module = AclModule()
+        with device_snapshot(module):
+            get_acl_sets(module, 'mac')
+            get_acl_sets(module, 'ipv4')
+            self.assertEqual(len(module.requests_sent), 1)
+            # The sets of a type already taken are requested again.
+            get_acl_sets(module, 'mac')
+            self.assertEqual(len(module.requests_sent), 2)
+
+        # Without a snapshot, every call requests the ACL sets.
+        get_acl_sets(module, 'ipv6')
+        get_acl_sets(module, 'ipv6')
+        self.assertEqual(len(module.requests_sent), 4)
+
+    def test_acl_sets_of_types(self):
+        module = AclModule()
+        acl_sets = get_acl_sets(module, ('ipv4', 'ipv6'))
+        self.assertEqual(len(module.requests_sent), 1)
+        self.assertEqual([acl['name'] for acl in acl_sets], ['ipv4-1', 'ipv6-1'])
+
+        with device_snapshot(module):
+            get_acl_sets(module, 'mac')
+            acl_sets = get_acl_sets(module, ('ipv6', 'ipv4'))
+            self.assertEqual(len(module.requests_sent), 2)
+            self.assertEqual([acl['name'] for acl in acl_sets], ['ipv6-1', 'ipv4-1'])
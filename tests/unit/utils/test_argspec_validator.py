@@ -0,0 +1,134 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import json
+import unittest
+
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import utils
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.l3_acls.l3_acls import L3_aclsArgs
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.vlans.vlans import VlansArgs
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.argspec_validator import (
+    FallbackRequired,
+    compile_argspec,
+    get_compiled_argspec,
+    trusted_validation,
+    validate_config
+)
+
+TEST_SPEC = {
+    'config': {
+        'type': 'dict',
+        'options': {
+            'name': {'type': 'str', 'required': True},
+            'mtu': {'type': 'int'},
+            'enabled': {'type': 'bool', 'default': True},
+            'mode': {'type': 'str', 'choices': ['on', 'off']},
+            'members': {'type': 'list', 'elements': 'str'},
+            'tags': {'type': 'list'},
+            'attributes': {'type': 'dict'}
+        }
+    },
+    'state': {'type': 'str', 'choices': ['merged', 'deleted'], 'default': 'merged'}
+}
+
+L3_ACLS_CONFIG = [
+    {
+        'address_family': 'ipv4',
+        'acls': [
+            {
+                'name': 'acl1',
+                'rules': [
+                    {
+                        'sequence_num': 1,
+                        'action': 'permit',
+                        'protocol': {'name': 'tcp'},
+                        'source': {'prefix': '10.1.1.0/24', 'port_number': {'range': {'begin': '10', 'end': 20}}},
+                        'destination': {'any': True},
+                        'dscp': {'value': 8}
+                    },
+                    {
+                        'sequence_num': '2',
+                        'action': 'deny',
+                        'protocol': {'number': 17},
+                        'source': {'host': '10.1.1.1'},
+                        'destination': {'any': 'true'},
+                        'vlan_id': 10
+                    }
+                ]
+            },
+            {'name': 'acl2', 'remark': 'empty'}
+        ]
+    }
+]
+
+
+class TestArgspecValidator(unittest.TestCase):
+
+    def assert_same_as_generic(self, argument_spec, data):
+        expected = utils.validate_config(argument_spec, data)
+        result = validate_config(argument_spec, data)
+        self.assertEqual(result, expected)
+        # The options are also in the same order
+        self.assertEqual(json.dumps(result), json.dumps(expected))
+
+    def test_same_as_generic_validator(self):
+        self.assert_same_as_generic(L3_aclsArgs.argument_spec, {'config': L3_ACLS_CONFIG})
+        self.assert_same_as_generic(VlansArgs.argument_spec, {'config': [{'vlan_id': '10', 'description': 5}]})
+        self.assert_same_as_generic(TEST_SPEC, {'config': {
+            'name': 10, 'mtu': '9100', 'enabled': 'no', 'members': 'Eth1/1,Eth1/2', 'tags': [{'a': [1]}],
+            'attributes': {'speed': 10}
+        }})
+
+    def test_data_not_changed(self):
+        data = {'config': L3_ACLS_CONFIG}
+        data_copy = json.loads(json.dumps(data))
+        result = validate_config(L3_aclsArgs.argument_spec, data)
+        self.assertEqual(data, data_copy)
+
+        result['config'][0]['acls'][0]['rules'][0]['protocol']['name'] = 'udp'
+        self.assertEqual(data, data_copy)
+
+    def test_compiled_once(self):
+        validate = get_compiled_argspec(L3_aclsArgs.argument_spec)
+        self.assertIsNotNone(validate)
+        self.assertIs(get_compiled_argspec(L3_aclsArgs.argument_spec), validate)
+
+    def test_fallback(self):
+        validate = compile_argspec(TEST_SPEC)
+        for config in (
+            {'name': 'vlan1', 'unknown': 1},
+            {'mtu': 9100},
+            {'name': 'vlan1', 'mtu': 'large'},
+            {'name': 'vlan1', 'mode': 'True'},
+            {'name': 'vlan1', 'enabled': None},
+            {'name': 'vlan1', 'mode': None}
+        ):
+            with self.assertRaises((FallbackRequired, TypeError, ValueError)):
+                validate({'config': config})
+
+        # AnsibleModule converts a boolean string to a matching choice.
+        self.assertEqual(validate_config(TEST_SPEC, {'config': {'name': 'vlan1', 'mode': 'True'}})['config']['mode'], 'on')
+
+    def test_unsupported_spec(self):
+        self.assertIsNone(compile_argspec({'name': {'type': 'str', 'aliases': ['id']}}))
+        self.assertIsNone(compile_argspec({'name': {'type': lambda value: value}}))
+        self.assertEqual(validate_config({'name': {'type': 'str', 'aliases': ['id']}}, {'name': 'a'}), {'name': 'a'})
+
+    def test_trusted_validation_disabled(self):
+        calls = []
+        generic_validate_config = utils.validate_config
+
+        def validate_config_spy(argument_spec, data):
+            calls.append(data)
+            return generic_validate_config(argument_spec, data)
+
+        utils.validate_config = validate_config_spy
+        try:
+            validate_config(TEST_SPEC, {'config': {'name': 'vlan1'}})
+            self.assertEqual(calls, [])
+            with trusted_validation(False):
+                validate_config(TEST_SPEC, {'config': {'name': 'vlan1'}})
+            self.assertEqual(len(calls), 1)
+        finally:
+            utils.validate_config = generic_validate_config
@@ -0,0 +1,87 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import unittest
+
+from ansible_collections.dellemc.enterprise_sonic.tests.unit.compat.mock import (
+    patch,
+)
+from ansible_collections.dellemc.enterprise_sonic.tests.unit.utils.fake_module import FakeModule
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
+    get_breakout_mode,
+    get_breakout_modes
+)
+
+
+def get_component(name, num_breakouts, speed):
+    group = {'index': 1, 'config': {'index': 1, 'num-breakouts': num_breakouts, 'breakout-speed': 'openconfig-if-ethernet:SPEED_%s' % speed}}
+    return {'name': name, 'port': {'openconfig-platform-port:breakout-mode': {'groups': {'group': [group]}}}}
+
+
+COMPONENTS = {
+    'Eth1/1': get_component('Eth1/1', 4, '10GB'),
+    'Eth1/5': get_component('Eth1/5', 2, '100GB')
+}
+
+
+class PlatformModule(FakeModule):
+    bulk_option = 'bulk_port_breakout'
+
+    def get_response(self, command):
+        if command.get('fields'):
+            # Components without a breakout mode are also returned.
+            components = list(COMPONENTS.values()) + [{'name': 'CPU0'}]
+            if self.bulk == 'keyless':
+                components = [dict((key, value) for key, value in component.items() if key != 'name') for component in components]
+            return [200, {'openconfig-platform:components': {'component': components}}]
+        name = command['path'].rpartition('=')[2].replace('%2f', '/')
+        if name in COMPONENTS:
+            return [200, {'openconfig-platform:component': [COMPONENTS[name]]}]
+        return [{}, {}]
+
+
+class TestBreakoutModes(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_get_connection_option = patch(
+            'ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils.get_connection_option')
+        self.get_connection_option = self.mock_get_connection_option.start()
+
+    def tearDown(self):
+        self.mock_get_connection_option.stop()
+
+    def get_module(self, bulk):
+        module = PlatformModule(bulk)
+        self.get_connection_option.side_effect = module.get_connection_option
+        return module
+
+    def test_bulk_request(self):
+        module = self.get_module(True)
+        modes = get_breakout_modes(module, ['Eth1/1', 'Eth1/5', 'Eth1/9'])
+        self.assertEqual(modes, {'Eth1/1': '4x10G', 'Eth1/5': '2x100G', 'Eth1/9': None})
+        self.assertEqual(len(module.requests_sent), 1)
+        self.assertEqual(module.requests_sent[0]['path'], 'data/openconfig-platform:components')
+        self.assertEqual(module.requests_sent[0]['fields'], 'component(name;port/openconfig-platform-port:breakout-mode)')
+
+    def test_requests_per_port(self):
+        for bulk in (None, 'unsupported', 'keyless'):
+            module = self.get_module(bulk)
+            modes = get_breakout_modes(module, ['Eth1/1', 'Eth1/9'])
+            self.assertEqual(modes, {'Eth1/1': '4x10G', 'Eth1/9': None})
+            paths = [request['path'] for request in module.requests_sent if not request.get('fields')]
+            self.assertEqual(paths, ['data/openconfig-platform:components/component=Eth1%2f1',
+                                     'data/openconfig-platform:components/component=Eth1%2f9'])
+
+    def test_modes_reused(self):
+        module = self.get_module(None)
+        get_breakout_modes(module, ['Eth1/1', 'Eth1/5'])
+        self.assertEqual(get_breakout_modes(module, ['Eth1/5'], refresh=False), {'Eth1/5': '2x100G'})
+        self.assertEqual(len(module.requests_sent), 2)
+
+        # The modes are fetched again for a port which is not known.
+        self.assertEqual(get_breakout_modes(module, ['Eth1/9'], refresh=False), {'Eth1/9': None})
+        self.assertEqual(len(module.requests_sent), 3)
+
+        self.assertEqual(get_breakout_mode(module, 'Eth1/1'), '4x10G')
+        self.assertEqual(len(module.requests_sent), 4)
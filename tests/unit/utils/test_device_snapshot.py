@@ -0,0 +1,68 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import unittest
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import edit_config
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.snapshot import device_snapshot
+
+INTF_REQUEST = {'path': 'data/openconfig-interfaces:interfaces', 'method': 'get', 'content': 'config'}
+VRF_REQUEST = {'path': 'data/sonic-vrf:sonic-vrf/VRF/VRF_LIST', 'method': 'get'}
+
+
+class FakeConnection(object):
+
+    def __init__(self):
+        self.requests_sent = []
+
+    def edit_config(self, commands, suppr_ntf_excp=True):
+        self.requests_sent.extend(commands)
+        return [[200, {'path': command['path'], 'value': []}] for command in commands]
+
+
+class FakeModule(object):
+
+    def __init__(self):
+        self._socket_path = None
+        self._sonic_connection = FakeConnection()
+
+
+class TestDeviceSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.module = FakeModule()
+        self.connection = self.module._sonic_connection
+
+    def test_01_get_requests_sent_once(self):
+        with device_snapshot(self.module):
+            first = edit_config(self.module, [dict(INTF_REQUEST)])
+            first[0][1]['value'].append('changed by caller')
+            responses = edit_config(self.module, [dict(VRF_REQUEST), dict(INTF_REQUEST)])
+            with device_snapshot(self.module):
+                edit_config(self.module, [dict(VRF_REQUEST)])
+
+        self.assertEqual(self.connection.requests_sent, [INTF_REQUEST, VRF_REQUEST])
+        self.assertEqual(responses[1], [200, {'path': INTF_REQUEST['path'], 'value': []}])
+
+    def test_02_different_query_parameters(self):
+        with device_snapshot(self.module):
+            edit_config(self.module, [dict(INTF_REQUEST)])
+            edit_config(self.module, [dict(INTF_REQUEST, depth=3)])
+
+        self.assertEqual(len(self.connection.requests_sent), 2)
+
+    def test_03_write_request_clears_snapshot(self):
+        with device_snapshot(self.module):
+            edit_config(self.module, [dict(VRF_REQUEST)])
+            edit_config(self.module, [{'path': 'data/sonic-vrf:sonic-vrf/VRF/VRF_LIST', 'method': 'patch', 'data': {}}])
+            edit_config(self.module, [dict(VRF_REQUEST)])
+
+        self.assertEqual([request['method'] for request in self.connection.requests_sent], ['get', 'patch', 'get'])
+
+    def test_04_no_snapshot_outside_of_context(self):
+        with device_snapshot(self.module):
+            edit_config(self.module, [dict(VRF_REQUEST)])
+        edit_config(self.module, [dict(VRF_REQUEST)])
+
+        self.assertEqual(len(self.connection.requests_sent), 2)
@@ -0,0 +1,118 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import time
+import unittest
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.bgp_utils import BgpAsnNN
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
+    ListItemIndex,
+    ListKeyIndex,
+    get_diff,
+    get_replaced_config
+)
+
+
+def get_vlans(count, description='vlan'):
+    return [{'vlan_id': vlan_id, 'description': '%s%d' % (description, vlan_id)} for vlan_id in range(1, count + 1)]
+
+
+class TestListItemIndex(unittest.TestCase):
+
+    def test_first_match(self):
+        items = [{'name': 'a', 'id': 1}, {'name': 'b'}, {'id': 2}, {'name': 'b', 'id': 2}, 'text', 1]
+        index = ListItemIndex(items, ['name', 'id'], [], False)
+        self.assertEqual(index.find({'name': 'b', 'id': 2}), 1)
+        self.assertEqual(index.find({'id': 2}), 2)
+        self.assertEqual(index.find({'name': 'a', 'id': 2}), 2)
+        self.assertEqual(index.find({'name': 'c', 'id': 1}), None)
+        # At least one test key must be present in both items.
+        self.assertEqual(index.find({'other': 1}), None)
+        self.assertEqual(index.find('text'), 4)
+        self.assertEqual(index.find(True), 5)
+        self.assertEqual(index.find([1]), None)
+
+    def test_without_test_keys(self):
+        items = [{'name': 'a', 'mtu': 9100}, {'name': 'b'}]
+        index = ListItemIndex(items, None, [], False)
+        self.assertEqual(index.find({'name': 'b'}), 1)
+        self.assertEqual(index.find({'name': 'a', 'mtu': 1500}), None)
+
+    def test_unhashable_items(self):
+        # Items which define their own equality are compared
+        items = ['10:20', BgpAsnNN('0.30:40'), [1]]
+        index = ListItemIndex(items, None, [], False)
+        self.assertEqual(index.find('30:40'), 1)
+        self.assertEqual(index.find('10:20'), 0)
+        self.assertEqual(index.find([1]), 2)
+        index = ListItemIndex([{'asn': BgpAsnNN('0.30:40')}], ['asn'], [], False)
+        self.assertEqual(index.find({'asn': '30:40'}), 0)
+
+
+class TestListKeyIndex(unittest.TestCase):
+
+    def test_candidates(self):
+        items = [{'name': 'a', 'id': 1}, {'name': 'b', 'id': 2}, {'name': 'b', 'id': 2, 'mtu': 9100}, {'name': 'c'}]
+        index = ListKeyIndex(items, ['name', 'id'])
+        self.assertEqual(list(index.find_candidates({'name': 'b', 'id': 2})), [1, 2])
+        self.assertEqual(list(index.find_candidates({'name': 'c', 'id': None})), [])
+        self.assertEqual(list(index.find_candidates({'name': 'a'})), [])
+
+    def test_candidates_before_other_item(self):
+        # A scan of the list stops at the first item which is not a dict
+        items = [{'name': 'a'}, 'text', {'name': 'b'}]
+        index = ListKeyIndex(items, ['name'])
+        self.assertEqual(list(index.find_candidates({'name': 'a'})), [0, 1])
+        self.assertEqual(list(index.find_candidates({'name': 'b'})), [1])
+        self.assertEqual(list(index.find_candidates('text')), [0])
+
+    def test_unhashable_values(self):
+        items = [{'index': {'interface': 'Eth1/1'}}, {'index': {'interface': 'Eth1/2'}}]
+        index = ListKeyIndex(items, ['index'])
+        self.assertEqual(list(index.find_candidates({'index': {'interface': 'Eth1/2'}})), [0, 1])
+
+
+class TestDiffScaling(unittest.TestCase):
+
+    def get_diff_time(self, count):
+        want = get_vlans(count, 'new')
+        have = list(reversed(get_vlans(count)))
+        best = None
+        for attempt in range(5):
+            start = time.time()
+            diff = get_diff(want, have, [{'config': {'vlan_id'}}])
+            duration = time.time() - start
+            best = duration if best is None else min(best, duration)
+        self.assertEqual(diff, want)
+        return best
+
+    def test_linear(self):
+        # The list items are matched with an index, a list 8 times longer
+        # takes about 8 times longer to compare, not 64 times.
+        small = self.get_diff_time(1000)
+        large = self.get_diff_time(8000)
+        self.assertLess(large, max(small, 0.005) * 32)
+
+    def get_replaced_config_time(self, count):
+        new_config = get_vlans(count)
+        exist_config = list(reversed(get_vlans(count)))
+        # Every 10th VLAN has another description and MTU
+        for vlan in exist_config[::10]:
+            vlan['description'] = 'old'
+            vlan['mtu'] = 1500
+        best = None
+        for attempt in range(5):
+            start = time.time()
+            replaced = get_replaced_config(new_config, exist_config, [{'config': {'vlan_id': ''}}])
+            duration = time.time() - start
+            best = duration if best is None else min(best, duration)
+        self.assertEqual(sorted(vlan['vlan_id'] for vlan in replaced), sorted(vlan['vlan_id'] for vlan in exist_config[::10]))
+        return best
+
+    def test_replaced_config_5k(self):
+        # A list of 5000 entries is compared with an index, in about 8 times
+        # the time of a list of 625 entries.
+        small = self.get_replaced_config_time(625)
+        large = self.get_replaced_config_time(5000)
+        self.assertLess(large, max(small, 0.005) * 32)
@@ -0,0 +1,43 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import subprocess
+import sys
+import unittest
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.facts.facts import FactsArgs
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.facts import FACT_RESOURCE_SUBSETS
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vlans.vlans import VlansFacts
+
+FACTS_PACKAGE = 'ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts'
+
+# Run in a new interpreter, the facts classes are already imported by the
+# other tests.
+LAZY_IMPORT_SCRIPT = '''
+import sys
+from %(package)s.facts import FACT_RESOURCE_SUBSETS
+loaded_before = sorted(name for name in sys.modules if name.startswith('%(package)s.') and name.count('.') > 8)
+FACT_RESOURCE_SUBSETS['vlans']
+loaded_after = sorted(name for name in sys.modules if name.startswith('%(package)s.') and name.count('.') > 8)
+print(loaded_before)
+print(loaded_after)
+''' % {'package': FACTS_PACKAGE}
+
+
+class TestFactsRegistry(unittest.TestCase):
+
+    def test_01_all_resources_registered(self):
+        choices = set(FactsArgs.argument_spec['gather_network_resources']['choices'])
+        choices.discard('all')
+        self.assertEqual(set(name for name in choices if not name.startswith('!')), set(FACT_RESOURCE_SUBSETS))
+        self.assertIs(FACT_RESOURCE_SUBSETS['vlans'], VlansFacts)
+        self.assertIs(FACT_RESOURCE_SUBSETS.get('vlans'), VlansFacts)
+        self.assertIsNone(FACT_RESOURCE_SUBSETS.get('unknown'))
+
+    def test_02_facts_classes_imported_on_lookup(self):
+        output = subprocess.check_output([sys.executable, '-c', LAZY_IMPORT_SCRIPT], universal_newlines=True)
+        loaded_before, loaded_after = output.strip().splitlines()
+
+        self.assertEqual(loaded_before, '[]')
+        self.assertEqual(loaded_after, "['%s.vlans.vlans']" % FACTS_PACKAGE)
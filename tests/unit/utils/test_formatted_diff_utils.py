@@ -0,0 +1,156 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import json
+import unittest
+
+from ansible_collections.dellemc.enterprise_sonic.tests.unit.compat.mock import (
+    patch,
+)
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils import formatted_diff_utils
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
+    __DELETE_CONFIG_IF_NO_SUBCONFIG,
+    get_config_changes,
+    get_formatted_config_diff,
+    get_new_config
+)
+
+EXIST_CONF = [
+    {'name': 'acl1', 'remark': 'first', 'rules': [{'sequence_num': 1, 'action': 'permit', 'source': {'any': True}}]},
+    {'name': 'acl2', 'rules': [{'sequence_num': 1, 'action': 'deny'}, {'sequence_num': 2, 'action': 'permit'}]},
+    {'name': 'acl3', 'remark': 'third'}
+]
+
+TEST_KEYS = [
+    {'config': {'name': ''}},
+    {'rules': {'sequence_num': ''}}
+]
+
+DELETE_TEST_KEYS = [
+    {'config': {'name': ''}},
+    {'rules': {'sequence_num': '', '__delete_op': __DELETE_CONFIG_IF_NO_SUBCONFIG}}
+]
+
+
+def derive_disable_delete_op(key_set, command, exist_conf):
+    # Modifies the command and the nested nodes of the configuration
+    command['name'] = exist_conf['name']
+    for rule in exist_conf.get('rules', []):
+        rule['action'] = 'disabled'
+    return True, exist_conf
+
+
+class TestGetNewConfig(unittest.TestCase):
+
+    def get_new_config(self, commands, exist_conf, test_keys):
+        commands_json = json.dumps(commands)
+        exist_conf_json = json.dumps(exist_conf)
+        new_conf = get_new_config(commands, exist_conf, test_keys)
+
+        # The commands and the existing configuration are not modified, and
+        # the new configuration shares no node with them.
+        self.assertEqual(json.dumps(commands), commands_json)
+        self.assertEqual(json.dumps(exist_conf), exist_conf_json)
+        for conf in (new_conf, exist_conf):
+            for acl in conf:
+                acl['remark'] = 'changed'
+                for rule in acl.get('rules', []):
+                    rule['action'] = 'changed'
+        self.assertEqual(json.dumps(commands), commands_json)
+        return new_conf
+
+    def test_merged(self):
+        commands = [
+            {'name': 'acl2', 'remark': 'second', 'rules': [{'sequence_num': 2, 'action': 'deny'}, {'sequence_num': 3, 'action': 'permit'}],
+             'state': 'merged'},
+            {'name': 'acl4', 'state': 'merged'}
+        ]
+        with patch.object(formatted_diff_utils, 'deepcopy', wraps=formatted_diff_utils.deepcopy) as deepcopy:
+            new_conf = get_new_config(commands, EXIST_CONF, TEST_KEYS)
+        # Only the derived configuration is copied.
+        self.assertEqual(deepcopy.call_count, 1)
+
+        # The merged items are moved to the end of the lists.
+        self.assertEqual(new_conf, [
+            {'name': 'acl1', 'remark': 'first', 'rules': [{'sequence_num': 1, 'action': 'permit', 'source': {'any': True}}]},
+            {'name': 'acl3', 'remark': 'third'},
+            {'name': 'acl2', 'remark': 'second', 'rules': [
+                {'sequence_num': 1, 'action': 'deny'}, {'sequence_num': 2, 'action': 'deny'}, {'sequence_num': 3, 'action': 'permit'}
+            ]},
+            {'name': 'acl4'}
+        ])
+        self.get_new_config(commands, json.loads(json.dumps(EXIST_CONF)), TEST_KEYS)
+
+    def test_deleted(self):
+        commands = [
+            {'name': 'acl1', 'remark': 'first', 'state': 'deleted'},
+            {'name': 'acl2', 'rules': [{'sequence_num': 1}], 'state': 'deleted'},
+            {'name': 'acl3', 'state': 'deleted'}
+        ]
+        new_conf = self.get_new_config(commands, json.loads(json.dumps(EXIST_CONF)), DELETE_TEST_KEYS)
+        self.assertEqual([acl['name'] for acl in new_conf], ['acl1', 'acl2'])
+        self.assertEqual([rule['sequence_num'] for rule in new_conf[1]['rules']], [2])
+
+    def test_custom_operation(self):
+        commands = [{'name': 'acl2', 'rules': [{'sequence_num': 1}], 'state': 'deleted'}]
+        test_keys = [{'config': {'name': '', '__delete_op': derive_disable_delete_op}}]
+        exist_conf = json.loads(json.dumps(EXIST_CONF))
+        new_conf = get_new_config(commands, exist_conf, test_keys)
+        self.assertEqual(new_conf[2], {'name': 'acl2', 'rules': [{'sequence_num': 1, 'action': 'disabled'}, {'sequence_num': 2, 'action': 'disabled'}]})
+        self.assertEqual(exist_conf, EXIST_CONF)
+        self.assertEqual(commands, [{'name': 'acl2', 'rules': [{'sequence_num': 1}], 'state': 'deleted'}])
+
+
+class FakeModule(object):
+    _name = 'dellemc.enterprise_sonic.sonic_l2_acls'
+
+    def __init__(self, structured_diff):
+        self.structured_diff = structured_diff
+
+    def get_connection_option(self, module, option):
+        return self.structured_diff
+
+
+class TestStructuredConfigDiff(unittest.TestCase):
+
+    def test_changes(self):
+        new_conf = [
+            {'name': 'acl3', 'remark': 'third', 'rules': [{'sequence_num': 1, 'action': 'deny'}]},
+            {'name': 'acl2', 'remark': None, 'rules': [{'sequence_num': 2, 'action': 'deny'}, {'sequence_num': 1, 'action': 'deny'}]},
+            {'name': 'acl1', 'remark': 'changed', 'rules': [{'sequence_num': 1, 'action': 'permit', 'source': {'any': True}}]}
+        ]
+        # The order of the list items is ignored and None is a missing value.
+        self.assertEqual(get_config_changes(EXIST_CONF, new_conf, TEST_KEYS), [
+            {'path': 'config[name=acl1].remark', 'change': 'changed', 'old': 'first', 'new': 'changed'},
+            {'path': 'config[name=acl2].rules[sequence_num=2].action', 'change': 'changed', 'old': 'permit', 'new': 'deny'},
+            {'path': 'config[name=acl3].rules', 'change': 'added', 'new': [{'sequence_num': 1, 'action': 'deny'}]}
+        ])
+
+    def test_list_items(self):
+        exist_conf = {'members': ['Eth1/1', 'Eth1/2'], 'vlans': [{'id': 1}, {'id': 2}], 'ranges': [{'low': 1}, {'low': 5}]}
+        new_conf = {'members': ['Eth1/2', 'Eth1/3'], 'vlans': [{'id': 2}, {'id': 3}], 'ranges': [{'low': 5}, {'low': 1, 'high': 2}]}
+        self.assertEqual(get_config_changes(exist_conf, new_conf, [{'vlans': {'id': ''}}]), [
+            {'path': 'config.members[]', 'change': 'removed', 'old': 'Eth1/1'},
+            {'path': 'config.members[]', 'change': 'added', 'new': 'Eth1/3'},
+            {'path': 'config.vlans[id=1]', 'change': 'removed', 'old': {'id': 1}},
+            {'path': 'config.vlans[id=3]', 'change': 'added', 'new': {'id': 3}},
+            # Without test keys, the items are matched by their value.
+            {'path': 'config.ranges[]', 'change': 'removed', 'old': {'low': 1}},
+            {'path': 'config.ranges[]', 'change': 'added', 'new': {'low': 1, 'high': 2}}
+        ])
+
+    def test_selected_module(self):
+        new_conf = [EXIST_CONF[0], EXIST_CONF[1]]
+        for structured_diff, expected in ((None, False), (['vlans'], False), (['l2_acls'], True), (['sonic_l2_acls'], True), (['all'], True)):
+            module = FakeModule(structured_diff)
+            with patch.object(formatted_diff_utils, 'get_connection_option', module.get_connection_option):
+                diff = get_formatted_config_diff(EXIST_CONF, new_conf, 0, module=module, test_keys=TEST_KEYS)
+            if expected:
+                self.assertEqual(diff, {'prepared': '- config[name=acl3]: {"name": "acl3", "remark": "third"}\n'})
+            else:
+                self.assertTrue(diff['prepared'].startswith('*** before'))
+
+        with patch.object(formatted_diff_utils, 'get_connection_option', module.get_connection_option):
+            diff = get_formatted_config_diff(EXIST_CONF, new_conf, 3, module=module, test_keys=TEST_KEYS)
+        self.assertEqual(diff['changes'], [{'path': 'config[name=acl3]', 'change': 'removed', 'old': {'name': 'acl3', 'remark': 'third'}}])
@@ -0,0 +1,121 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import unittest
+
+from ansible_collections.dellemc.enterprise_sonic.tests.unit.compat.mock import (
+    patch,
+)
+from ansible_collections.dellemc.enterprise_sonic.tests.unit.utils.fake_module import FakeModule
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.bgp_utils import (
+    get_all_bgp_neighbors,
+    get_network_instance_responses
+)
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
+    get_subtree_response
+)
+
+NETWORK_INSTANCES = {
+    'openconfig-network-instance:network-instances': {
+        'network-instance': [
+            {
+                'name': 'default',
+                'protocols': {'protocol': [
+                    {'identifier': 'openconfig-policy-types:OSPF', 'name': 'ospfv2', 'ospfv2': {'global': {}}},
+                    {
+                        'identifier': 'openconfig-policy-types:BGP',
+                        'name': 'bgp',
+                        'bgp': {
+                            'global': {'config': {'as': 65000}},
+                            'neighbors': {'neighbor': [{'neighbor-address': '10.1.1.1'}]}
+                        }
+                    }
+                ]},
+                'openconfig-mac-dampening:mac-dampening': {'config': {'interval': 10}}
+            },
+            {
+                'name': 'Vrf1',
+                # The keys of the list entries are not returned.
+                'protocols': {'protocol': [{'bgp': {'global': {'config': {'as': 65001}}}}]}
+            },
+            {'name': 'Vrf2'}
+        ]
+    }
+}
+
+BGP_PATH = 'protocols/protocol=BGP,bgp/bgp'
+
+
+class NetworkInstancesModule(FakeModule):
+    bulk_option = 'bulk_network_instances'
+
+    def get_response(self, command):
+        if command.get('fields'):
+            return [200, NETWORK_INSTANCES]
+        if command['path'].endswith('Vrf1/%s/global/config' % BGP_PATH):
+            return [200, {'openconfig-network-instance:config': {'as': 65001}}]
+        if command['path'].endswith('Vrf1/%s/global' % BGP_PATH):
+            return [200, {'openconfig-network-instance:global': {'config': {'as': 65001}}}]
+        return [{}, {}]
+
+
+class TestNetworkInstanceResponses(unittest.TestCase):
+
+    def get_responses(self, module, vrfs, subpaths):
+        with patch('ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.bgp_utils.get_connection_option',
+                   module.get_connection_option):
+            return get_network_instance_responses(module, vrfs, subpaths)
+
+    def test_bulk_request(self):
+        module = NetworkInstancesModule(True)
+        subpaths = ['%s/global' % BGP_PATH, '%s/neighbors' % BGP_PATH, 'openconfig-mac-dampening:mac-dampening/config']
+        responses = self.get_responses(module, ['default', 'Vrf1', 'Vrf2', 'Vrf3'], subpaths)
+
+        self.assertEqual(module.requests_sent[0]['path'], '/data/openconfig-network-instance:network-instances')
+        self.assertEqual(module.requests_sent[0]['fields'], 'network-instance(name;protocols/protocol/bgp/global;'
+                                                            'protocols/protocol/bgp/neighbors;openconfig-mac-dampening:mac-dampening/config)')
+        # The keys of the protocols of Vrf1 are not returned, its BGP subtrees
+        # are requested separately instead of being taken from another protocol.
+        self.assertEqual([request['path'] for request in module.requests_sent[1:]], [
+            '/data/openconfig-network-instance:network-instances/network-instance=Vrf1/%s/global' % BGP_PATH,
+            '/data/openconfig-network-instance:network-instances/network-instance=Vrf1/%s/neighbors' % BGP_PATH
+        ])
+        self.assertEqual(responses[0], [
+            [200, {'openconfig-network-instance:global': {'config': {'as': 65000}}}],
+            [200, {'openconfig-network-instance:neighbors': {'neighbor': [{'neighbor-address': '10.1.1.1'}]}}],
+            [200, {'openconfig-mac-dampening:config': {'interval': 10}}]
+        ])
+        self.assertEqual(responses[1], [[200, {'openconfig-network-instance:global': {'config': {'as': 65001}}}], [{}, {}], [{}, {}]])
+        self.assertEqual(responses[2], [[{}, {}]] * 3)
+        self.assertEqual(responses[3], [[{}, {}]] * 3)
+
+    def test_subtree_response(self):
+        instance = {'protocols': {'protocol': [{'identifier': 'OSPF', 'name': 'ospfv2', 'bgp': {'global': {}}}]}}
+        self.assertEqual(get_subtree_response(instance, '%s/global' % BGP_PATH, 'openconfig-network-instance'), [{}, {}])
+        instance = {'protocols': {'protocol': [{'name': 'ospfv2', 'bgp': {'global': {}}}]}}
+        self.assertIsNone(get_subtree_response(instance, '%s/global' % BGP_PATH, 'openconfig-network-instance'))
+
+    def test_requests_per_vrf(self):
+        for bulk in (None, 'unsupported'):
+            module = NetworkInstancesModule(bulk)
+            responses = self.get_responses(module, ['default', 'Vrf1'], ['%s/global' % BGP_PATH, 'table-connections'])
+            paths = [request['path'] for request in module.requests_sent if not request.get('fields')]
+            self.assertEqual(paths, [
+                '/data/openconfig-network-instance:network-instances/network-instance=default/%s/global' % BGP_PATH,
+                '/data/openconfig-network-instance:network-instances/network-instance=default/table-connections',
+                '/data/openconfig-network-instance:network-instances/network-instance=Vrf1/%s/global' % BGP_PATH,
+                '/data/openconfig-network-instance:network-instances/network-instance=Vrf1/table-connections'
+            ])
+            self.assertEqual(len(responses), 2)
+            self.assertEqual(len(responses[1]), 2)
+
+    def test_bgp_neighbors(self):
+        module = NetworkInstancesModule(None)
+        with patch('ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.bgp_utils.get_all_vrfs',
+                   return_value=['default', 'Vrf1', 'Vrf2']):
+            self.assertEqual(get_all_bgp_neighbors(module), [{'bgp_as': 65001, 'vrf_name': 'Vrf1'}])
+
+        # The neighbors are requested only for the VRF in which BGP is configured.
+        self.assertEqual(len(module.requests_sent), 4)
+        self.assertTrue(module.requests_sent[3]['path'].endswith('Vrf1/%s/neighbors' % BGP_PATH))
@@ -0,0 +1,121 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import os
+import unittest
+
+import yaml
+
+from ansible_collections.dellemc.enterprise_sonic.tests.unit.compat.mock import (
+    patch,
+)
+from ansible_collections.dellemc.enterprise_sonic.tests.unit.utils.fake_module import FakeModule
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.qos_buffer.qos_buffer import Qos_bufferFacts
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.qos_interfaces.qos_interfaces import Qos_interfacesFacts
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.qos_maps.qos_maps import Qos_mapsFacts
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.qos_pfc.qos_pfc import Qos_pfcFacts
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.qos_scheduler.qos_scheduler import Qos_schedulerFacts
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.qos_wred.qos_wred import Qos_wredFacts
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.qos_utils import QOS_PATH
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.snapshot import device_snapshot
+
+FIXTURES_PATH = os.path.join(os.path.dirname(__file__), '..', 'modules', 'network', 'sonic', 'fixtures')
+
+QOS_FACTS = (
+    ('qos_maps', Qos_mapsFacts),
+    ('qos_interfaces', Qos_interfacesFacts),
+    ('qos_scheduler', Qos_schedulerFacts),
+    ('qos_wred', Qos_wredFacts),
+    ('qos_pfc', Qos_pfcFacts),
+    ('qos_buffer', Qos_bufferFacts)
+)
+
+
+def load_device_config():
+    """Return the GET responses of the existing configuration of the
+    'deleted_01' test case of each QoS module, by path, and the openconfig-qos
+    tree which contains them
+    """
+    responses = {}
+    qos = {}
+    for name, facts_class in QOS_FACTS:
+        with open(os.path.join(FIXTURES_PATH, 'sonic_%s.yaml' % name)) as fixture_file:
+            fixture = yaml.safe_load(fixture_file)
+        for entry in fixture['deleted_01']['existing_%s_config' % name]:
+            value = entry['response'].get('value')
+            if not value:
+                continue
+            responses[entry['path']] = [entry['response']['code'], value]
+            if entry['path'].startswith(QOS_PATH + '/'):
+                node = qos
+                for segment in entry['path'][len(QOS_PATH) + 1:].split('/')[:-1]:
+                    node = node.setdefault(segment, {})
+                for key, subtree in value.items():
+                    node[key.replace('openconfig-qos:', '', 1)] = subtree
+    return responses, qos
+
+
+class QosModule(FakeModule):
+    bulk_option = 'bulk_qos'
+
+    def __init__(self, bulk=None):
+        super(QosModule, self).__init__(bulk)
+        self.responses, self.qos = load_device_config()
+
+    def is_bulk_request(self, command):
+        return command['path'] == QOS_PATH
+
+    def get_response(self, command):
+        if command['path'] == QOS_PATH:
+            return [200, {'openconfig-qos:qos': self.qos}]
+        return self.responses.get(command['path'], [{}, {}])
+
+
+class TestQosUtils(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_get_connection_option = patch(
+            'ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.qos_utils.get_connection_option')
+        self.get_connection_option = self.mock_get_connection_option.start()
+
+    def tearDown(self):
+        self.mock_get_connection_option.stop()
+
+    def gather_facts(self, bulk, single_gathering):
+        """Return the facts of all the QoS modules and the number of requests
+        sent to the device
+        """
+        module = QosModule(bulk)
+        self.get_connection_option.side_effect = module.get_connection_option
+        resources = {}
+        if single_gathering:
+            with device_snapshot(module):
+                for name, facts_class in QOS_FACTS:
+                    resources.update(self.get_resources(module, facts_class))
+        else:
+            # Like the module runs, each facts class has its own snapshot.
+            for name, facts_class in QOS_FACTS:
+                with device_snapshot(module):
+                    resources.update(self.get_resources(module, facts_class))
+        return resources, len(module.requests_sent)
+
+    def get_resources(self, module, facts_class):
+        ansible_facts = facts_class(module).populate_facts(None, {'ansible_network_resources': {}})
+        return ansible_facts['ansible_network_resources']
+
+    def test_same_facts(self):
+        facts, request_count = self.gather_facts(None, False)
+        self.assertEqual(sorted(facts), sorted(name for name, facts_class in QOS_FACTS))
+        self.assertEqual(self.gather_facts(True, False)[0], facts)
+        self.assertEqual(self.gather_facts(True, True)[0], facts)
+
+    def test_request_count(self):
+        # qos_maps: 8 maps, qos_interfaces: interfaces and queues,
+        # qos_buffer: the buffer and the lossless buffer mode of the switch.
+        self.assertEqual(self.gather_facts(None, False)[1], 15)
+        self.assertEqual(self.gather_facts(None, True)[1], 15)
+        # One QoS request for each module.
+        self.assertEqual(self.gather_facts(True, False)[1], 7)
+        # One QoS request for the gathering of the facts of all the modules.
+        self.assertEqual(self.gather_facts(True, True)[1], 2)
@@ -0,0 +1,78 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import unittest
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.request_batcher import (
+    CollectorFailure,
+    get_request_batcher,
+    run_concurrently,
+)
+
+
+class FakeModule(object):
+
+    def __init__(self):
+        self.warnings = []
+
+    def warn(self, warning):
+        self.warnings.append(warning)
+
+    def fail_json(self, msg, **kwargs):
+        raise AssertionError('fail_json called outside of the tasks: %s' % msg)
+
+
+class TestRequestBatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.module = FakeModule()
+        self.batches = []
+
+    def send(self, commands, suppr_ntf_excp=True):
+        self.batches.append([command['path'] for command in commands])
+        for command in commands:
+            if command['path'] == 'data/fail':
+                raise ValueError('request failed')
+        return [[200, {'path': command['path']}] for command in commands]
+
+    def get_task(self, paths, warning=None):
+        def task():
+            if warning:
+                self.module.warn(warning)
+            batcher = get_request_batcher(self.module)
+            responses = batcher.submit([{'path': path, 'method': 'get'} for path in paths])
+            return [response[1]['path'] for response in responses]
+        return task
+
+    def test_01_requests_of_concurrent_tasks_in_one_batch(self):
+        tasks = [
+            self.get_task(['data/a', 'data/b'], 'first'),
+            self.get_task(['data/b'], 'second'),
+            self.get_task(['data/c'], 'third')
+        ]
+
+        results = run_concurrently(self.module, tasks, 3, self.send)
+
+        self.assertEqual(results, [(['data/a', 'data/b'], None), (['data/b'], None), (['data/c'], None)])
+        self.assertEqual(sorted(path for batch in self.batches for path in batch), ['data/a', 'data/b', 'data/c'])
+        self.assertEqual(self.module.warnings, ['first', 'second', 'third'])
+        self.assertIsNone(get_request_batcher(self.module))
+
+    def test_02_failed_request_raised_to_its_task_only(self):
+        tasks = [self.get_task(['data/a']), self.get_task(['data/fail']), self.get_task(['data/c'])]
+
+        results = run_concurrently(self.module, tasks, 3, self.send)
+
+        self.assertEqual(results[0], (['data/a'], None))
+        self.assertIsInstance(results[1][1], ValueError)
+        self.assertEqual(results[2], (['data/c'], None))
+
+    def test_03_fail_json_captured(self):
+        def task():
+            self.module.fail_json(msg='collector failed', code=404)
+
+        results = run_concurrently(self.module, [task], 2, self.send)
+
+        self.assertIsInstance(results[0][1], CollectorFailure)
+        self.assertEqual(results[0][1].fail_kwargs, {'msg': 'collector failed', 'code': 404})
@@ -0,0 +1,133 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import unittest
+from copy import deepcopy
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.request_optimizer import (
+    optimize_requests,
+)
+
+INTF_PATH = 'data/openconfig-interfaces:interfaces'
+VLAN_LIST_PATH = 'data/sonic-vlan:sonic-vlan/VLAN/VLAN_LIST'
+
+
+def vlan_create_requests(vlan_id):
+    name = 'Vlan%d' % vlan_id
+    return [
+        {'path': INTF_PATH, 'method': 'PATCH',
+         'data': {'openconfig-interfaces:interfaces': {'interface': [{'name': name, 'config': {'name': name}}]}}},
+        {'path': '%s/interface=%s/config' % (INTF_PATH, name), 'method': 'PATCH',
+         'data': {'openconfig-interfaces:config': {'name': name, 'description': 'vlan %d' % vlan_id}}}
+    ]
+
+
+class TestRequestOptimizer(unittest.TestCase):
+
+    def test_01_coalesce_list_entries_and_descendants(self):
+        requests = vlan_create_requests(10) + vlan_create_requests(20)
+        requests_copy = deepcopy(requests)
+
+        optimized = optimize_requests(requests)
+
+        self.assertEqual(requests, requests_copy)
+        self.assertEqual(optimized, [{
+            'path': INTF_PATH, 'method': 'PATCH',
+            'data': {'openconfig-interfaces:interfaces': {'interface': [
+                {'name': 'Vlan10', 'config': {'name': 'Vlan10', 'description': 'vlan 10'}},
+                {'name': 'Vlan20', 'config': {'name': 'Vlan20', 'description': 'vlan 20'}}
+            ]}}
+        }])
+
+    def test_02_merge_same_list_entry(self):
+        path = 'data/openconfig-network-instance:network-instances/network-instance=default/protocols/protocol=STATIC,static/static-routes'
+
+        def next_hop_request(index):
+            return {'path': path, 'method': 'patch', 'data': {'openconfig-network-instance:static-routes': {'static': [
+                {'prefix': '10.0.0.0/24', 'config': {'prefix': '10.0.0.0/24'},
+                 'next-hops': {'next-hop': [{'index': index, 'config': {'index': index}}]}}
+            ]}}}
+
+        optimized = optimize_requests([next_hop_request('1.1.1.1'), next_hop_request('2.2.2.2')])
+
+        self.assertEqual(len(optimized), 1)
+        static = optimized[0]['data']['openconfig-network-instance:static-routes']['static']
+        self.assertEqual(len(static), 1)
+        self.assertEqual([next_hop['index'] for next_hop in static[0]['next-hops']['next-hop']], ['1.1.1.1', '2.2.2.2'])
+
+    def test_03_keep_order_across_other_requests(self):
+        requests = vlan_create_requests(10)
+        requests.insert(1, {'path': 'data/openconfig-network-instance:network-instances', 'method': 'patch',
+                            'data': {'openconfig-network-instance:network-instances': {}}})
+        requests.append({'path': '%s/interface=Vlan30/config' % INTF_PATH, 'method': 'patch',
+                         'data': {'openconfig-interfaces:config': {'mtu': 9000}}})
+
+        optimized = optimize_requests(requests)
+
+        self.assertEqual(optimized, requests)
+
+    def test_04_remove_shadowed_delete_requests(self):
+        requests = [
+            {'path': 'data/openconfig-acl:acl/acl-sets/acl-set=acl1,ACL_IPV4/acl-entries/acl-entry=1', 'method': 'delete'},
+            {'path': 'data/openconfig-acl:acl/acl-sets/acl-set=acl2,ACL_IPV4/acl-entries/acl-entry=1', 'method': 'delete'},
+            {'path': 'data/openconfig-acl:acl/acl-sets/acl-set=acl2,ACL_IPV4/acl-entries', 'method': 'patch',
+             'data': {'openconfig-acl:acl-entries': {'acl-entry': [{'sequence-id': 1, 'config': {'sequence-id': 1}}]}}},
+            {'path': 'data/openconfig-acl:acl/acl-sets/acl-set=acl1,ACL_IPV4', 'method': 'delete'},
+            {'path': 'data/openconfig-acl:acl/acl-sets/acl-set=acl2,ACL_IPV4', 'method': 'delete'},
+        ]
+
+        optimized = optimize_requests(requests)
+
+        self.assertEqual(optimized, requests[1:])
+
+    def test_06_match_list_entries_by_key_leaves(self):
+        # The description of Vlan10 is the key of Vlan20.
+        requests = [
+            {'path': VLAN_LIST_PATH, 'method': 'patch', 'data': {'sonic-vlan:VLAN_LIST': [{'name': 'Vlan10', 'description': 'Vlan20'}]}},
+            {'path': '%s=Vlan20/mtu' % VLAN_LIST_PATH, 'method': 'patch', 'data': {'sonic-vlan:mtu': 1500}}
+        ]
+        self.assertEqual(optimize_requests(requests), requests)
+
+        requests = [
+            {'path': VLAN_LIST_PATH, 'method': 'patch', 'data': {'sonic-vlan:VLAN_LIST': [{'name': 'Vlan10', 'description': 'Vlan20'}]}},
+            {'path': '%s=Vlan10/mtu' % VLAN_LIST_PATH, 'method': 'patch', 'data': {'sonic-vlan:mtu': 9000}},
+            {'path': VLAN_LIST_PATH, 'method': 'patch', 'data': {'sonic-vlan:VLAN_LIST': [
+                {'name': 'Vlan30', 'description': 'Vlan20'}, {'name': 'Vlan20', 'description': 'Vlan10'}
+            ]}},
+            {'path': '%s=Vlan20/mtu' % VLAN_LIST_PATH, 'method': 'patch', 'data': {'sonic-vlan:mtu': 1500}}
+        ]
+        self.assertEqual(optimize_requests(requests), [{'path': VLAN_LIST_PATH, 'method': 'patch', 'data': {'sonic-vlan:VLAN_LIST': [
+            {'name': 'Vlan10', 'description': 'Vlan20', 'mtu': 9000},
+            {'name': 'Vlan30', 'description': 'Vlan20'},
+            {'name': 'Vlan20', 'description': 'Vlan10', 'mtu': 1500}
+        ]}}])
+
+    def test_07_list_keys_not_known(self):
+        requests = [
+            # The entries do not have their key leaf.
+            {'path': VLAN_LIST_PATH, 'method': 'patch', 'data': {'sonic-vlan:VLAN_LIST': [{'description': 'vlan', 'mtu': 9100}]}},
+            {'path': VLAN_LIST_PATH, 'method': 'patch', 'data': {'sonic-vlan:VLAN_LIST': [{'description': 'vlan', 'mtu': 1500}]}},
+            # The key leaves of the list are not known.
+            {'path': 'data/sonic-test:sonic-test/TEST/TEST_LIST', 'method': 'patch', 'data': {'sonic-test:TEST_LIST': [{'name': 'a', 'id': 1}]}},
+            {'path': 'data/sonic-test:sonic-test/TEST/TEST_LIST', 'method': 'patch', 'data': {'sonic-test:TEST_LIST': [{'name': 'b', 'id': 1}]}},
+            {'path': 'data/sonic-test:sonic-test/TEST/TEST_LIST=a/id', 'method': 'patch', 'data': {'sonic-test:id': 2}}
+        ]
+        self.assertEqual(optimize_requests(requests), requests)
+
+    def test_08_identity_key_values(self):
+        path = 'data/openconfig-network-instance:network-instances/network-instance=default/protocols'
+        requests = [
+            {'path': path, 'method': 'patch', 'data': {'openconfig-network-instance:protocols': {'protocol': [
+                {'identifier': 'openconfig-policy-types:BGP', 'name': 'bgp', 'config': {'identifier': 'openconfig-policy-types:BGP', 'name': 'bgp'}}
+            ]}}},
+            {'path': '%s/protocol=BGP,bgp/bgp/global/config' % path, 'method': 'patch',
+             'data': {'openconfig-network-instance:config': {'as': 65000}}}
+        ]
+        optimized = optimize_requests(requests)
+        self.assertEqual(len(optimized), 1)
+        self.assertEqual(optimized[0]['data']['openconfig-network-instance:protocols']['protocol'][0]['bgp'], {'global': {'config': {'as': 65000}}})
+
+    def test_05_commands_are_not_changed(self):
+        commands = ['interface Eth1/1', 'description test']
+        self.assertEqual(optimize_requests(commands), commands)
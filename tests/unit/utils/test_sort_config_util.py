@@ -0,0 +1,66 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import json
+import unittest
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.sort_config_util import (
+    get_sort_plan,
+    sort_config
+)
+
+TEST_KEYS_sort_config = [
+    {'config': {'__test_keys': ('bgp_as', 'vrf_name')}},
+    {'redistribute': {'__test_keys': ('protocol',)}},
+    {'vnis': {'__test_keys': ('vni_number',), '__sort_op': lambda key_tuple, config: -config[key_tuple[0]]}},
+    {'redistribute': {'__test_keys': ('metric',)}}
+]
+
+CONFIG = [
+    {'vrf_name': 'Vrf2', 'bgp_as': 2},
+    {
+        'vrf_name': 'default',
+        'bgp_as': 1,
+        'redistribute': [{'protocol': 'static', 'metric': 1}, {'protocol': 'connected', 'metric': 2}],
+        'vnis': [{'vni_number': 1}, {'vni_number': 3}, {'vni_number': 2}],
+        'neighbors': [{'neighbor': 'Eth1/2'}, {'neighbor': 'Eth1/1'}],
+        'communities': ['b', 'a'],
+        'timers': {'keepalive': 30, 'holdtime': None},
+        'empty': {}
+    },
+    {'vrf_name': 'Vrf1', 'bgp_as': 2}
+]
+
+
+class TestSortConfig(unittest.TestCase):
+
+    def test_sort_config(self):
+        config = json.loads(json.dumps(CONFIG))
+        sorted_config = sort_config(config, TEST_KEYS_sort_config)
+        self.assertEqual(json.dumps(sorted_config), json.dumps([
+            {
+                'bgp_as': 1,
+                'communities': ['a', 'b'],
+                'empty': {},
+                # Lists without test keys keep their order.
+                'neighbors': [{'neighbor': 'Eth1/2'}, {'neighbor': 'Eth1/1'}],
+                # The first test keys of a list are used.
+                'redistribute': [{'metric': 2, 'protocol': 'connected'}, {'metric': 1, 'protocol': 'static'}],
+                'timers': {'holdtime': None, 'keepalive': 30},
+                'vnis': [{'vni_number': 3}, {'vni_number': 2}, {'vni_number': 1}],
+                'vrf_name': 'default'
+            },
+            {'bgp_as': 2, 'vrf_name': 'Vrf1'},
+            {'bgp_as': 2, 'vrf_name': 'Vrf2'}
+        ]))
+
+        # Only the lists of values are sorted in place.
+        config[1]['communities'].reverse()
+        self.assertEqual(config, CONFIG)
+
+    def test_sort_plan_compiled_once(self):
+        sort_plan = get_sort_plan(TEST_KEYS_sort_config)
+        self.assertEqual(sorted(sort_plan), ['config', 'redistribute', 'vnis'])
+        self.assertIs(get_sort_plan(TEST_KEYS_sort_config), sort_plan)
+        self.assertEqual(get_sort_plan(None), {})
@@ -0,0 +1,74 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import unittest
+
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils import timings
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.timings import (
+    ModuleTimings,
+    PHASES,
+)
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class TestModuleTimings(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.real_time = timings.time.time
+        timings.time.time = self.clock.time
+
+    def tearDown(self):
+        timings.time.time = self.real_time
+
+    def test_01_exclusive_phase_times(self):
+        module_timings = ModuleTimings()
+        with module_timings.phase('facts_render'):
+            self.clock.advance(1)
+            with module_timings.phase('facts_fetch'):
+                self.clock.advance(4)
+            self.clock.advance(2)
+        self.clock.advance(3)
+        with module_timings.phase('diff'):
+            self.clock.advance(0.5)
+        with module_timings.phase('commit'):
+            self.clock.advance(5)
+        with module_timings.phase('facts_render'):
+            with module_timings.phase('facts_fetch'):
+                self.clock.advance(6)
+
+        result = module_timings.get_result([{'method': 'get'}])
+
+        self.assertEqual(result['total'], 21.5)
+        self.assertEqual(result['phases'], {
+            'facts_fetch': 4.0,
+            'facts_render': 3.0,
+            'diff': 0.5,
+            'request_build': 3.0,
+            'commit': 5.0,
+            'post_facts': 6.0
+        })
+        self.assertEqual(set(result['phases']), set(PHASES))
+        self.assertEqual(result['requests'], [{'method': 'get'}])
+
+    def test_02_timed_without_active_timings(self):
+        @timings.timed('diff')
+        def get_value(value):
+            return value
+
+        self.assertIsNone(timings.get_active_timings())
+        self.assertEqual(get_value(5), 5)
+        with timings.timed_phase('diff'):
+            pass
@@ -0,0 +1,80 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+import unittest
+
+from ansible_collections.dellemc.enterprise_sonic.tests.unit.compat.mock import (
+    patch,
+)
+from ansible_collections.dellemc.enterprise_sonic.tests.unit.utils.fake_module import FakeModule
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vlan_mapping.vlan_mapping import (
+    Vlan_mappingFacts
+)
+
+MAPPED_VLANS = {
+    'Eth1/1': {'mapped-vlan': [{'vlan-id': 100, 'match': {'single-tagged': {'config': {'vlan-ids': [10]}}}}]},
+    'PortChannel1': {'mapped-vlan': [{'vlan-id': 200, 'match': {'single-tagged': {'config': {'vlan-ids': [20]}}}}]}
+}
+
+INTERFACES = [{'ifname': 'Eth1/1'}, {'ifname': 'Eth1/2'}, {'ifname': 'PortChannel1'}]
+
+
+class InterfacesModule(FakeModule):
+    bulk_option = 'bulk_vlan_mapping'
+
+    def get_response(self, command):
+        if command.get('fields'):
+            # Interfaces without vlan mappings are also returned.
+            interfaces = [{'name': 'Eth1/2'}]
+            for name, mapped_vlans in MAPPED_VLANS.items():
+                interface = {'openconfig-interfaces-ext:mapped-vlans': mapped_vlans}
+                if self.bulk != 'keyless':
+                    interface['name'] = name
+                interfaces.append(interface)
+            return [200, {'openconfig-interfaces:interfaces': {'interface': interfaces}}]
+        name = command['path'].split('=')[1].split('/')[0].replace('%2F', '/')
+        if name in MAPPED_VLANS:
+            return [200, {'openconfig-interfaces-ext:mapped-vlans': MAPPED_VLANS[name]}]
+        return [204, {}]
+
+
+class TestVlanMappings(unittest.TestCase):
+
+    def setUp(self):
+        self.mock_get_connection_option = patch(
+            'ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.vlan_mapping.vlan_mapping.get_connection_option')
+        self.get_connection_option = self.mock_get_connection_option.start()
+
+    def tearDown(self):
+        self.mock_get_connection_option.stop()
+
+    def get_module(self, bulk):
+        module = InterfacesModule(bulk)
+        self.get_connection_option.side_effect = module.get_connection_option
+        return module
+
+    def test_bulk_request(self):
+        module = self.get_module(True)
+        mappings = Vlan_mappingFacts(module).get_all_port_mappings(INTERFACES)
+        self.assertEqual(mappings, [MAPPED_VLANS['Eth1/1'], None, MAPPED_VLANS['PortChannel1']])
+        self.assertEqual(len(module.requests_sent), 1)
+        self.assertEqual(module.requests_sent[0]['path'], 'data/openconfig-interfaces:interfaces')
+        self.assertEqual(module.requests_sent[0]['fields'], 'interface(name;openconfig-interfaces-ext:mapped-vlans)')
+
+    def test_requests_per_interface(self):
+        # The bulk request is not enabled, is rejected by the device or its
+        # response does not name the interfaces of the mappings.
+        for bulk in (None, 'unsupported', 'keyless'):
+            module = self.get_module(bulk)
+            mappings = Vlan_mappingFacts(module).get_all_port_mappings(INTERFACES)
+            self.assertEqual(mappings, [MAPPED_VLANS['Eth1/1'], None, MAPPED_VLANS['PortChannel1']])
+            paths = [request['path'] for request in module.requests_sent if not request.get('fields')]
+            self.assertEqual(paths, ['data/openconfig-interfaces:interfaces/interface=Eth1%2F1/openconfig-interfaces-ext:mapped-vlans',
+                                     'data/openconfig-interfaces:interfaces/interface=Eth1%2F2/openconfig-interfaces-ext:mapped-vlans',
+                                     'data/openconfig-interfaces:interfaces/interface=PortChannel1/openconfig-interfaces-ext:mapped-vlans'])
+
+    def test_no_interfaces(self):
+        module = self.get_module(True)
+        self.assertEqual(Vlan_mappingFacts(module).get_all_port_mappings([]), [])
+        self.assertEqual(module.requests_sent, [])